@@ -12,5 +12,6 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', '_core.settings')
+os.environ.setdefault('DJANGO_ROOT_URLCONF', '_core.asgi_urls')
 
 application = get_asgi_application()
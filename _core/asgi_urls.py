@@ -0,0 +1,21 @@
+from django.urls import path, include
+from accounts.async_views import login, signup
+from contents.async_views import AsyncContentDetail
+from courses.async_views import AsyncCourseDetailView, AsyncCourseView
+from students_courses.async_views import AsyncStudentsCoursesView
+from .middleware import compression_exempt
+
+# reads served on the event loop; other methods, and ids that are not UUIDs,
+# reach the sync DRF views of _core.urls
+urlpatterns = [
+    path('api/accounts/', signup),
+    path('api/login/', compression_exempt(login)),
+    path('api/courses/', AsyncCourseView.as_view()),
+    path('api/courses/<uuid:course_id>/', AsyncCourseDetailView.as_view()),
+    path(
+        'api/courses/<uuid:course_id>/contents/<uuid:content_id>/',
+        AsyncContentDetail.as_view(),
+    ),
+    path('api/courses/<uuid:course_id>/students/', AsyncStudentsCoursesView.as_view()),
+    path('', include('_core.urls')),
+]
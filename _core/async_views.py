@@ -0,0 +1,146 @@
+from asgiref.sync import sync_to_async
+from rest_framework import exceptions
+from rest_framework.views import APIView
+from _core.profiling import time_serializer, timed
+
+READ_METHODS = ('GET', 'HEAD')
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView whose GET and HEAD run `aget` on the event loop under ASGI.
+
+    Requests go through the APIView pipeline: content negotiation,
+    versioning, authentication, permissions, throttles, the exception
+    handler and `finalize_response`. Authenticators and permissions are
+    awaited through `aauthenticate`, `ahas_permission` and
+    `ahas_object_permission` when they define them; otherwise
+    authenticators and throttles run in a thread and permissions are called
+    directly, so those must not query the database. Other methods go to
+    `sync_view`, the DRF view that serves the same route under WSGI.
+    """
+    serializer_class = None
+    pagination_class = None
+    sync_view = None
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        sync_view = cls.sync_view.as_view() if cls.sync_view is not None else None
+
+        async def view(request, *args, **kwargs):
+            if request.method not in READ_METHODS and sync_view is not None:
+                return await sync_to_async(sync_view)(request, *args, **kwargs)
+            self = cls(**initkwargs)
+            self.setup(request, *args, **kwargs)
+            return await self.dispatch(request, *args, **kwargs)
+
+        # like APIView, authentication is by token so CSRF does not apply
+        view.csrf_exempt = True
+        view.cls = cls
+        view.initkwargs = initkwargs
+        return view
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+        try:
+            await self.ainitial(request, *args, **kwargs)
+            if request.method not in READ_METHODS:
+                self.http_method_not_allowed(request, *args, **kwargs)
+            response = await self.aget(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def ainitial(self, request, *args, **kwargs) -> None:
+        # APIView.initial, awaiting authentication, permissions and throttles
+        self.format_kwarg = self.get_format_suffix(**kwargs)
+        neg = self.perform_content_negotiation(request)
+        request.accepted_renderer, request.accepted_media_type = neg
+        version, scheme = self.determine_version(request, *args, **kwargs)
+        request.version, request.versioning_scheme = version, scheme
+
+        await self.aperform_authentication(request)
+        await self.acheck_permissions(request)
+        await self.acheck_throttles(request)
+
+    async def aget(self, request, *args, **kwargs):
+        raise NotImplementedError('`aget()` must be implemented.')
+
+    def _allowed_methods(self) -> list:
+        # aget serves GET and HEAD, sync_view the other methods
+        return [
+            method.upper() for method in self.http_method_names
+            if method.upper() in READ_METHODS or hasattr(self.sync_view or APIView, method)
+        ]
+
+    def get_serializer_class(self):
+        return self.serializer_class
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault('context', {'request': self.request, 'view': self})
+        return time_serializer(self.get_serializer_class()(*args, **kwargs))
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            pagination_class = self.pagination_class
+            self._paginator = pagination_class() if pagination_class is not None else None
+        return self._paginator
+
+    async def aperform_authentication(self, request) -> None:
+        with timed('auth'):
+            await self.aauthenticate(request)
+
+    async def aauthenticate(self, request) -> None:
+        # Request._authenticate, awaiting the authenticators that support it
+        for authenticator in request.authenticators:
+            try:
+                if hasattr(authenticator, 'aauthenticate'):
+                    user_auth_tuple = await authenticator.aauthenticate(request)
+                else:
+                    user_auth_tuple = await sync_to_async(authenticator.authenticate)(request)
+            except exceptions.APIException:
+                request._not_authenticated()
+                raise
+
+            if user_auth_tuple is not None:
+                request._authenticator = authenticator
+                request.user, request.auth = user_auth_tuple
+                return
+        request._not_authenticated()
+
+    async def acheck_permissions(self, request) -> None:
+        for permission in self.get_permissions():
+            if hasattr(permission, 'ahas_permission'):
+                allowed = await permission.ahas_permission(request, self)
+            else:
+                allowed = permission.has_permission(request, self)
+            if not allowed:
+                self.permission_denied(
+                    request,
+                    message=getattr(permission, 'message', None),
+                    code=getattr(permission, 'code', None),
+                )
+
+    async def acheck_object_permissions(self, request, obj) -> None:
+        for permission in self.get_permissions():
+            if hasattr(permission, 'ahas_object_permission'):
+                allowed = await permission.ahas_object_permission(request, self, obj)
+            else:
+                allowed = permission.has_object_permission(request, self, obj)
+            if not allowed:
+                self.permission_denied(
+                    request,
+                    message=getattr(permission, 'message', None),
+                    code=getattr(permission, 'code', None),
+                )
+
+    async def acheck_throttles(self, request) -> None:
+        if self.throttle_classes:
+            await sync_to_async(self.check_throttles)(request)
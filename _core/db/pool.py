@@ -0,0 +1,175 @@
+import threading
+import time
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of DB-API connections opened with `connect()`.
+
+    `min_size` connections are opened on first use and at most `max_size`
+    are open at once; callers beyond that wait up to `timeout` seconds and
+    then get PoolTimeout. Connections older than `max_age` seconds are
+    closed instead of reused. On checkout an idle connection must pass
+    `check(connection)`, and on return `reset(connection)` must succeed, or
+    the connection is closed and replaced.
+    """
+    def __init__(
+        self, connect, min_size: int, max_size: int, max_age: float,
+        timeout: float, check=None, reset=None,
+    ):
+        self.connect = connect
+        self.min_size = min(min_size, max_size)
+        self.max_size = max_size
+        self.max_age = max_age
+        self.timeout = timeout
+        self.check = check
+        self.reset = reset
+        self.size = 0
+        self.in_use = 0
+        self.waiting = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.discarded = 0
+        self.wait_time = 0.0
+        self._idle = []
+        self._opened_at = {}
+        self._opened = False
+        self._condition = threading.Condition()
+
+    def open(self) -> None:
+        with self._condition:
+            if self._opened:
+                return
+            self._opened = True
+            missing = self.min_size - self.size
+            self.size += missing
+        for _ in range(missing):
+            try:
+                connection = self.connect()
+            except Exception:
+                self._release_slot()
+                raise
+            self._opened_at[connection] = opened_at = time.monotonic()
+            self._checkin(connection, opened_at)
+
+    def getconn(self):
+        self.open()
+        started = time.monotonic()
+        with self._condition:
+            self.waiting += 1
+        try:
+            while True:
+                connection, opened_at = self._acquire(started)
+                if connection is None:
+                    try:
+                        connection = self.connect()
+                    except Exception:
+                        self._release_slot(in_use=True)
+                        raise
+                    self._opened_at[connection] = time.monotonic()
+                    return connection
+                if not self.is_expired(opened_at) and self._run(self.check, connection):
+                    return connection
+                self._discard(connection)
+                self._release_slot(in_use=True)
+        finally:
+            with self._condition:
+                self.waiting -= 1
+
+    def putconn(self, connection) -> None:
+        opened_at = self._opened_at.get(connection)
+        if (
+            opened_at is None
+            or self.is_expired(opened_at)
+            or not self._run(self.reset, connection)
+        ):
+            self._discard(connection)
+            self._release_slot(in_use=True)
+            return
+        with self._condition:
+            self.in_use -= 1
+        self._checkin(connection, opened_at)
+
+    def close(self) -> None:
+        # closes idle connections; checked out ones are closed when returned
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._opened = False
+        for connection, _ in idle:
+            self._discard(connection)
+            self._release_slot()
+
+    def is_expired(self, opened_at: float) -> bool:
+        return time.monotonic() - opened_at >= self.max_age
+
+    def stats(self) -> dict:
+        return {
+            'min_size': self.min_size,
+            'max_size': self.max_size,
+            'size': self.size,
+            'idle': len(self._idle),
+            'in_use': self.in_use,
+            'waiting': self.waiting,
+            'checkouts': self.checkouts,
+            'timeouts': self.timeouts,
+            'discarded': self.discarded,
+            'wait_time': self.wait_time,
+        }
+
+    def _acquire(self, started: float):
+        with self._condition:
+            while True:
+                if self._idle:
+                    connection, opened_at = self._idle.pop()
+                    break
+                if self.size < self.max_size:
+                    self.size += 1
+                    connection = opened_at = None
+                    break
+                now = time.monotonic()
+                remaining = started + self.timeout - now
+                notified = remaining > 0 and self._condition.wait(remaining)
+                self.wait_time += time.monotonic() - now
+                if not notified and not self._idle and self.size >= self.max_size:
+                    self.timeouts += 1
+                    raise PoolTimeout(
+                        f'No connection available within {self.timeout}s '
+                        f'({self.max_size} in use).'
+                    )
+            self.in_use += 1
+            self.checkouts += 1
+            return connection, opened_at
+
+    def _checkin(self, connection, opened_at: float) -> None:
+        with self._condition:
+            # LIFO keeps the warmest connections busy and lets the rest age out
+            self._idle.append((connection, opened_at))
+            self._condition.notify()
+
+    def _release_slot(self, in_use: bool = False) -> None:
+        with self._condition:
+            self.size -= 1
+            if in_use:
+                self.in_use -= 1
+            self._condition.notify()
+
+    def _discard(self, connection) -> None:
+        self._opened_at.pop(connection, None)
+        self.discarded += 1
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _run(callback, connection) -> bool:
+        if callback is None:
+            return True
+        try:
+            return callback(connection) is not False
+        except Exception:
+            return False
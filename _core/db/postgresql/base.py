@@ -0,0 +1,125 @@
+import functools
+import threading
+from django.db.backends.base.base import NO_DB_ALIAS
+from django.db.backends.postgresql import base
+from django.db.backends.postgresql.creation import DatabaseCreation as BaseDatabaseCreation
+from django.db.backends.postgresql.psycopg_any import IsolationLevel
+from _core.db.pool import ConnectionPool, PoolTimeout
+
+TRANSACTION_STATUS_IDLE = 0
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def connect(conn_params: dict, isolation_level: IsolationLevel = None):
+    """
+    Opens a connection as base.DatabaseWrapper.get_new_connection does but
+    from the parameters alone, since a pool outlives the wrapper, and the
+    thread, that created it.
+    """
+    connection = base.Database.connect(**conn_params)
+    if isolation_level is not None:
+        connection.isolation_level = isolation_level
+    if not base.is_psycopg3:
+        base.psycopg2.extras.register_default_jsonb(conn_or_curs=connection, loads=lambda x: x)
+    return connection
+
+
+def check_connection(connection) -> bool:
+    if connection.closed:
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1')
+    return True
+
+
+def reset_connection(connection) -> bool:
+    if connection.closed:
+        return False
+    if connection.info.transaction_status != TRANSACTION_STATUS_IDLE:
+        connection.rollback()
+    return connection.info.transaction_status == TRANSACTION_STATUS_IDLE
+
+
+def get_pools(alias: str = None) -> list:
+    with _pools_lock:
+        return [pool for key, pool in _pools.items() if alias in (None, key[0])]
+
+
+def pool_stats() -> dict:
+    with _pools_lock:
+        return {f'{alias}:{name}': pool.stats() for (alias, name, _), pool in _pools.items()}
+
+
+def close_pools(alias: str = None) -> None:
+    for pool in get_pools(alias):
+        pool.close()
+
+
+class DatabaseCreation(BaseDatabaseCreation):
+    def _destroy_test_db(self, test_database_name, verbosity):
+        # pooled connections would keep the test database in use
+        close_pools(self.connection.alias)
+        super()._destroy_test_db(test_database_name, verbosity)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    PostgreSQL backend that checks connections out of a per-process
+    ConnectionPool, configured by the POOL key of the database settings:
+    MIN_SIZE, MAX_SIZE, MAX_AGE and TIMEOUT. MAX_SIZE 0 turns pooling off.
+
+    Closing the Django connection, at the end of each request with
+    CONN_MAX_AGE 0, returns it to the pool after rolling back any open
+    transaction.
+    """
+    creation_class = DatabaseCreation
+
+    def get_pool(self, conn_params: dict):
+        options = self.settings_dict.get('POOL') or {}
+        if not options.get('MAX_SIZE') or self.alias == NO_DB_ALIAS:
+            return None
+
+        isolation_level = self.settings_dict['OPTIONS'].get('isolation_level')
+        if isolation_level is not None:
+            isolation_level = IsolationLevel(isolation_level)
+        key = (
+            self.alias, conn_params.get('dbname'),
+            repr((sorted(conn_params.items()), isolation_level)),
+        )
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = _pools[key] = ConnectionPool(
+                    connect=functools.partial(connect, conn_params, isolation_level),
+                    min_size=options.get('MIN_SIZE', 0),
+                    max_size=options['MAX_SIZE'],
+                    max_age=options.get('MAX_AGE', 1800),
+                    timeout=options.get('TIMEOUT', 5),
+                    check=check_connection,
+                    reset=reset_connection,
+                )
+        return pool
+
+    def get_new_connection(self, conn_params):
+        pool = self.get_pool(conn_params)
+        if pool is None:
+            return super().get_new_connection(conn_params)
+        try:
+            connection = pool.getconn()
+        except PoolTimeout as exc:
+            raise self.Database.OperationalError(str(exc)) from exc
+        self._pool = pool
+        self.isolation_level = IsolationLevel(
+            self.settings_dict['OPTIONS'].get('isolation_level', IsolationLevel.READ_COMMITTED)
+        )
+        return connection
+
+    def _close(self):
+        pool = getattr(self, '_pool', None)
+        if self.connection is None or pool is None:
+            return super()._close()
+        self._pool = None
+        with self.wrap_database_errors:
+            pool.putconn(self.connection)
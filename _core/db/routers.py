@@ -0,0 +1,75 @@
+import random
+from contextvars import ContextVar
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+WRITE_STATEMENTS = ('INSERT', 'UPDATE', 'DELETE')
+
+
+class RoutingState:
+    def __init__(self, use_replica: bool):
+        self.use_replica = use_replica
+        self.wrote = False
+
+    def mark_wrote(self) -> None:
+        self.wrote = True
+
+
+routing_state = ContextVar('routing_state', default=None)
+
+
+def write_tracker(execute, sql, params, many, context):
+    # execute wrapper on the primary: a request counts as having written
+    # once a write statement succeeded and, inside a transaction, committed
+    result = execute(sql, params, many, context)
+    state = routing_state.get()
+    if state is not None and not state.wrote and sql.lstrip()[:6].upper() in WRITE_STATEMENTS:
+        connection = context['connection']
+        if connection.in_atomic_block:
+            transaction.on_commit(state.mark_wrote, using=connection.alias)
+        else:
+            state.mark_wrote()
+    return result
+
+
+def install_write_tracker(connection, **kwargs) -> None:
+    if connection.alias == DEFAULT_DB_ALIAS and write_tracker not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, write_tracker)
+
+
+class ReplicaRouter:
+    """
+    Sends reads to one of settings.DATABASE_REPLICAS while the current
+    request allows it, see _core.middleware.ReplicaRoutingMiddleware, and
+    everything else to the primary. After the first write, and inside
+    transactions, the rest of the request reads from the primary as well.
+    Migrations only run on the primary; the replicas copy its schema.
+    """
+    def db_for_read(self, model, **hints):
+        state = routing_state.get()
+        if (
+            state is None
+            or not state.use_replica
+            or not settings.DATABASE_REPLICAS
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model, **hints):
+        state = routing_state.get()
+        if state is not None:
+            # `wrote` waits for the write to succeed, see write_tracker
+            state.use_replica = False
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
@@ -0,0 +1,17 @@
+from django.db.backends.sqlite3 import base
+
+DEFAULT_MMAP_SIZE = 1024 ** 3
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    SQLite backend that memory-maps up to settings_dict['MMAP_SIZE'] bytes of
+    the database file, 0 to turn it off. Reads that touch many pages, like
+    the FTS5 content search, then come from the OS page cache instead of
+    being copied through SQLite's own page cache.
+    """
+    def get_new_connection(self, conn_params):
+        connection = super().get_new_connection(conn_params)
+        mmap_size = int(self.settings_dict.get('MMAP_SIZE', DEFAULT_MMAP_SIZE))
+        connection.execute(f'PRAGMA mmap_size = {mmap_size}')
+        return connection
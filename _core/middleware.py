@@ -0,0 +1,307 @@
+import json
+import logging
+import random
+import time
+import zlib
+import brotli
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from rest_framework.permissions import SAFE_METHODS
+from _core.db.routers import RoutingState, install_write_tracker, routing_state
+from _core.profiling import Profile, current_profile, install_query_timer, timed
+
+profiling_logger = logging.getLogger('_core.profiling')
+
+
+def parse_accept_encoding(header: str) -> dict:
+    """'br;q=1.0, gzip;q=0.5, *;q=0' -> {'br': 1.0, 'gzip': 0.5, '*': 0.0}"""
+    codings = {}
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        name, _, value = params.strip().partition('=')
+        if name.strip() == 'q':
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        codings[coding] = quality
+    return codings
+
+
+class GzipEncoder:
+    name = 'gzip'
+
+    def __init__(self, level: int):
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.compress(data) + self.compressor.flush()
+
+    def process(self, data: bytes) -> bytes:
+        # a sync flush lets the client decode every chunk as soon as it arrives
+        return self.compressor.compress(data) + self.compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self.compressor.flush()
+
+
+class BrotliEncoder:
+    name = 'br'
+
+    def __init__(self, quality: int):
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.process(data) + self.compressor.finish()
+
+    def process(self, data: bytes) -> bytes:
+        return self.compressor.process(data) + self.compressor.flush()
+
+    def finish(self) -> bytes:
+        return self.compressor.finish()
+
+
+def compression_exempt(view):
+    """
+    Marks a view whose responses CompressionMiddleware sends uncompressed.
+    For views that echo request input next to a secret, like the JWT login,
+    where the compressed length would let an attacker guess the secret one
+    byte at a time (BREACH).
+    """
+    view.compression_exempt = True
+    return view
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Brotli or gzip for API responses, negotiated from Accept-Encoding with
+    Brotli preferred on ties. Bodies below `MIN_SIZE` are sent as they are;
+    streaming responses, like the NDJSON export, are compressed chunk by
+    chunk and flushed after each one. Views marked with compression_exempt
+    are skipped. See API_COMPRESSION in the settings.
+    """
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        config = settings.API_COMPRESSION
+        self.path_prefix = config['PATH_PREFIX']
+        self.min_size = config['MIN_SIZE']
+        self.brotli_quality = config['BROTLI_QUALITY']
+        self.gzip_level = config['GZIP_LEVEL']
+        self.streaming = config['STREAMING']
+
+    def get_encoder(self, request):
+        codings = parse_accept_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        wildcard = codings.get('*', 0.0)
+        brotli_quality = codings.get('br', wildcard)
+        gzip_quality = codings.get('gzip', wildcard)
+        if brotli_quality > 0 and brotli_quality >= gzip_quality:
+            return BrotliEncoder(self.brotli_quality)
+        if gzip_quality > 0:
+            return GzipEncoder(self.gzip_level)
+        return None
+
+    def process_response(self, request, response):
+        if not request.path.startswith(self.path_prefix):
+            return response
+        # a cache must not hand one user's response, compressed or not, to another
+        credentials = {'Authorization': 'HTTP_AUTHORIZATION', 'Cookie': 'HTTP_COOKIE'}
+        patch_vary_headers(
+            response, [header for header, key in credentials.items() if key in request.META]
+        )
+        if response.has_header('Content-Encoding') or response.status_code in (204, 304):
+            return response
+        if getattr(getattr(request.resolver_match, 'func', None), 'compression_exempt', False):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        if response.streaming:
+            if not self.streaming:
+                return response
+            encoder = self.get_encoder(request)
+            if encoder is None:
+                return response
+            if response.is_async:
+                response.streaming_content = self.compress_async(
+                    encoder, response.streaming_content
+                )
+            else:
+                response.streaming_content = self.compress_sequence(
+                    encoder, response.streaming_content
+                )
+            del response.headers['Content-Length']
+        else:
+            if len(response.content) < self.min_size:
+                return response
+            encoder = self.get_encoder(request)
+            if encoder is None:
+                return response
+            compressed = encoder.compress(response.content)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        # the encoded body is a different representation, as in GZipMiddleware
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = encoder.name
+        return response
+
+    def compress_sequence(self, encoder, sequence):
+        for chunk in sequence:
+            data = encoder.process(chunk)
+            if data:
+                yield data
+        yield encoder.finish()
+
+    async def compress_async(self, encoder, sequence):
+        async for chunk in sequence:
+            data = encoder.process(chunk)
+            if data:
+                yield data
+        yield encoder.finish()
+
+
+class ReplicaRoutingMiddleware(MiddlewareMixin):
+    """
+    Lets safe-method requests read from the replicas of _core.db.routers.
+    Requests whose writes succeeded set a cookie that keeps the client on
+    the primary for DATABASE_REPLICA_STICKY_SECONDS, so it reads its own
+    writes while replication catches up.
+    """
+    cookie_name = 'primary_until'
+
+    def __init__(self, get_response):
+        # connections opened later, in any thread, track writes as well
+        connection_created.connect(install_write_tracker)
+        super().__init__(get_response)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        state = self.get_state(request)
+        token = routing_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            routing_state.reset(token)
+        return self.stick_to_primary(state, response)
+
+    async def __acall__(self, request):
+        state = self.get_state(request)
+        token = routing_state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            routing_state.reset(token)
+        return self.stick_to_primary(state, response)
+
+    def get_state(self, request) -> RoutingState:
+        for connection in connections.all(initialized_only=True):
+            install_write_tracker(connection)
+        try:
+            primary_until = float(request.COOKIES.get(self.cookie_name, 0))
+        except ValueError:
+            primary_until = 0
+        return RoutingState(
+            use_replica=request.method in SAFE_METHODS and primary_until <= time.time()
+        )
+
+    def stick_to_primary(self, state: RoutingState, response):
+        if state.wrote:
+            window = settings.DATABASE_REPLICA_STICKY_SECONDS
+            response.set_cookie(
+                self.cookie_name, f'{time.time() + window:.3f}',
+                max_age=window, httponly=True, samesite='Lax',
+            )
+        return response
+
+
+class ProfilingMiddleware(MiddlewareMixin):
+    """
+    Profiles API_PROFILING['SAMPLE_RATE'] of the requests: time in SQL and
+    query count, authentication and serializers (see
+    _core.views.ProfiledViewMixin) and rendering, sent back in a
+    Server-Timing header and, with API_PROFILING['LOG'], logged as one JSON
+    line to the `_core.profiling` logger. The phases can overlap, e.g. SQL
+    run by a serializer counts for both. Off, the default, it is not loaded.
+    """
+    phases = ('db', 'auth', 'serializer', 'render')
+
+    def __init__(self, get_response):
+        options = settings.API_PROFILING
+        if not options['SAMPLE_RATE']:
+            raise MiddlewareNotUsed()
+        self.sample_rate = options['SAMPLE_RATE']
+        self.log = options['LOG']
+        # connections opened later, in any thread, get the timer as well
+        connection_created.connect(install_query_timer)
+        super().__init__(get_response)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if random.random() >= self.sample_rate:
+            return self.get_response(request)
+        profile, token = self.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            current_profile.reset(token)
+        return self.finish(request, response, profile)
+
+    async def __acall__(self, request):
+        if random.random() >= self.sample_rate:
+            return await self.get_response(request)
+        profile, token = self.start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_profile.reset(token)
+        return self.finish(request, response, profile)
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered right after this hook; render them here
+        if current_profile.get() is not None:
+            with timed('render'):
+                response.render()
+        return response
+
+    def start(self):
+        for connection in connections.all(initialized_only=True):
+            install_query_timer(connection)
+        profile = Profile()
+        return profile, current_profile.set(profile)
+
+    def finish(self, request, response, profile: Profile):
+        total = profile.elapsed()
+        durations = {phase: profile.durations.get(phase, 0.0) for phase in self.phases}
+        queries = profile.counts.get('db', 0)
+
+        metrics = [
+            f'{phase};dur={duration * 1000:.2f}' for phase, duration in durations.items()
+        ]
+        metrics[0] += f';desc="{queries} queries"'
+        metrics.append(f'total;dur={total * 1000:.2f}')
+        response['Server-Timing'] = ', '.join(metrics)
+
+        if self.log:
+            profiling_logger.info(json.dumps({
+                'method': request.method,
+                'path': request.path,
+                'status': response.status_code,
+                'queries': queries,
+                **{f'{phase}_ms': round(duration * 1000, 2) for phase, duration in durations.items()},
+                'total_ms': round(total * 1000, 2),
+            }))
+        return response
@@ -0,0 +1,94 @@
+import functools
+import time
+from asgiref.sync import iscoroutinefunction
+from contextlib import nullcontext
+from contextvars import ContextVar
+
+current_profile = ContextVar('current_profile', default=None)
+
+_not_profiled = nullcontext()
+
+
+class Profile:
+    """
+    Time spent per phase of one request, filled by `timed` blocks and by
+    `query_timer` while the request is profiled, see
+    _core.middleware.ProfilingMiddleware.
+    """
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.durations = {}
+        self.counts = {}
+        self.depths = {}
+
+    def add(self, name: str, duration: float) -> None:
+        self.durations[name] = self.durations.get(name, 0.0) + duration
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+
+class Timer:
+    __slots__ = ('profile', 'name', 'started')
+
+    def __init__(self, profile: Profile, name: str):
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self):
+        depth = self.profile.depths.get(self.name, 0)
+        self.profile.depths[self.name] = depth + 1
+        if not depth:
+            self.started = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        depth = self.profile.depths[self.name] - 1
+        self.profile.depths[self.name] = depth
+        # nested blocks of the same phase, like child serializers, count once
+        if not depth:
+            self.profile.add(self.name, time.perf_counter() - self.started)
+
+
+def timed(name: str):
+    """Context manager adding its duration to `name`; a no-op when not profiled."""
+    profile = current_profile.get()
+    if profile is None:
+        return _not_profiled
+    return Timer(profile, name)
+
+
+def profiled(name: str):
+    """Decorator timing each call, sync or async, into `name`."""
+    def decorator(function):
+        if iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def wrapper(*args, **kwargs):
+                with timed(name):
+                    return await function(*args, **kwargs)
+        else:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with timed(name):
+                    return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def time_serializer(serializer):
+    """Times the `.data` of `serializer`, with its nested fields, when profiled."""
+    if current_profile.get() is not None:
+        serializer.to_representation = profiled('serializer')(serializer.to_representation)
+    return serializer
+
+
+def query_timer(execute, sql, params, many, context):
+    # execute wrapper, see django.db.backends.base.base.BaseDatabaseWrapper.execute_wrapper
+    with timed('db'):
+        return execute(sql, params, many, context)
+
+
+def install_query_timer(connection, **kwargs) -> None:
+    # first in the list: execute_wrapper() blocks pop the last wrapper on exit
+    if query_timer not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, query_timer)
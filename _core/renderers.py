@@ -0,0 +1,38 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer writing bytes with orjson, which encodes UUID, date and
+    datetime natively. With the default compact, unicode and strict settings
+    the output matches JSONRenderer byte for byte; indented output (the
+    browsable API) and anything orjson refuses, like integers wider than 64
+    bits or non-string keys, go through JSONRenderer itself.
+
+    Floats whose repr uses an exponent (below 1e-4 or from 1e16 up) are
+    written in orjson's notation, e.g. 0.000025 for 2.5e-05: the same
+    number, different bytes. NaN and infinity become null instead of an error.
+    """
+    options = orjson.OPT_UTC_Z
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if (
+            self.ensure_ascii or not self.compact or not self.strict
+            or self.get_indent(accepted_media_type, renderer_context) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # same escaping of U+2028 and U+2029 as JSONRenderer
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
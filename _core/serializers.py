@@ -0,0 +1,271 @@
+import json
+import re
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+from rest_framework import serializers
+from _core.profiling import profiled
+
+
+class UniqueConstraintErrorsMixin:
+    """
+    ModelSerializer mixin that leaves unique fields to the database
+    constraints instead of checking them with a SELECT before each write.
+
+    Wrap the write in `unique_errors()`; when it fails with IntegrityError
+    the violated constraint is mapped to its field in `unique_error_messages`
+    and raised as a field error, exactly like UniqueValidator would report
+    it. A successful write is the INSERT or UPDATE alone.
+    """
+    unique_error_messages = {}
+
+    @contextmanager
+    def unique_errors(self, validated_data: dict, instance=None):
+        # a savepoint is only needed to keep an enclosing transaction usable
+        in_transaction = transaction.get_connection().in_atomic_block
+        try:
+            with transaction.atomic() if in_transaction else nullcontext():
+                yield
+        except IntegrityError as error:
+            field = self.get_violated_field(error)
+            if field is None:
+                raise
+            errors = {field: [self.unique_error_messages[field]]}
+            errors.update(self.get_unique_errors(validated_data, instance, exclude=field))
+            raise serializers.ValidationError(errors)
+
+    def get_violated_field(self, error: IntegrityError):
+        opts = self.Meta.model._meta
+        # PostgreSQL names the constraint, e.g. accounts_account_username_key
+        # or accounts_account_email_<hash>_uniq; SQLite names the columns,
+        # e.g. 'UNIQUE constraint failed: accounts_account.username'
+        constraint = getattr(getattr(error.__cause__, 'diag', None), 'constraint_name', None)
+        _, _, columns = str(error).partition('UNIQUE constraint failed: ')
+        failed_columns = set(columns.split(', '))
+        for field in self.unique_error_messages:
+            column = opts.get_field(field).column
+            if constraint is not None:
+                pattern = rf'{re.escape(opts.db_table)}_{re.escape(column)}_(key|[0-9a-f]{{8}}_uniq)'
+                if re.fullmatch(pattern, constraint):
+                    return field
+            elif f'{opts.db_table}.{column}' in failed_columns:
+                return field
+        return None
+
+    def get_unique_errors(self, validated_data: dict, instance=None, exclude=None) -> dict:
+        # the database stops at the first violated constraint; the other
+        # unique fields are looked up in one query, on the failure path only
+        values = {
+            field: validated_data[field]
+            for field in self.unique_error_messages
+            if field != exclude and field in validated_data
+        }
+        if not values:
+            return {}
+
+        queryset = self.Meta.model.objects.filter(
+            Q(**values, _connector=Q.OR)
+        )
+        if instance is not None:
+            queryset = queryset.exclude(pk=instance.pk)
+
+        errors = {}
+        for row in queryset.values(*values):
+            for field, value in values.items():
+                if row[field] == value:
+                    errors[field] = [self.unique_error_messages[field]]
+        return errors
+
+
+def parse_fieldset(value: str) -> dict:
+    """
+    Turn a `?fields=` / `?omit=` value into a tree of field names:
+    'name,contents.name' -> {'name': {}, 'contents': {'name': {}}}
+    """
+    tree = {}
+    for path in value.split(','):
+        node = tree
+        for name in filter(None, (part.strip() for part in path.split('.'))):
+            node = node.setdefault(name, {})
+    return tree
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin taking `fields` and `omit` trees from `parse_fieldset`.
+    Only the selected fields are kept, then the omitted ones are dropped; a
+    nested serializer using the mixin receives its own branch of both trees.
+    """
+    def __init__(self, *args, fields: dict = None, omit: dict = None, **kwargs):
+        self.selected_fields = fields or None
+        self.omitted_fields = omit or {}
+        super().__init__(*args, **kwargs)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        unknown = sorted(
+            ({*(self.selected_fields or ()), *self.omitted_fields}) - set(fields)
+        )
+        if unknown:
+            raise serializers.ValidationError(
+                {'fields': [f'Unknown field: {name}.' for name in unknown]}
+            )
+
+        if self.selected_fields is not None:
+            fields = {
+                name: field for name, field in fields.items()
+                if name in self.selected_fields
+            }
+        for name in list(fields):
+            omitted = self.omitted_fields.get(name)
+            if omitted == {}:
+                del fields[name]
+                continue
+            nested = getattr(fields[name], 'child', fields[name])
+            if isinstance(nested, SparseFieldsetMixin):
+                nested.selected_fields = (self.selected_fields or {}).get(name) or None
+                nested.omitted_fields = omitted or {}
+        return fields
+
+
+class CompiledSerializer:
+    """
+    Read-only twin of a ModelSerializer for hot GET endpoints.
+
+    A flat row-to-dict function is generated once from the serializer's
+    fields and fed with `QuerySet.values()` rows, so no model instance is
+    built and no field is bound per row. Nested model serializers and
+    many=True primary keys are filled with one query per relation, like
+    prefetch_related. `serialize()` returns the same payload as `.data`.
+    """
+    def __init__(self, serializer: serializers.ModelSerializer):
+        self.name = type(serializer).__name__
+        self.model = serializer.Meta.model
+        self.lookups = ['pk']
+        self.relations = []
+
+        namespace = {}
+        entries = []
+        for index, field in enumerate(serializer._readable_fields):
+            value = self.compile_field(field, index, namespace)
+            entries.append(f'        {field.field_name!r}: {value},')
+        source = '\n'.join(['def row_to_dict(row):', '    return {', *entries, '    }'])
+        exec(source, namespace)
+        self.row_to_dict = namespace['row_to_dict']
+
+    def compile_field(self, field, index: int, namespace: dict) -> str:
+        if isinstance(field, serializers.ListSerializer):
+            self.add_relation(field, CompiledSerializer(field.child))
+            return 'None'
+        if isinstance(field, serializers.ManyRelatedField):
+            if not self.is_plain_pk(field.child_relation):
+                raise TypeError(f'{self.name}.{field.field_name} can not be compiled.')
+            self.add_relation(field, None)
+            return 'None'
+        if self.is_plain_pk(field):
+            return self.add_lookup(field)
+        if (
+            isinstance(field, (serializers.RelatedField, serializers.BaseSerializer,
+                               serializers.SerializerMethodField))
+            or field.source == '*'
+        ):
+            raise TypeError(f'{self.name}.{field.field_name} can not be compiled.')
+
+        lookup = self.add_lookup(field)
+        if isinstance(field, serializers.UUIDField) and field.uuid_format == 'hex_verbose':
+            convert = str
+        elif (
+            isinstance(field, serializers.CharField)
+            and type(field).to_representation is serializers.CharField.to_representation
+        ):
+            convert = str
+        else:
+            convert = field.to_representation
+        namespace[f'convert_{index}'] = convert
+        return f'None if (value := {lookup}) is None else convert_{index}(value)'
+
+    @staticmethod
+    def is_plain_pk(field) -> bool:
+        return isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is None
+
+    def add_lookup(self, field) -> str:
+        lookup = '__'.join(field.source_attrs)
+        self.lookups.append(lookup)
+        return f'row[{lookup!r}]'
+
+    def add_relation(self, field, child) -> None:
+        model_field = self.model._meta.get_field(field.source)
+        if model_field.concrete:
+            remote = model_field.related_query_name()
+        else:
+            remote = model_field.field.name
+        self.relations.append((field.field_name, model_field.related_model, remote, child))
+
+    def values(self, queryset, *lookups):
+        return queryset.values(*dict.fromkeys([*self.lookups, *lookups]))
+
+    @profiled('serializer')
+    def serialize(self, rows) -> list:
+        steps = self.iter_serialize(rows)
+        related = None
+        try:
+            while True:
+                related = list(steps.send(related))
+        except StopIteration as stop:
+            return stop.value
+
+    @profiled('serializer')
+    async def aserialize(self, rows) -> list:
+        steps = self.iter_serialize(rows)
+        related = None
+        try:
+            while True:
+                related = [row async for row in steps.send(related)]
+        except StopIteration as stop:
+            return stop.value
+
+    def iter_serialize(self, rows):
+        # yields each relation's queryset and gets its rows sent back, so
+        # `serialize` and `aserialize` only differ in how they are read
+        rows = list(rows)
+        data = [self.row_to_dict(row) for row in rows]
+        if rows:
+            for name, related_model, remote, child in self.relations:
+                related = yield self.get_related_queryset(rows, related_model, remote, child)
+                if child is not None:
+                    child_data = yield from child.iter_serialize(related)
+                    related = self.with_parents(related, child_data)
+                self.fill_relation(rows, data, name, related)
+        return data
+
+    def get_related_queryset(self, rows, related_model, remote, child):
+        queryset = related_model._default_manager.filter(
+            **{f'{remote}__in': [row['pk'] for row in rows]}
+        )
+        if child is None:
+            return queryset.values_list(remote, 'pk')
+        return child.values(queryset.annotate(_parent=F(remote)), '_parent')
+
+    @staticmethod
+    def with_parents(rows, data) -> list:
+        return [(row['_parent'], item) for row, item in zip(rows, data)]
+
+    @staticmethod
+    def fill_relation(rows, data, name, related) -> None:
+        # `related` holds (parent pk, item) pairs
+        groups = {}
+        for parent, item in related:
+            groups.setdefault(parent, []).append(item)
+        for row, item in zip(rows, data):
+            item[name] = groups.get(row['pk'], [])
+
+
+@lru_cache(maxsize=128)
+def compile_serializer(serializer_class, fieldset: str = '') -> CompiledSerializer:
+    """
+    Cached CompiledSerializer for `serializer_class`, built with the kwargs
+    JSON-encoded in `fieldset` (the SparseFieldsetMixin trees).
+    """
+    kwargs = json.loads(fieldset) if fieldset else {}
+    return CompiledSerializer(serializer_class(**kwargs))
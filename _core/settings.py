@@ -56,8 +56,11 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    '_core.middleware.ProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    '_core.middleware.CompressionMiddleware',
+    '_core.middleware.ReplicaRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -66,7 +69,8 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
-ROOT_URLCONF = '_core.urls'
+# _core/asgi.py switches to _core.asgi_urls, which adds the async auth views
+ROOT_URLCONF = os.getenv('DJANGO_ROOT_URLCONF', '_core.urls')
 
 TEMPLATES = [
     {
@@ -90,33 +94,86 @@ WSGI_APPLICATION = '_core.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
+# In-process connection pool of the default database, see _core.db.pool.
+# Connections go back to the pool at the end of each request, so
+# CONN_MAX_AGE stays 0. DATABASE_POOL_MAX_SIZE=0 turns pooling off
+DATABASE_POOL = {
+    'MIN_SIZE': int(os.getenv('DATABASE_POOL_MIN_SIZE', 2)),
+    'MAX_SIZE': int(os.getenv('DATABASE_POOL_MAX_SIZE', 10)),
+    'MAX_AGE': int(os.getenv('DATABASE_POOL_MAX_AGE', 1800)),
+    'TIMEOUT': float(os.getenv('DATABASE_POOL_TIMEOUT', 5)),
+}
+
+# bytes of each SQLite file read through mmap, see _core.db.sqlite3
+SQLITE_MMAP_SIZE = int(os.getenv('SQLITE_MMAP_SIZE', 1024 ** 3))
+
 DATABASES = {
     'default':{
-        'ENGINE': 'django.db.backends.postgresql',
+        'ENGINE': '_core.db.postgresql',
         'NAME': os.getenv('POSTGRES_DBNAME'),
         'USER': os.getenv('POSTGRES_USER'),
         'PASSWORD': os.getenv('POSTGRES_PASSWORD'),
         'HOST': '127.0.0.1',
         'PORT': 5432,   
-
+        'CONN_MAX_AGE': 0,
+        'POOL': DATABASE_POOL,
     },
     
     'sqlite3':{
-        'ENGINE': 'django.db.backends.sqlite3',
+        'ENGINE': '_core.db.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
-    }
+        'MMAP_SIZE': SQLITE_MMAP_SIZE,
+    },
+
+    # second file to try replica routing locally, see DATABASE_REPLICAS
+    'sqlite3_replica':{
+        'ENGINE': '_core.db.sqlite3',
+        'NAME': BASE_DIR / 'db_replica.sqlite3',
+        'MMAP_SIZE': SQLITE_MMAP_SIZE,
+    },
 }
 
 DATABASE_URL = os.getenv('DATABASE_URL')
 
+
+def get_database_engine(url: str):
+    # the pooled backend for PostgreSQL URLs, dj_database_url's default otherwise
+    if url.split(':', 1)[0] in ('postgres', 'postgresql', 'pgsql'):
+        return '_core.db.postgresql'
+    return None
+
+
 if DATABASE_URL:
     db_from_env = dj_database_url.config(
-        default=DATABASE_URL, conn_max_age=500,
-        ssl_require=True
+        default=DATABASE_URL, conn_max_age=0,
+        ssl_require=True, engine=get_database_engine(DATABASE_URL),
     )
     DATABASES['default'].update(db_from_env)
     DEBUG = False
 
+DATABASE_REPLICA_URL = os.getenv('DATABASE_REPLICA_URL')
+
+if DATABASE_REPLICA_URL:
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        **dj_database_url.parse(
+            DATABASE_REPLICA_URL, conn_max_age=0,
+            ssl_require=True, engine=get_database_engine(DATABASE_REPLICA_URL),
+        ),
+        'TEST': {'MIRROR': 'default'},
+    }
+
+# Aliases that serve reads of GET/HEAD/OPTIONS requests, see
+# _core.db.routers. After a write the client stays on the primary for
+# DATABASE_REPLICA_STICKY_SECONDS
+DATABASE_REPLICAS = [
+    alias for alias in os.getenv(
+        'DATABASE_REPLICAS', 'replica' if DATABASE_REPLICA_URL else ''
+    ).split(',') if alias
+]
+DATABASE_REPLICA_STICKY_SECONDS = int(os.getenv('DATABASE_REPLICA_STICKY_SECONDS', 5))
+DATABASE_ROUTERS = ['_core.db.routers.ReplicaRouter']
+
 if not DEBUG:
     STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
     STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
@@ -144,12 +201,62 @@ AUTH_USER_MODEL = 'accounts.Account'
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=30),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
+    'TOKEN_OBTAIN_SERIALIZER': 'accounts.serializers.AccountTokenObtainPairSerializer',
+}
+
+# Process pool used by the async sign-up and login views, see accounts.hashing
+PASSWORD_HASHING_WORKERS = int(os.getenv('PASSWORD_HASHING_WORKERS', os.cpu_count() or 1))
+PASSWORD_HASHING_POOL = {
+    'MAX_WORKERS': PASSWORD_HASHING_WORKERS,
+    'MAX_CONCURRENCY': int(
+        os.getenv('PASSWORD_HASHING_CONCURRENCY', PASSWORD_HASHING_WORKERS)
+    ),
+    'MAX_QUEUE': int(os.getenv('PASSWORD_HASHING_MAX_QUEUE', 100)),
+}
+
+# Stateless mode trusts the claims in the access token instead of loading
+# the account on every request: demoting or deactivating an account only
+# takes effect when its tokens expire, see
+# accounts.authentication.StatelessJWTAuthentication
+JWT_STATELESS_AUTH = os.getenv('JWT_STATELESS_AUTH', 'False') == 'True'
+
+# In-process cache of authenticated accounts, see accounts.authentication
+JWT_USER_CACHE = {
+    'MAX_SIZE': int(os.getenv('JWT_USER_CACHE_MAX_SIZE', 4096)),
+    'TTL': int(os.getenv('JWT_USER_CACHE_TTL', 60)),
+}
+
+# Brotli/gzip for responses under PATH_PREFIX, see _core.middleware. The
+# default levels favour CPU over ratio: JSON already shrinks 8-10x there
+API_COMPRESSION = {
+    'PATH_PREFIX': '/api/',
+    'MIN_SIZE': int(os.getenv('API_COMPRESSION_MIN_SIZE', 1024)),
+    'BROTLI_QUALITY': int(os.getenv('API_COMPRESSION_BROTLI_QUALITY', 4)),
+    'GZIP_LEVEL': int(os.getenv('API_COMPRESSION_GZIP_LEVEL', 5)),
+    'STREAMING': os.getenv('API_COMPRESSION_STREAMING', 'True') == 'True',
+}
+
+# GET on course and roster lists reads QuerySet.values() rows through
+# _core.serializers.CompiledSerializer instead of model instances
+API_COMPILED_READS = os.getenv('API_COMPILED_READS', 'True') == 'True'
+
+# Share of requests profiled into a Server-Timing header (0.01 is 1%), and
+# whether those are also logged as JSON lines, see _core.profiling
+API_PROFILING = {
+    'SAMPLE_RATE': float(os.getenv('API_PROFILING_SAMPLE_RATE', 0)),
+    'LOG': os.getenv('API_PROFILING_LOG', 'False') == 'True',
 }
 
 REST_FRAMEWORK = {
     "ACCESS_TOKEN_LIFETIME": timedelta(hours=1),
     'DEFAULT_AUTHENTICATION_CLASSES': (
-      'rest_framework_simplejwt.authentication.JWTAuthentication',
+      'accounts.authentication.StatelessJWTAuthentication'
+      if JWT_STATELESS_AUTH else
+      'accounts.authentication.CachedJWTAuthentication',
+    ),
+    'DEFAULT_RENDERER_CLASSES': (
+        '_core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
     ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 }
@@ -21,6 +21,7 @@ from drf_spectacular.views import (
     SpectacularRedocView,
     SpectacularSwaggerView,
 )
+from .views import DatabasePoolStatsView
 
 
 urlpatterns = [
@@ -29,6 +30,7 @@ urlpatterns = [
     path('api/', include('courses.urls')),
     path('api/', include('contents.urls')),
     path('api/', include('students_courses.urls')),
+    path('api/database/pool/stats/', DatabasePoolStatsView.as_view()),
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/docs/swagger/', SpectacularSwaggerView.as_view(url_name='schema')),
     path('api/docs/redoc/', SpectacularRedocView.as_view(url_name='schema'))
@@ -0,0 +1,26 @@
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from courses.permissions import isAdm
+from _core.db.postgresql.base import pool_stats
+from _core.profiling import time_serializer, timed
+
+
+class ProfiledViewMixin:
+    """
+    APIView hooks timing authentication and the serializers handed out by
+    `get_serializer` into the `auth` and `serializer` phases of
+    _core.profiling. No-ops on requests that are not profiled.
+    """
+    def perform_authentication(self, request):
+        with timed('auth'):
+            super().perform_authentication(request)
+
+    def get_serializer(self, *args, **kwargs):
+        return time_serializer(super().get_serializer(*args, **kwargs))
+
+
+class DatabasePoolStatsView(ProfiledViewMixin, APIView):
+    permission_classes = [isAdm]
+
+    def get(self, request):
+        return Response(pool_stats())
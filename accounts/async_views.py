@@ -0,0 +1,99 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import update_last_login
+from django.http import JsonResponse
+from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.request import Request
+from rest_framework.settings import api_settings as rest_settings
+from rest_framework_simplejwt.settings import api_settings
+from .hashing import HashingPoolFull, hashing_pool
+from .models import Account
+from .serializers import AccountSerializer, AccountTokenObtainPairSerializer
+
+
+class AccountCredentialsSerializer(AccountTokenObtainPairSerializer):
+    # field validation only, the password is checked in the hashing pool
+    def validate(self, attrs: dict) -> dict:
+        return attrs
+
+
+def parse_body(request):
+    if request.method != 'POST':
+        return None, JsonResponse(
+            {'detail': f'Method "{request.method}" not allowed.'}, status=405
+        )
+    # the same parsers as the sync views, so form and multipart bodies work too
+    request = Request(
+        request, parsers=[parser() for parser in rest_settings.DEFAULT_PARSER_CLASSES]
+    )
+    try:
+        return request.data, None
+    except APIException as error:
+        return None, JsonResponse({'detail': str(error.detail)}, status=error.status_code)
+
+
+def busy_response() -> JsonResponse:
+    response = JsonResponse(
+        {'detail': 'Too many requests are waiting for password hashing.'}, status=503
+    )
+    response['Retry-After'] = '1'
+    return response
+
+
+async def signup(request):
+    data, error = parse_body(request)
+    if error:
+        return error
+
+    serializer = AccountSerializer(data=data, context={'password_is_hashed': True})
+    if not await sync_to_async(serializer.is_valid)():
+        return JsonResponse(serializer.errors, status=400)
+
+    try:
+        password = await hashing_pool.make_password(
+            serializer.validated_data['password']
+        )
+    except HashingPoolFull:
+        return busy_response()
+
+    try:
+        await sync_to_async(serializer.save)(password=password)
+    except ValidationError as error:
+        return JsonResponse(error.detail, status=400)
+    return JsonResponse(serializer.data, status=201)
+
+
+async def login(request):
+    data, error = parse_body(request)
+    if error:
+        return error
+
+    serializer = AccountCredentialsSerializer(data=data)
+    if not serializer.is_valid():
+        return JsonResponse(serializer.errors, status=400)
+
+    username = serializer.validated_data['username']
+    password = serializer.validated_data['password']
+    user = await Account.objects.filter(username=username).afirst()
+    try:
+        if user is None:
+            # hash anyway so unknown usernames take as long as wrong passwords
+            await hashing_pool.make_password(password)
+            is_valid = False
+        else:
+            is_valid = await hashing_pool.check_password(password, user.password)
+    except HashingPoolFull:
+        return busy_response()
+
+    if not is_valid or not api_settings.USER_AUTHENTICATION_RULE(user):
+        response = JsonResponse(
+            {'detail': str(serializer.error_messages['no_active_account'])},
+            status=401
+        )
+        response['WWW-Authenticate'] = f'{api_settings.AUTH_HEADER_TYPES[0]} realm="api"'
+        return response
+
+    if api_settings.UPDATE_LAST_LOGIN:
+        await sync_to_async(update_last_login)(None, user)
+
+    refresh = serializer.get_token(user)
+    return JsonResponse({'refresh': str(refresh), 'access': str(refresh.access_token)})
@@ -0,0 +1,153 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import (
+    JWTAuthentication, JWTStatelessUserAuthentication,
+)
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+class UserCache:
+    """
+    Thread-safe LRU of user objects whose entries expire after `ttl` seconds.
+    """
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            user, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # each request gets its own copy so per-request state never leaks
+        return copy.copy(user)
+
+    def set(self, key, user) -> None:
+        with self._lock:
+            self._entries[key] = (copy.copy(user), time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+user_cache = UserCache(
+    max_size=settings.JWT_USER_CACHE['MAX_SIZE'],
+    ttl=settings.JWT_USER_CACHE['TTL'],
+)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that keeps recently authenticated accounts in
+    `user_cache`, keyed by the token's user id. Entries are dropped when the
+    account is saved or deleted (see accounts.signals) or when the TTL runs
+    out. The cache and its invalidation are per process: other workers keep
+    serving their copy for up to JWT_USER_CACHE['TTL'] seconds.
+
+    Accounts are always loaded from the primary, so a replica that is behind
+    (see _core.db.routers) never puts a stale account in the cache.
+    """
+    def get_user(self, validated_token):
+        user_id = self.get_user_id(validated_token)
+        user = user_cache.get(str(user_id))
+        if user is not None:
+            self.check_revoked(user, validated_token)
+            return user
+
+        try:
+            user = self.get_user_queryset().get(**{api_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        self.check_user(user, validated_token)
+
+        user_cache.set(str(user_id), user)
+        return user
+
+    async def aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        # same as get_user, with the async ORM
+        user_id = self.get_user_id(validated_token)
+        user = user_cache.get(str(user_id))
+        if user is not None:
+            self.check_revoked(user, validated_token)
+            return user
+
+        try:
+            user = await self.get_user_queryset().aget(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        self.check_user(user, validated_token)
+
+        user_cache.set(str(user_id), user)
+        return user
+
+    def get_user_queryset(self):
+        return self.user_model.objects.using(DEFAULT_DB_ALIAS)
+
+    def get_user_id(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+        return user_id
+
+    def check_user(self, user, validated_token) -> None:
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        self.check_revoked(user, validated_token)
+
+    def check_revoked(self, user, validated_token) -> None:
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."), code="password_changed"
+            )
+
+
+class StatelessJWTAuthentication(JWTStatelessUserAuthentication):
+    """
+    Builds a simplejwt TokenUser from the access token claims without a
+    query. `username` and `is_superuser` are the values embedded at login
+    (see accounts.serializers.AccountTokenObtainPairSerializer) and
+    `is_active` is always True, so a demoted or deactivated account keeps
+    its access until the token expires, after
+    SIMPLE_JWT['ACCESS_TOKEN_LIFETIME'].
+    """
@@ -0,0 +1,171 @@
+import codecs
+import csv
+import json
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from .hashing import hashing_pool
+from .models import Account
+from .serializers import AccountSerializer
+
+USERNAME_TAKEN = AccountSerializer.unique_error_messages['username']
+EMAIL_TAKEN = AccountSerializer.unique_error_messages['email']
+ACCOUNT_TAKEN = 'A user with that username or email already exists.'
+DELIMITERS = (',', ']', ' ', '\t', '\n', '\r')
+
+
+def iter_csv_rows(stream):
+    return csv.DictReader(codecs.iterdecode(stream, 'utf-8'))
+
+
+def iter_json_array(stream, chunk_size: int = 64 * 1024):
+    """
+    Yield the items of a top-level JSON array without reading the whole
+    body into memory.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    opened = False
+    expect_item = True
+    ended = False
+    while True:
+        buffer = buffer.lstrip()
+        if buffer:
+            if not opened:
+                if buffer[0] != '[':
+                    raise ValueError('Expected a JSON array.')
+                buffer, opened = buffer[1:], True
+                continue
+            if buffer[0] == ']':
+                return
+            if buffer[0] == ',' and not expect_item:
+                buffer, expect_item = buffer[1:], True
+                continue
+            if expect_item:
+                try:
+                    item, end = decoder.raw_decode(buffer)
+                except ValueError:
+                    pass
+                else:
+                    # a number cut by the chunk, like 12 of 123 or -1 of
+                    # -1.5, only counts once a delimiter follows it
+                    if ended or buffer[end:end + 1] in DELIMITERS:
+                        yield item
+                        buffer, expect_item = buffer[end:], False
+                        continue
+
+        if ended:
+            raise ValueError('Unexpected end of JSON array.')
+        chunk = stream.read(chunk_size)
+        ended = not chunk
+        buffer += text.decode(chunk, final=ended)
+
+
+class AccountImporter:
+    """
+    Creates accounts in batches: every batch is validated row by row, checked
+    for uniqueness with one query, hashed across the hashing pool and saved
+    with one bulk_create. `results` holds one entry per input row.
+    """
+    batch_size = 1000
+
+    def __init__(self):
+        self.results = []
+        self.created = 0
+        self.failed = 0
+        self.seen_usernames = set()
+        self.seen_emails = set()
+
+    def run(self, rows) -> None:
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == self.batch_size:
+                self.import_batch(batch)
+                batch = []
+        if batch:
+            self.import_batch(batch)
+
+    def import_batch(self, rows: list) -> None:
+        first_row = len(self.results)
+        valid = []
+        for index, row in enumerate(rows, start=first_row):
+            serializer = AccountSerializer(data=row)
+            if serializer.is_valid():
+                data = serializer.validated_data
+                data['username'] = Account.normalize_username(data['username'])
+                data['email'] = Account.objects.normalize_email(data['email'])
+                valid.append((index, data))
+            else:
+                self.add_error(index, serializer.errors)
+
+        valid = self.check_uniqueness(valid)
+        passwords = hashing_pool.make_passwords([data['password'] for _, data in valid])
+        accounts = [
+            (index, AccountSerializer.build_account({**data, 'password': password}))
+            for (index, data), password in zip(valid, passwords)
+        ]
+        if accounts:
+            self.save(accounts)
+        self.results[first_row:] = sorted(
+            self.results[first_row:], key=lambda result: result['row']
+        )
+
+    def check_uniqueness(self, valid: list) -> list:
+        usernames = {data['username'] for _, data in valid}
+        emails = {data['email'] for _, data in valid}
+        taken_usernames, taken_emails = set(), set()
+        for username, email in Account.objects.filter(
+            Q(username__in=usernames) | Q(email__in=emails)
+        ).values_list('username', 'email'):
+            taken_usernames.add(username)
+            taken_emails.add(email)
+
+        unique = []
+        for index, data in valid:
+            errors = {}
+            if data['username'] in taken_usernames or data['username'] in self.seen_usernames:
+                errors['username'] = [USERNAME_TAKEN]
+            if data['email'] in taken_emails or data['email'] in self.seen_emails:
+                errors['email'] = [EMAIL_TAKEN]
+            if errors:
+                self.add_error(index, errors)
+            else:
+                # only rows that will be created reserve their username and email
+                self.seen_usernames.add(data['username'])
+                self.seen_emails.add(data['email'])
+                unique.append((index, data))
+        return unique
+
+    def save(self, accounts: list) -> None:
+        try:
+            with transaction.atomic():
+                Account.objects.bulk_create([account for _, account in accounts])
+        except IntegrityError:
+            # a concurrent sign-up took a username or email since the check
+            for index, account in accounts:
+                try:
+                    with transaction.atomic():
+                        account.save(force_insert=True)
+                except IntegrityError:
+                    self.add_error(index, {'non_field_errors': [ACCOUNT_TAKEN]})
+                else:
+                    self.add_created(index, account)
+        else:
+            for index, account in accounts:
+                self.add_created(index, account)
+
+    def add_created(self, index: int, account: Account) -> None:
+        self.created += 1
+        self.results.append({
+            'row': index,
+            'status': 'created',
+            'account': AccountSerializer(account).data,
+        })
+
+    def add_error(self, index: int, errors: dict) -> None:
+        self.failed += 1
+        self.results.append({'row': index, 'status': 'error', 'errors': errors})
+
+    def report(self) -> dict:
+        return {'created': self.created, 'failed': self.failed, 'results': self.results}
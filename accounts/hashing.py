@@ -0,0 +1,112 @@
+import asyncio
+import multiprocessing
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class HashingPoolFull(Exception):
+    pass
+
+
+def _setup_worker() -> None:
+    import django
+    django.setup()
+
+
+class HashingPool:
+    """
+    Runs password hashing in a process pool so async views never spend CPU
+    on PBKDF2 in the event loop. At most `max_concurrency` hashes run at
+    once; callers beyond that wait, and once `max_queue` callers are waiting
+    new ones are rejected with HashingPoolFull.
+    """
+    def __init__(self, max_workers: int, max_concurrency: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.waiting = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_setup_worker,
+                )
+            return self._executor
+
+    def get_semaphore(self, loop) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def run(self, func, *args):
+        if self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise HashingPoolFull()
+
+        loop = asyncio.get_running_loop()
+        semaphore = self.get_semaphore(loop)
+        self.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.in_flight += 1
+        try:
+            return await loop.run_in_executor(self.get_executor(), func, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            semaphore.release()
+
+    async def make_password(self, password: str) -> str:
+        return await self.run(hashers.make_password, password)
+
+    async def check_password(self, password: str, encoded: str) -> bool:
+        return await self.run(hashers.check_password, password, encoded)
+
+    def make_passwords(self, passwords: list) -> list:
+        # blocking variant for batch jobs, spreads the list over every worker
+        if not passwords:
+            return []
+        chunksize = max(1, len(passwords) // (self.max_workers * 4))
+        return list(self.get_executor().map(
+            hashers.make_password, passwords, chunksize=chunksize
+        ))
+
+    def stats(self) -> dict:
+        return {
+            'max_workers': self.max_workers,
+            'max_concurrency': self.max_concurrency,
+            'max_queue': self.max_queue,
+            'queue_depth': self.waiting,
+            'in_flight': self.in_flight,
+            'completed': self.completed,
+            'rejected': self.rejected,
+        }
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+hashing_pool = HashingPool(
+    max_workers=settings.PASSWORD_HASHING_POOL['MAX_WORKERS'],
+    max_concurrency=settings.PASSWORD_HASHING_POOL['MAX_CONCURRENCY'],
+    max_queue=settings.PASSWORD_HASHING_POOL['MAX_QUEUE'],
+)
@@ -1,8 +1,14 @@
 from rest_framework import serializers
-from rest_framework.validators import UniqueValidator
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from _core.serializers import UniqueConstraintErrorsMixin
 from .models import Account
 
-class AccountSerializer(serializers.ModelSerializer):
+class AccountSerializer(UniqueConstraintErrorsMixin, serializers.ModelSerializer):
+    unique_error_messages = {
+        'username': 'A user with that username already exists.',
+        'email': 'user with this email already exists.',
+    }
+
     class Meta: 
         model = Account
         fields = [
@@ -14,29 +20,44 @@ class AccountSerializer(serializers.ModelSerializer):
         ]
         extra_kwargs = {
             'password': {'write_only': True},
-            'username': {
-                'validators': [
-                    UniqueValidator(
-                        queryset=Account.objects.all(),
-                        message='A user with that username already exists.'
-                    )
-                ]
-            },
-            'email': {
-                'validators': [
-                    UniqueValidator(
-                        queryset=Account.objects.all(),
-                        message='user with this email already exists.'
-                    )
-                ]
-            }
-            
+            'username': {'validators': []},
+            'email': {'validators': []},
         }
+
     def create(self, validated_data : dict) -> Account:
-        if validated_data['is_superuser'] == True:
-            instance = Account.objects.create_superuser(**validated_data)
-        else:
-            instance = Account.objects.create_user(**validated_data)
+        with self.unique_errors(validated_data):
+            if self.context.get('password_is_hashed'):
+                return self.create_with_password_hash(validated_data)
+            if validated_data['is_superuser'] == True:
+                instance = Account.objects.create_superuser(**validated_data)
+            else:
+                instance = Account.objects.create_user(**validated_data)
+            return instance
+
+    def create_with_password_hash(self, validated_data : dict) -> Account:
+        instance = self.build_account(validated_data)
+        instance.save(force_insert=True)
         return instance
-    
-    
\ No newline at end of file
+
+    @staticmethod
+    def build_account(validated_data : dict) -> Account:
+        # same fields as create_user/create_superuser, with the password hash
+        # computed by the caller (see accounts.async_views and bulk_import)
+        validated_data['username'] = Account.normalize_username(
+            validated_data['username']
+        )
+        validated_data['email'] = Account.objects.normalize_email(
+            validated_data['email']
+        )
+        return Account(
+            **validated_data, is_staff=validated_data.get('is_superuser', False)
+        )
+
+
+class AccountTokenObtainPairSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user: Account):
+        token = super().get_token(user)
+        token['username'] = user.username
+        token['is_superuser'] = user.is_superuser
+        return token
@@ -0,0 +1,9 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .authentication import user_cache
+from .models import Account
+
+
+@receiver([post_save, post_delete], sender=Account)
+def invalidate_cached_user(sender, instance: Account, **kwargs) -> None:
+    user_cache.delete(str(instance.pk))
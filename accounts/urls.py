@@ -1,8 +1,11 @@
 from django.urls import path
-from .views import AccountView
+from .views import AccountView, AccountImportView, HashingStatsView
 from rest_framework_simplejwt import views as jwt_views
+from _core.middleware import compression_exempt
 
 urlpatterns = [
     path('accounts/', AccountView.as_view()),
-    path('login/', jwt_views.TokenObtainPairView.as_view()),
-]
\ No newline at end of file
+    path('accounts/import/', AccountImportView.as_view()),
+    path('accounts/hashing/stats/', HashingStatsView.as_view()),
+    path('login/', compression_exempt(jwt_views.TokenObtainPairView.as_view())),
+]
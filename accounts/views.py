@@ -1,7 +1,47 @@
+import csv
+import io
 from .models import Account
 from .serializers import AccountSerializer
+from .hashing import hashing_pool
+from .bulk_import import AccountImporter, iter_csv_rows, iter_json_array
+from courses.permissions import isAdm
+from rest_framework import status
+from rest_framework.exceptions import UnsupportedMediaType
 from rest_framework.generics import CreateAPIView
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from _core.views import ProfiledViewMixin
 
-class AccountView(CreateAPIView):
+class AccountView(ProfiledViewMixin, CreateAPIView):
     queryset = Account.objects.all()
-    serializer_class = AccountSerializer
\ No newline at end of file
+    serializer_class = AccountSerializer
+
+
+class HashingStatsView(ProfiledViewMixin, APIView):
+    permission_classes = [isAdm]
+
+    def get(self, request):
+        return Response(hashing_pool.stats())
+
+
+class AccountImportView(ProfiledViewMixin, APIView):
+    permission_classes = [isAdm]
+
+    def post(self, request):
+        content_type = request.content_type.split(';')[0].strip()
+        if content_type == 'text/csv':
+            rows = iter_csv_rows(request.stream or [])
+        elif content_type == 'application/json':
+            rows = iter_json_array(request.stream or io.BytesIO())
+        else:
+            raise UnsupportedMediaType(content_type)
+
+        importer = AccountImporter()
+        try:
+            importer.run(rows)
+        except (ValueError, csv.Error) as error:
+            return Response(
+                {'detail': f'Parse error - {error}', **importer.report()},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(importer.report())
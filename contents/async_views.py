@@ -0,0 +1,37 @@
+from django.db.models import F
+from rest_framework.permissions import IsAuthenticated
+from _core.async_views import AsyncAPIView
+from courses.mixins import CourseVersionETagMixin
+from .mixins import ContentLookupMixin
+from .permissions import isStudentOrAdm
+from .serializers import ContentSerializer
+from .views import ContentDetail
+
+
+class AsyncContentDetail(ContentLookupMixin, CourseVersionETagMixin, AsyncAPIView):
+    permission_classes = [IsAuthenticated, isStudentOrAdm]
+    serializer_class = ContentSerializer
+    sync_view = ContentDetail
+
+    async def aget(self, request, course_id, content_id):
+        return await self.aretrieve(request)
+
+    async def aget_course_version(self):
+        row = await self.get_content_queryset().values(*self.get_version_fields()).afirst()
+        if row is None:
+            await self.araise_not_found()
+
+        self.remember_enrollment(row.get('user_is_enrolled'))
+        await self.acheck_object_permissions(self.request, self.get_permission_object())
+        return row['course__version']
+
+    async def aget_representation(self) -> tuple:
+        content = await self.get_content_queryset().annotate(
+            course_version=F('course__version')
+        ).afirst()
+        if content is None:
+            await self.araise_not_found()
+
+        self.remember_enrollment(getattr(content, 'user_is_enrolled', None))
+        await self.acheck_object_permissions(self.request, content)
+        return self.get_serializer(content).data, content.course_version
@@ -0,0 +1,84 @@
+from django.db import migrations
+
+POSTGRESQL_FORWARD = [
+    """
+    ALTER TABLE contents_content ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(content, '')), 'B')
+    ) STORED
+    """,
+    'CREATE INDEX contents_content_search_vector_idx '
+    'ON contents_content USING GIN (search_vector)',
+]
+
+POSTGRESQL_BACKWARD = [
+    'DROP INDEX IF EXISTS contents_content_search_vector_idx',
+    'ALTER TABLE contents_content DROP COLUMN IF EXISTS search_vector',
+]
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE contents_content_fts USING fts5(
+        name, content, content='contents_content', content_rowid='rowid'
+    )
+    """,
+    """
+    CREATE TRIGGER contents_content_fts_insert AFTER INSERT ON contents_content BEGIN
+        INSERT INTO contents_content_fts(rowid, name, content)
+        VALUES (new.rowid, new.name, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER contents_content_fts_delete AFTER DELETE ON contents_content BEGIN
+        INSERT INTO contents_content_fts(contents_content_fts, rowid, name, content)
+        VALUES ('delete', old.rowid, old.name, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER contents_content_fts_update AFTER UPDATE ON contents_content BEGIN
+        INSERT INTO contents_content_fts(contents_content_fts, rowid, name, content)
+        VALUES ('delete', old.rowid, old.name, old.content);
+        INSERT INTO contents_content_fts(rowid, name, content)
+        VALUES (new.rowid, new.name, new.content);
+    END
+    """,
+    "INSERT INTO contents_content_fts(contents_content_fts) VALUES ('rebuild')",
+]
+
+SQLITE_BACKWARD = [
+    'DROP TRIGGER IF EXISTS contents_content_fts_insert',
+    'DROP TRIGGER IF EXISTS contents_content_fts_delete',
+    'DROP TRIGGER IF EXISTS contents_content_fts_update',
+    'DROP TABLE IF EXISTS contents_content_fts',
+]
+
+
+def run_statements(schema_editor, statements: dict) -> None:
+    for sql in statements.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+def create_search_index(apps, schema_editor):
+    run_statements(schema_editor, {
+        'postgresql': POSTGRESQL_FORWARD,
+        'sqlite': SQLITE_FORWARD,
+    })
+
+
+def drop_search_index(apps, schema_editor):
+    run_statements(schema_editor, {
+        'postgresql': POSTGRESQL_BACKWARD,
+        'sqlite': SQLITE_BACKWARD,
+    })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0002_alter_content_video_url'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
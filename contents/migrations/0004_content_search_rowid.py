@@ -0,0 +1,108 @@
+from django.db import migrations
+
+# Rekeys the SQLite FTS5 table of 0003 on a stored integer column: the
+# implicit rowid of a table with a UUID primary key may be renumbered by
+# VACUUM, which would point the index at the wrong contents. The column is
+# not a model field, so a table rebuild by a later AlterField on Content
+# must recreate it, its index and the triggers.
+SQLITE_FORWARD = [
+    'DROP TRIGGER IF EXISTS contents_content_fts_insert',
+    'DROP TRIGGER IF EXISTS contents_content_fts_delete',
+    'DROP TRIGGER IF EXISTS contents_content_fts_update',
+    'DROP TABLE IF EXISTS contents_content_fts',
+    'ALTER TABLE contents_content ADD COLUMN search_rowid INTEGER',
+    'UPDATE contents_content SET search_rowid = rowid',
+    'CREATE UNIQUE INDEX contents_content_search_rowid_idx '
+    'ON contents_content (search_rowid)',
+    """
+    CREATE VIRTUAL TABLE contents_content_fts USING fts5(
+        name, content, content='contents_content', content_rowid='search_rowid'
+    )
+    """,
+    """
+    CREATE TRIGGER contents_content_fts_insert AFTER INSERT ON contents_content BEGIN
+        UPDATE contents_content SET search_rowid = (
+            SELECT coalesce(max(search_rowid), 0) + 1 FROM contents_content
+        ) WHERE rowid = new.rowid;
+        INSERT INTO contents_content_fts(rowid, name, content)
+        SELECT search_rowid, name, content FROM contents_content WHERE rowid = new.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER contents_content_fts_delete AFTER DELETE ON contents_content BEGIN
+        INSERT INTO contents_content_fts(contents_content_fts, rowid, name, content)
+        VALUES ('delete', old.search_rowid, old.name, old.content);
+    END
+    """,
+    # OF name, content: the search_rowid UPDATE above must not fire it
+    """
+    CREATE TRIGGER contents_content_fts_update
+    AFTER UPDATE OF name, content ON contents_content BEGIN
+        INSERT INTO contents_content_fts(contents_content_fts, rowid, name, content)
+        VALUES ('delete', old.search_rowid, old.name, old.content);
+        INSERT INTO contents_content_fts(rowid, name, content)
+        VALUES (new.search_rowid, new.name, new.content);
+    END
+    """,
+    "INSERT INTO contents_content_fts(contents_content_fts) VALUES ('rebuild')",
+]
+
+SQLITE_BACKWARD = [
+    'DROP TRIGGER IF EXISTS contents_content_fts_insert',
+    'DROP TRIGGER IF EXISTS contents_content_fts_delete',
+    'DROP TRIGGER IF EXISTS contents_content_fts_update',
+    'DROP TABLE IF EXISTS contents_content_fts',
+    'DROP INDEX IF EXISTS contents_content_search_rowid_idx',
+    'ALTER TABLE contents_content DROP COLUMN search_rowid',
+    """
+    CREATE VIRTUAL TABLE contents_content_fts USING fts5(
+        name, content, content='contents_content', content_rowid='rowid'
+    )
+    """,
+    """
+    CREATE TRIGGER contents_content_fts_insert AFTER INSERT ON contents_content BEGIN
+        INSERT INTO contents_content_fts(rowid, name, content)
+        VALUES (new.rowid, new.name, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER contents_content_fts_delete AFTER DELETE ON contents_content BEGIN
+        INSERT INTO contents_content_fts(contents_content_fts, rowid, name, content)
+        VALUES ('delete', old.rowid, old.name, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER contents_content_fts_update AFTER UPDATE ON contents_content BEGIN
+        INSERT INTO contents_content_fts(contents_content_fts, rowid, name, content)
+        VALUES ('delete', old.rowid, old.name, old.content);
+        INSERT INTO contents_content_fts(rowid, name, content)
+        VALUES (new.rowid, new.name, new.content);
+    END
+    """,
+    "INSERT INTO contents_content_fts(contents_content_fts) VALUES ('rebuild')",
+]
+
+
+def run_statements(schema_editor, statements: list) -> None:
+    if schema_editor.connection.vendor == 'sqlite':
+        for sql in statements:
+            schema_editor.execute(sql)
+
+
+def rekey_search_index(apps, schema_editor):
+    run_statements(schema_editor, SQLITE_FORWARD)
+
+
+def restore_search_index(apps, schema_editor):
+    run_statements(schema_editor, SQLITE_BACKWARD)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0003_content_search'),
+    ]
+
+    operations = [
+        migrations.RunPython(rekey_search_index, restore_search_index),
+    ]
@@ -0,0 +1,95 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+# Declares the search_rowid column of 0004 on the model, so a table rebuild
+# by a later AlterField on Content keeps it; the rebuild still drops the
+# triggers, which must then be created again. Saves of an instance that
+# was never read back write NULL into the column: the triggers keep the
+# old key instead.
+SQLITE_FORWARD = [
+    'DROP TRIGGER IF EXISTS contents_content_fts_update',
+    # OF name, content: the search_rowid UPDATEs must not fire it
+    """
+    CREATE TRIGGER contents_content_fts_update
+    AFTER UPDATE OF name, content ON contents_content BEGIN
+        INSERT INTO contents_content_fts(contents_content_fts, rowid, name, content)
+        VALUES ('delete', old.search_rowid, old.name, old.content);
+        INSERT INTO contents_content_fts(rowid, name, content)
+        VALUES (coalesce(new.search_rowid, old.search_rowid), new.name, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER contents_content_search_rowid_keep
+    AFTER UPDATE OF search_rowid ON contents_content
+    WHEN new.search_rowid IS NULL BEGIN
+        UPDATE contents_content SET search_rowid = old.search_rowid
+        WHERE rowid = new.rowid;
+    END
+    """,
+]
+
+SQLITE_BACKWARD = [
+    'DROP TRIGGER IF EXISTS contents_content_search_rowid_keep',
+    'DROP TRIGGER IF EXISTS contents_content_fts_update',
+    """
+    CREATE TRIGGER contents_content_fts_update
+    AFTER UPDATE OF name, content ON contents_content BEGIN
+        INSERT INTO contents_content_fts(contents_content_fts, rowid, name, content)
+        VALUES ('delete', old.search_rowid, old.name, old.content);
+        INSERT INTO contents_content_fts(rowid, name, content)
+        VALUES (new.search_rowid, new.name, new.content);
+    END
+    """,
+]
+
+
+class AddFieldExceptOnSqlite(migrations.AddField):
+    # SQLite has the column, its unique index and its triggers since 0004
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != 'sqlite':
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != 'sqlite':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+def run_statements(schema_editor, statements: list) -> None:
+    if schema_editor.connection.vendor == 'sqlite':
+        for sql in statements:
+            schema_editor.execute(sql)
+
+
+def keep_search_rowid(apps, schema_editor):
+    run_statements(schema_editor, SQLITE_FORWARD)
+
+
+def drop_keep_trigger(apps, schema_editor):
+    run_statements(schema_editor, SQLITE_BACKWARD)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0004_content_search_rowid'),
+    ]
+
+    operations = [
+        AddFieldExceptOnSqlite(
+            model_name='content',
+            name='search_rowid',
+            field=models.BigIntegerField(editable=False, null=True, unique=True),
+        ),
+        migrations.RunPython(keep_search_rowid, drop_keep_trigger),
+        migrations.CreateModel(
+            name='ContentSearchIndex',
+            fields=[
+                ('content', models.OneToOneField(db_column='rowid', db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_index', serialize=False, to='contents.content', to_field='search_rowid')),
+            ],
+            options={
+                'db_table': 'contents_content_fts',
+                'managed': False,
+            },
+        ),
+    ]
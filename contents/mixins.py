@@ -0,0 +1,49 @@
+from django.db.models import Exists, OuterRef
+from rest_framework.exceptions import NotFound
+from courses.models import Course
+from students_courses.models import StudentCourse
+from students_courses.permissions import get_enrollments
+from .models import Content
+
+
+class ContentLookupMixin:
+    """
+    Reads the content in the URL with one query that also tells whether the
+    caller is enrolled in its course; the answer seeds the enrollment memo
+    used by the object permissions.
+    """
+    def get_content_queryset(self):
+        course_id = self.kwargs['course_id']
+        queryset = Content.objects.filter(
+            pk=self.kwargs['content_id'], course_id=course_id
+        )
+        if not self.request.user.is_superuser:
+            queryset = queryset.annotate(user_is_enrolled=Exists(
+                StudentCourse.objects.filter(
+                    course_id=OuterRef('course_id'), student_id=self.request.user.pk
+                )
+            ))
+        return queryset
+
+    def get_version_fields(self) -> list:
+        fields = ['course__version']
+        if not self.request.user.is_superuser:
+            fields.append('user_is_enrolled')
+        return fields
+
+    def get_permission_object(self) -> Content:
+        return Content(pk=self.kwargs['content_id'], course_id=self.kwargs['course_id'])
+
+    def remember_enrollment(self, user_is_enrolled):
+        if user_is_enrolled is not None:
+            get_enrollments(self.request)[str(self.kwargs['course_id'])] = user_is_enrolled
+
+    def raise_not_found(self):
+        if not Course.objects.filter(pk=self.kwargs['course_id']).exists():
+            raise NotFound({'detail': 'course not found.'})
+        raise NotFound({'detail': 'content not found.'})
+
+    async def araise_not_found(self):
+        if not await Course.objects.filter(pk=self.kwargs['course_id']).aexists():
+            raise NotFound({'detail': 'course not found.'})
+        raise NotFound({'detail': 'content not found.'})
@@ -12,6 +12,27 @@ class Content(models.Model):
         related_name='contents'
     )
 
-    
+    # key of the SQLite full-text index, assigned by the triggers of the
+    # 0004 and 0005 migrations, which also keep it when a save writes NULL;
+    # unused on PostgreSQL
+    search_rowid = models.BigIntegerField(null=True, unique=True, editable=False)
 
 
+class ContentSearchIndex(models.Model):
+    """
+    The SQLite FTS5 table over the contents, see contents.search. Its rowid
+    is the `search_rowid` of the indexed content. Read only.
+    """
+    content = models.OneToOneField(
+        Content,
+        on_delete=models.DO_NOTHING,
+        to_field='search_rowid',
+        db_column='rowid',
+        db_constraint=False,
+        primary_key=True,
+        related_name='search_index'
+    )
+
+    class Meta:
+        managed = False
+        db_table = 'contents_content_fts'
@@ -1,5 +1,6 @@
 from rest_framework import permissions
 from rest_framework.views import View
+from students_courses.permissions import ais_enrolled, is_enrolled
 from .models import Content
 
 
@@ -9,5 +10,12 @@ class isStudentOrAdm(permissions.BasePermission):
         return (
             request.user.is_superuser or
             request.method in permissions.SAFE_METHODS
-            and request.user in obj.course.students.all()
-        )
\ No newline at end of file
+            and is_enrolled(request, obj.course_id)
+        )
+
+    async def ahas_object_permission(self, request, view: View, obj: Content):
+        return (
+            request.user.is_superuser or
+            request.method in permissions.SAFE_METHODS
+            and await ais_enrolled(request, obj.course_id)
+        )
@@ -0,0 +1,66 @@
+import re
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Q, QuerySet, Value
+from django.db.models.expressions import RawSQL
+
+# name matches weigh more than matches in the lesson text
+NAME_WEIGHT = 10.0
+CONTENT_WEIGHT = 1.0
+
+
+def get_terms(query: str) -> list:
+    return re.findall(r'\w+', query.lower())
+
+
+def search_contents(queryset: QuerySet, query: str) -> QuerySet:
+    """
+    Filter `queryset` to the contents matching every word of `query` and
+    annotate them with `rank`, higher meaning more relevant. PostgreSQL reads
+    the GIN indexed `search_vector` column and SQLite the FTS5 table of
+    ContentSearchIndex; other backends fall back to icontains.
+
+    `rank` is a double on every backend, so the value a search cursor
+    carries compares equal to the one computed for the next page.
+    """
+    terms = get_terms(query)
+    if not terms:
+        return queryset.none()
+
+    vendor = connections[queryset.db].vendor
+    if vendor == 'postgresql':
+        return search_postgresql(queryset, terms)
+    if vendor == 'sqlite':
+        return search_sqlite(queryset, terms)
+
+    condition = Q()
+    for term in terms:
+        condition &= Q(name__icontains=term) | Q(content__icontains=term)
+    return queryset.filter(condition).annotate(rank=Value(0.0, output_field=FloatField()))
+
+
+def search_postgresql(queryset: QuerySet, terms: list) -> QuerySet:
+    tsquery = ' & '.join(terms)
+    return queryset.filter(RawSQL(
+        '"contents_content"."search_vector" @@ to_tsquery(\'simple\', %s)',
+        [tsquery], output_field=BooleanField(),
+    )).annotate(rank=RawSQL(
+        # weights are listed for the D, C, B and A labels; ts_rank returns
+        # a float4, which would not compare equal to the cursor's double
+        'ts_rank(ARRAY[0, 0, %s, %s]::float4[], "contents_content"."search_vector", '
+        'to_tsquery(\'simple\', %s))::float8',
+        [CONTENT_WEIGHT / NAME_WEIGHT, 1.0, tsquery], output_field=FloatField(),
+    ))
+
+
+def search_sqlite(queryset: QuerySet, terms: list) -> QuerySet:
+    # every term quoted, so FTS5 operators in the input are plain words
+    match = ' '.join(f'"{term}"' for term in terms)
+    # the index is joined once through ContentSearchIndex, so MATCH runs a
+    # single time and bm25 reads the matched rows
+    return queryset.filter(search_index__isnull=False).filter(RawSQL(
+        '"contents_content_fts" MATCH %s', [match], output_field=BooleanField(),
+    )).annotate(rank=RawSQL(
+        # bm25 is lower for better matches
+        '-bm25("contents_content_fts", %s, %s)',
+        [NAME_WEIGHT, CONTENT_WEIGHT], output_field=FloatField(),
+    ))
@@ -1,9 +1,33 @@
+from django.db import transaction
 from rest_framework import serializers
+from _core.serializers import SparseFieldsetMixin
+from courses.models import Course
 from .models import Content
 
-class ContentSerializer(serializers.ModelSerializer):
+
+class ContentListSerializer(serializers.ListSerializer):
+    def create(self, validated_data: list) -> list:
+        with transaction.atomic():
+            contents = Content.objects.bulk_create(
+                [Content(**item) for item in validated_data]
+            )
+            # bulk_create sends no post_save, so bump the course version here
+            Course.objects.filter(
+                pk__in={content.course_id for content in contents}
+            ).bump_version()
+        return contents
+
+
+class ContentSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    class Meta:
+        model = Content
+        exclude=['course', 'search_rowid']
+        list_serializer_class = ContentListSerializer
+
+
+class ContentSearchSerializer(serializers.ModelSerializer):
+    rank = serializers.FloatField(read_only=True)
+
     class Meta:
         model = Content
-        exclude=['course']
-    
-    
\ No newline at end of file
+        fields = ['id', 'name', 'video_url', 'course', 'rank']
@@ -1,7 +1,8 @@
 from django.urls import path
-from .views import ContentCreate, ContentDetail
+from .views import ContentCreate, ContentDetail, ContentSearch
 
 urlpatterns = [
+    path('contents/search/', ContentSearch.as_view()),
     path('courses/<course_id>/contents/', ContentCreate.as_view()),
     path('courses/<course_id>/contents/<content_id>/', ContentDetail.as_view()),
 ]
\ No newline at end of file
@@ -1,47 +1,96 @@
-from django.shortcuts import get_object_or_404
-from rest_framework.generics import CreateAPIView, RetrieveUpdateDestroyAPIView
+from django.db.models import F
+from rest_framework.generics import (
+    CreateAPIView, ListAPIView, RetrieveUpdateDestroyAPIView,
+)
 
 from courses.models import Course
-from .serializers import ContentSerializer
+from .serializers import ContentSearchSerializer, ContentSerializer
+from .search import search_contents
 from .models import Content
 from .permissions import isStudentOrAdm
+from .mixins import ContentLookupMixin
+from students_courses.permissions import is_enrolled
 from courses.permissions import isAdmOrOwner
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from courses.mixins import CourseVersionETagMixin
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import NotFound, ValidationError
+from _core.pagination import SearchPagination
+from _core.views import ProfiledViewMixin
 
 
-class ContentCreate(CreateAPIView):
-    authentication_classes=[JWTAuthentication]
+class ContentCreate(ProfiledViewMixin, CreateAPIView):
     permission_classes=[isAdmOrOwner]
 
     queryset = Content.objects.all()
     serializer_class = ContentSerializer
+    max_bulk_items = 1000
+
+    def get_serializer(self, *args, **kwargs):
+        # a JSON array creates every item in one bulk insert
+        if isinstance(kwargs.get('data'), list):
+            kwargs['many'] = True
+            kwargs['max_length'] = self.max_bulk_items
+        return super().get_serializer(*args, **kwargs)
+
     def perform_create(self, serializer):
         id=self.kwargs['course_id']
+        if not Course.objects.filter(pk=id).exists():
+            raise NotFound({'detail': 'course not found.'})
         serializer.save(course_id=id)
-        
 
 
-class ContentDetail(RetrieveUpdateDestroyAPIView):
-    authentication_classes=[JWTAuthentication]
+class ContentDetail(
+    ContentLookupMixin, CourseVersionETagMixin, ProfiledViewMixin,
+    RetrieveUpdateDestroyAPIView,
+):
     permission_classes=[IsAuthenticated, isStudentOrAdm]
     queryset = Content.objects.all()
     serializer_class = ContentSerializer
     lookup_url_kwarg = 'content_id'
 
     def get_queryset(self):
-        if self.request.user.is_superuser:
-            return Content.objects.all()
-        return Content.objects.filter(course__contents=self.kwargs['content_id'])
+        course_id = self.kwargs['course_id']
+        queryset = Content.objects.filter(course_id=course_id)
+        if self.request.user.is_superuser or is_enrolled(self.request, course_id):
+            return queryset
+        return queryset.none()
 
     def get_object(self):
-        try:
-            Course.objects.get(pk=self.kwargs['course_id'])
-            content = Content.objects.get(pk=self.kwargs['content_id'])
-            self.check_object_permissions(self.request, content)
-            return content
-        except Course.DoesNotExist:
-            raise NotFound({'detail': 'course not found.'})
-        except Content.DoesNotExist:
-            raise NotFound({'detail': 'content not found.'})
\ No newline at end of file
+        content = self.get_content_queryset().annotate(
+            course_version=F('course__version')
+        ).first()
+        if content is None:
+            self.raise_not_found()
+
+        self.remember_enrollment(getattr(content, 'user_is_enrolled', None))
+        self.check_object_permissions(self.request, content)
+        return content
+
+    def get_course_version(self):
+        row = self.get_content_queryset().values(*self.get_version_fields()).first()
+        if row is None:
+            self.raise_not_found()
+
+        self.remember_enrollment(row.get('user_is_enrolled'))
+        self.check_object_permissions(self.request, self.get_permission_object())
+        return row['course__version']
+
+    def get_object_version(self, instance: Content) -> int:
+        return instance.course_version
+
+
+class ContentSearch(ProfiledViewMixin, ListAPIView):
+    permission_classes=[IsAuthenticated]
+    serializer_class = ContentSearchSerializer
+    pagination_class = SearchPagination
+    search_query_param = 'q'
+
+    def get_queryset(self):
+        query = self.request.query_params.get(self.search_query_param, '').strip()
+        if not query:
+            raise ValidationError({self.search_query_param: ['This field is required.']})
+
+        queryset = Content.objects.only('id', 'name', 'video_url', 'course_id')
+        if not self.request.user.is_superuser:
+            queryset = queryset.filter(course__students=self.request.user.pk)
+        return search_contents(queryset, query)
@@ -0,0 +1,64 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from rest_framework.response import Response
+from _core.async_views import AsyncAPIView
+from _core.pagination import KeysetPagination
+from .mixins import CourseFieldsetMixin, CourseVersionETagMixin
+from .models import Course
+from .permissions import isAdmOrOwner
+from .serializers import CourseSerializer
+from .views import CourseDetailView, CourseView
+
+
+class AsyncCourseView(CourseFieldsetMixin, AsyncAPIView):
+    permission_classes = [isAdmOrOwner]
+    serializer_class = CourseSerializer
+    pagination_class = KeysetPagination
+    sync_view = CourseView
+
+    async def aget(self, request):
+        if not settings.API_COMPILED_READS:
+            return await sync_to_async(self.list)(request)
+
+        compiled = self.get_compiled_serializer()
+        ordering = [field.lstrip('-') for field in self.paginator.ordering]
+        rows = await self.paginator.apaginate_queryset(
+            compiled.values(Course.objects.visible_to(request.user), *ordering), request
+        )
+        data = await compiled.aserialize(rows)
+        return Response(data, headers=self.paginator.get_paginated_headers())
+
+    def list(self, request):
+        # ModelSerializer path, as CourseView serves it
+        courses = self.paginator.paginate_queryset(
+            self.get_course_queryset().visible_to(request.user), request, self
+        )
+        data = self.get_serializer(courses, many=True).data
+        return Response(data, headers=self.paginator.get_paginated_headers())
+
+
+class AsyncCourseDetailView(CourseFieldsetMixin, CourseVersionETagMixin, AsyncAPIView):
+    permission_classes = [isAdmOrOwner]
+    serializer_class = CourseSerializer
+    sync_view = CourseDetailView
+
+    async def aget(self, request, course_id):
+        return await self.aretrieve(request)
+
+    async def aget_representation(self) -> tuple:
+        if not settings.API_COMPILED_READS:
+            return await super().aget_representation()
+
+        compiled = self.get_compiled_serializer()
+        row = await compiled.values(
+            Course.objects.filter(pk=self.kwargs['course_id']), 'version'
+        ).afirst()
+        if row is None:
+            raise Http404
+        data = await compiled.aserialize([row])
+        return data[0], row['version']
+
+    def get_object(self):
+        return get_object_or_404(self.get_course_queryset(), id=self.kwargs['course_id'])
@@ -0,0 +1,130 @@
+import hashlib
+import json
+from asgiref.sync import sync_to_async
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+from _core.serializers import compile_serializer, parse_fieldset
+from .models import Course
+
+
+class CourseVersionETagMixin:
+    """
+    Retrieve with a strong ETag built from the course version counter and
+    `get_representation_key`, which tells apart the bodies one version can
+    have, e.g. different sparse fieldsets.
+
+    Conditional requests first run the cheap `get_course_version` lookup and
+    answer `304` without loading or serializing the object. Unconditional
+    requests read the version off the object returned by `get_object`.
+    The defaults suit views whose object is the course of `course_id`.
+    """
+    def get_course_version(self):
+        return self.get_version_queryset().first()
+
+    async def aget_course_version(self):
+        return await self.get_version_queryset().afirst()
+
+    def get_version_queryset(self):
+        return Course.objects.filter(
+            pk=self.kwargs['course_id']
+        ).values_list('version', flat=True)
+
+    def get_object_version(self, instance) -> int:
+        return instance.version
+
+    def get_representation_key(self) -> str:
+        return ''
+
+    def get_etag(self, version) -> str:
+        etag = f"{self.kwargs['course_id']}-{version}"
+        key = self.get_representation_key()
+        if key:
+            etag += '-' + hashlib.blake2s(key.encode(), digest_size=8).hexdigest()
+        return quote_etag(etag)
+
+    def retrieve(self, request, *args, **kwargs):
+        if 'HTTP_IF_NONE_MATCH' in request.META:
+            version = self.get_course_version()
+            if version is not None:
+                etag = self.get_etag(version)
+                not_modified = get_conditional_response(request, etag=etag)
+                if not_modified is not None:
+                    not_modified['ETag'] = etag
+                    return not_modified
+
+        data, version = self.get_representation()
+        return Response(data, headers={'ETag': self.get_etag(version)})
+
+    def get_representation(self) -> tuple:
+        instance = self.get_object()
+        return self.get_serializer(instance).data, self.get_object_version(instance)
+
+    async def aget_representation(self) -> tuple:
+        return await sync_to_async(self.get_representation)()
+
+    async def aretrieve(self, request):
+        # the same flow for AsyncAPIView; views override the async hooks
+        # with async ORM queries
+        if 'HTTP_IF_NONE_MATCH' in request.META:
+            version = await self.aget_course_version()
+            if version is not None:
+                etag = self.get_etag(version)
+                not_modified = get_conditional_response(request, etag=etag)
+                if not_modified is not None:
+                    not_modified['ETag'] = etag
+                    return not_modified
+
+        data, version = await self.aget_representation()
+        return Response(data, headers={'ETag': self.get_etag(version)})
+
+
+class CourseFieldsetMixin:
+    """
+    `?fields=` / `?omit=` on course reads, e.g. `?fields=name,start_date` or
+    `?omit=contents.content`. The serializer is trimmed and the queryset
+    only reads the columns and relations the trimmed serializer uses.
+    """
+    fields_query_param = 'fields'
+    omit_query_param = 'omit'
+
+    def get_fieldset(self) -> dict:
+        if self.request.method not in SAFE_METHODS:
+            return {}
+        params = self.request.query_params
+        return {
+            'fields': parse_fieldset(params.get(self.fields_query_param, '')),
+            'omit': parse_fieldset(params.get(self.omit_query_param, '')),
+        }
+
+    def get_serializer(self, *args, **kwargs):
+        for name, tree in self.get_fieldset().items():
+            kwargs.setdefault(name, tree)
+        return super().get_serializer(*args, **kwargs)
+
+    def get_fieldset_key(self) -> str:
+        return json.dumps(self.get_fieldset(), sort_keys=True)
+
+    def get_representation_key(self) -> str:
+        # the normalized fieldset, empty for the full representation
+        if not any(self.get_fieldset().values()):
+            return ''
+        return self.get_fieldset_key()
+
+    def get_compiled_serializer(self):
+        return compile_serializer(self.get_serializer_class(), self.get_fieldset_key())
+
+    def get_course_queryset(self):
+        serializer_fields = self.get_serializer().fields
+        fields = {field.source for field in serializer_fields.values()}
+        # the paginator reads its ordering off the last row of the page
+        fields.update(
+            field.lstrip('-') for field in getattr(self.paginator, 'ordering', ())
+        )
+        content_fields = None
+        if 'contents' in serializer_fields:
+            content_fields = {
+                field.source for field in serializer_fields['contents'].child.fields.values()
+            }
+        return Course.objects.for_representation(fields, content_fields)
@@ -1,4 +1,7 @@
 from django.db import models
+from django.db.models import F, Prefetch
+from django.contrib.auth import get_user_model
+from contents.models import Content
 import uuid
 
 class Course_Status(models.TextChoices):
@@ -7,6 +10,40 @@ class Course_Status(models.TextChoices):
     FINISHED = 'finished'
 
 
+class CourseQuerySet(models.QuerySet):
+    def with_contents_and_students(self):
+        return self.prefetch_related(
+            'contents',
+            Prefetch('students', queryset=get_user_model().objects.only('id'))
+        )
+
+    def visible_to(self, user):
+        if user.is_superuser:
+            return self
+        return self.filter(students=user.pk)
+
+    def for_representation(self, fields: set, content_fields: set = None):
+        """
+        Load only the columns and relations behind the given serializer
+        sources; `content_fields` limits the prefetched contents the same way.
+        """
+        relations = {'contents', 'students'}
+        queryset = self.only('version', *(set(fields) - relations))
+        if 'contents' in fields:
+            contents = Content.objects.all()
+            if content_fields is not None:
+                contents = contents.only('course', *content_fields)
+            queryset = queryset.prefetch_related(Prefetch('contents', queryset=contents))
+        if 'students' in fields:
+            queryset = queryset.prefetch_related(
+                Prefetch('students', queryset=get_user_model().objects.only('id'))
+            )
+        return queryset
+
+    def bump_version(self) -> int:
+        return self.update(version=F('version') + 1)
+
+
 class Course(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=100, unique=True)
@@ -29,4 +66,10 @@ class Course(models.Model):
         'accounts.Account',
         through='students_courses.StudentCourse',
         related_name='my_courses'
-    )
\ No newline at end of file
+    )
+
+    # bumped on every write to the course, its contents or its enrollments;
+    # used as the ETag of course and content reads
+    version = models.PositiveBigIntegerField(default=0, editable=False)
+
+    objects = CourseQuerySet.as_manager()
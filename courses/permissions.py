@@ -7,4 +7,8 @@ class isAdmOrOwner(permissions.BasePermission):
             request.user.is_superuser
             or request.method in permissions.SAFE_METHODS
         )
-    
+
+
+class isAdm(permissions.BasePermission):
+    def has_permission(self, request: Request, view: View) -> bool:
+        return request.user.is_superuser
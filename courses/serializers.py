@@ -1,9 +1,15 @@
 from contents.serializers import ContentSerializer
 from rest_framework import serializers
-from rest_framework.validators import UniqueValidator
+from _core.serializers import SparseFieldsetMixin, UniqueConstraintErrorsMixin
 from .models import Course
 
-class CourseSerializer(serializers.ModelSerializer):
+class CourseSerializer(
+    SparseFieldsetMixin, UniqueConstraintErrorsMixin, serializers.ModelSerializer
+):
+    unique_error_messages = {
+        'name': 'course with this name already exists.',
+    }
+
     contents = ContentSerializer(many=True, read_only=True)
     class Meta:
         model = Course
@@ -21,13 +27,14 @@ class CourseSerializer(serializers.ModelSerializer):
             'students_courses': {
                 'source': 'students'
             },
-            'name': {
-                'validators': [
-                    UniqueValidator(
-                        queryset=Course.objects.all(),
-                        message='course with this name already exists.'
-                    )
-                ]
-            }
+            'name': {'validators': []}
         }
 
+    def create(self, validated_data: dict) -> Course:
+        with self.unique_errors(validated_data):
+            return super().create(validated_data)
+
+    def update(self, instance: Course, validated_data: dict) -> Course:
+        with self.unique_errors(validated_data, instance):
+            return super().update(instance, validated_data)
+
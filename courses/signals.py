@@ -0,0 +1,31 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from contents.models import Content
+from students_courses.models import StudentCourse
+from .models import Course
+
+
+@receiver([post_save, post_delete], sender=Content)
+@receiver([post_save, post_delete], sender=StudentCourse)
+def bump_course_version(sender, instance, origin=None, **kwargs) -> None:
+    # rows cascading from a deleted course have nothing left to invalidate
+    if isinstance(origin, Course):
+        return
+    Course.objects.filter(pk=instance.course_id).bump_version()
+
+
+@receiver(post_save, sender=Course)
+def bump_version_on_update(sender, instance, created, raw=False, **kwargs) -> None:
+    # the saved instance keeps its old version, see refresh_from_db
+    if not created and not raw:
+        Course.objects.filter(pk=instance.pk).bump_version()
+
+
+@receiver(m2m_changed, sender=Course.students.through)
+def bump_course_version_on_enrollment(sender, instance, action, reverse, pk_set, **kwargs) -> None:
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        Course.objects.filter(pk=instance.pk).bump_version()
+    elif pk_set:
+        Course.objects.filter(pk__in=pk_set).bump_version()
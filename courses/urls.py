@@ -1,7 +1,8 @@
 from django.urls import path
-from .views import CourseView, CourseDetailView
+from .views import CourseView, CourseDetailView, CourseExportView
 
 urlpatterns = [
     path('courses/', CourseView.as_view()),
+    path('courses/export/', CourseExportView.as_view()),
     path('courses/<course_id>/', CourseDetailView.as_view()),
 ]
\ No newline at end of file
@@ -1,38 +1,81 @@
 from .models import Course
 from .serializers import CourseSerializer 
 from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView
-from .permissions import isAdmOrOwner
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework.views import APIView
+from .permissions import isAdmOrOwner, isAdm
+from .mixins import CourseFieldsetMixin, CourseVersionETagMixin
 from django.shortcuts import get_object_or_404
+from django.conf import settings
+from django.http import Http404, StreamingHttpResponse
+from _core.pagination import KeysetPagination
+from _core.views import ProfiledViewMixin
 
 
-class CourseView(ListCreateAPIView):
-    authentication_classes = [JWTAuthentication]
+class CourseView(CourseFieldsetMixin, ProfiledViewMixin, ListCreateAPIView):
     permission_classes = [isAdmOrOwner]
     serializer_class = CourseSerializer
+    pagination_class = KeysetPagination
+
     def get_queryset(self):
-        if self.request.user.is_superuser:
-            return Course.objects.all()
-        
-        return Course.objects.filter(students=self.request.user)
+        return self.get_course_queryset().visible_to(self.request.user)
+
+    def list(self, request, *args, **kwargs):
+        if not settings.API_COMPILED_READS:
+            return super().list(request, *args, **kwargs)
 
-class CourseDetailView(RetrieveUpdateDestroyAPIView):
-    authentication_classes = [JWTAuthentication]
+        compiled = self.get_compiled_serializer()
+        ordering = [field.lstrip('-') for field in self.paginator.ordering]
+        rows = self.paginate_queryset(
+            compiled.values(Course.objects.visible_to(request.user), *ordering)
+        )
+        return self.get_paginated_response(compiled.serialize(rows))
+
+class CourseDetailView(
+    CourseFieldsetMixin, CourseVersionETagMixin, ProfiledViewMixin,
+    RetrieveUpdateDestroyAPIView,
+):
     permission_classes = [isAdmOrOwner]
     serializer_class = CourseSerializer
     lookup_url_kwarg = 'course_id'
 
     def get_queryset(self):
-        if self.request.user.is_superuser:
-            return Course.objects.all() 
-        
-        return Course.objects.filter(students=self.request.user)
+        return self.get_course_queryset().visible_to(self.request.user)
     
     def get_object(self):
-        return get_object_or_404(Course, id=self.kwargs['course_id'])
+        return get_object_or_404(
+            self.get_course_queryset(),
+            id=self.kwargs['course_id']
+        )
+
+    def get_representation(self) -> tuple:
+        if not settings.API_COMPILED_READS:
+            return super().get_representation()
 
+        compiled = self.get_compiled_serializer()
+        row = compiled.values(
+            Course.objects.filter(pk=self.kwargs['course_id']), 'version'
+        ).first()
+        if row is None:
+            raise Http404
+        return compiled.serialize([row])[0], row['version']
 
-        
 
+class CourseExportView(ProfiledViewMixin, APIView):
+    permission_classes = [isAdm]
+    chunk_size = 2000
 
+    def get(self, request):
+        queryset = (
+            Course.objects.with_contents_and_students()
+            .order_by('start_date', 'id')
+            .iterator(chunk_size=self.chunk_size)
+        )
+        return StreamingHttpResponse(
+            self.stream_lines(queryset),
+            content_type='application/x-ndjson'
+        )
 
+    def stream_lines(self, courses):
+        renderer = self.get_renderers()[0]
+        for course in courses:
+            yield renderer.render(CourseSerializer(course).data) + b'\n'
@@ -0,0 +1,47 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import Http404
+from rest_framework.response import Response
+from _core.async_views import AsyncAPIView
+from _core.pagination import RosterPagination
+from _core.serializers import compile_serializer
+from courses.models import Course
+from .permissions import isStudent
+from .serializers import PutStudentsCoursesSerializer, StudentsCoursesSerializer
+from .views import StudentsCoursesView
+
+
+class AsyncStudentsCoursesView(AsyncAPIView):
+    permission_classes = [isStudent]
+    serializer_class = PutStudentsCoursesSerializer
+    pagination_class = RosterPagination
+    sync_view = StudentsCoursesView
+
+    async def aget(self, request, course_id):
+        course = await Course.objects.only('id', 'name').filter(pk=course_id).afirst()
+        if course is None:
+            raise Http404
+
+        serializer = self.get_serializer(course)
+        del serializer.fields['students_courses']
+        data = serializer.data
+        data['students_courses'] = await self.aget_roster(course)
+        return Response(data, headers=self.paginator.get_paginated_headers())
+
+    async def aget_roster(self, course: Course) -> list:
+        if not settings.API_COMPILED_READS:
+            return await sync_to_async(self.get_roster)(course)
+
+        compiled = compile_serializer(StudentsCoursesSerializer)
+        ordering = [field.lstrip('-') for field in self.paginator.ordering]
+        rows = await self.paginator.apaginate_queryset(
+            compiled.values(course.students_courses.all(), *ordering), self.request
+        )
+        return await compiled.aserialize(rows)
+
+    def get_roster(self, course: Course) -> list:
+        # ModelSerializer path, as StudentsCoursesView serves it
+        roster = self.paginator.paginate_queryset(
+            course.students_courses.select_related('student'), self.request, self
+        )
+        return StudentsCoursesSerializer(roster, many=True).data
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.6 on 2026-10-18 10:54
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count
+
+
+def remove_duplicate_enrollments(apps, schema_editor):
+    # keeps one row per (student, course), an accepted one when there is one
+    StudentCourse = apps.get_model('students_courses', 'StudentCourse')
+    enrollments = StudentCourse.objects.using(schema_editor.connection.alias)
+    duplicates = (
+        enrollments.values('student', 'course')
+        .annotate(count=Count('id'))
+        .filter(count__gt=1)
+    )
+    for duplicate in duplicates:
+        ids = list(
+            enrollments.filter(student=duplicate['student'], course=duplicate['course'])
+            .order_by('status', 'id')
+            .values_list('id', flat=True)
+        )
+        enrollments.filter(id__in=ids[1:]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0008_course_version'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('students_courses', '0003_alter_studentcourse_status'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            remove_duplicate_enrollments, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name='studentcourse',
+            constraint=models.UniqueConstraint(fields=('student', 'course'), name='unique_student_course'),
+        ),
+        migrations.AddIndex(
+            model_name='studentcourse',
+            index=models.Index(fields=['course', 'status'], name='enrollment_course_status_idx'),
+        ),
+        migrations.AlterField(
+            model_name='studentcourse',
+            name='course',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='students_courses', to='courses.course'),
+        ),
+        migrations.AlterField(
+            model_name='studentcourse',
+            name='student',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='students_courses', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
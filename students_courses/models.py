@@ -12,13 +12,26 @@ class StudentCourse(models.Model):
         choices=Students_Courses_Status.choices,
         default=Students_Courses_Status.PENDING
     )
+    # lookups by student or course use the composite indexes below
     student = models.ForeignKey(
         'accounts.Account',
         on_delete=models.CASCADE,
-        related_name='students_courses'
+        related_name='students_courses',
+        db_index=False
     )
     course = models.ForeignKey(
         'courses.Course',
         on_delete=models.CASCADE,
-        related_name='students_courses'
-    )
\ No newline at end of file
+        related_name='students_courses',
+        db_index=False
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['student', 'course'], name='unique_student_course'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['course', 'status'], name='enrollment_course_status_idx'),
+        ]
@@ -1,7 +1,39 @@
 from rest_framework import permissions
 from rest_framework.views import View
+from .models import StudentCourse
+
+
+def get_enrollments(request) -> dict:
+    enrollments = getattr(request, '_enrollments', None)
+    if enrollments is None:
+        enrollments = request._enrollments = {}
+    return enrollments
+
+
+def is_enrolled(request, course_id) -> bool:
+    """
+    Whether `request.user` is enrolled in the course, memoized on the request
+    so permissions and querysets of the same request share one lookup.
+    """
+    enrollments = get_enrollments(request)
+    key = str(course_id)
+    if key not in enrollments:
+        enrollments[key] = StudentCourse.objects.filter(
+            student_id=request.user.pk, course_id=course_id
+        ).exists()
+    return enrollments[key]
+
+
+async def ais_enrolled(request, course_id) -> bool:
+    enrollments = get_enrollments(request)
+    key = str(course_id)
+    if key not in enrollments:
+        enrollments[key] = await StudentCourse.objects.filter(
+            student_id=request.user.pk, course_id=course_id
+        ).aexists()
+    return enrollments[key]
 
 
 class isStudent(permissions.BasePermission):
     def has_permission(self, request, view: View):
-        return request.user.is_superuser
\ No newline at end of file
+        return request.user.is_superuser
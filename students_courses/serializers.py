@@ -1,3 +1,4 @@
+from django.db.models import Prefetch, prefetch_related_objects
 from rest_framework import serializers
 from .models import StudentCourse
 from courses.models import Course
@@ -30,12 +31,39 @@ class PutStudentsCoursesSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'name']
     
     def update(self, instance, validated_data):
-        for user in validated_data['students_courses']:
-            email = user['student']['email']
-            account = Account.objects.filter(email=email).first()
-            if not account:
-                raise ParseError({'detail': f'No active accounts was found: {email}.'})
-            instance.students.add(account) 
-        instance.save()
+        emails = list(dict.fromkeys(
+            user['student']['email'] for user in validated_data['students_courses']
+        ))
+        accounts = dict(
+            Account.objects.filter(email__in=emails).values_list('email', 'id')
+        )
+        missing = [email for email in emails if email not in accounts]
+        if missing:
+            raise ParseError(
+                {'detail': f'No active accounts was found: {", ".join(missing)}.'}
+            )
+
+        enrolled = set(
+            StudentCourse.objects.filter(
+                course=instance, student_id__in=accounts.values()
+            ).values_list('student_id', flat=True)
+        )
+        # a concurrent enrollment of the same student is skipped by the
+        # unique (student, course) constraint instead of failing the request
+        created = StudentCourse.objects.bulk_create([
+            StudentCourse(course=instance, student_id=student_id)
+            for student_id in accounts.values()
+            if student_id not in enrolled
+        ], ignore_conflicts=True)
+        # bulk_create sends no post_save, so bump the course version here
+        if created:
+            Course.objects.filter(pk=instance.pk).bump_version()
         return instance
 
+    def to_representation(self, instance):
+        if 'students_courses' in self.fields:
+            prefetch_related_objects([instance], Prefetch(
+                'students_courses',
+                queryset=StudentCourse.objects.select_related('student')
+            ))
+        return super().to_representation(instance)
@@ -1,17 +1,38 @@
+from django.conf import settings
 from rest_framework.generics import RetrieveUpdateAPIView
-from rest_framework_simplejwt.authentication import JWTAuthentication
 from courses.models import Course
-from .serializers import PutStudentsCoursesSerializer
+from _core.pagination import RosterPagination
+from _core.serializers import compile_serializer
+from _core.views import ProfiledViewMixin
+from .serializers import PutStudentsCoursesSerializer, StudentsCoursesSerializer
 from .permissions import isStudent
 
 
-class StudentsCoursesView(RetrieveUpdateAPIView):
-    authentication_classes = [JWTAuthentication]
+class StudentsCoursesView(ProfiledViewMixin, RetrieveUpdateAPIView):
     permission_classes = [isStudent]
     serializer_class = PutStudentsCoursesSerializer
+    pagination_class = RosterPagination
     lookup_url_kwarg = 'course_id'
     queryset = Course.objects.all()
 
-   
-    
-    
\ No newline at end of file
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        serializer = self.get_serializer(instance)
+        del serializer.fields['students_courses']
+        data = serializer.data
+        data['students_courses'] = self.get_roster(instance)
+        return self.get_paginated_response(data)
+
+    def get_roster(self, instance: Course) -> list:
+        if not settings.API_COMPILED_READS:
+            roster = self.paginate_queryset(
+                instance.students_courses.select_related('student')
+            )
+            return StudentsCoursesSerializer(roster, many=True).data
+
+        compiled = compile_serializer(StudentsCoursesSerializer)
+        ordering = [field.lstrip('-') for field in self.paginator.ordering]
+        rows = self.paginate_queryset(
+            compiled.values(instance.students_courses.all(), *ordering)
+        )
+        return compiled.serialize(rows)
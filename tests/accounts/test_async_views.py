@@ -0,0 +1,146 @@
+from unittest import mock
+from urllib.parse import urlencode
+from django.contrib.auth.hashers import check_password, make_password
+from django.test import TestCase, override_settings
+from rest_framework.test import APITestCase
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+from accounts.hashing import HashingPool, hashing_pool
+from accounts.models import Account
+
+
+@override_settings(ROOT_URLCONF="_core.asgi_urls")
+class TestAsyncAccountViews(TestCase):
+    @classmethod
+    def tearDownClass(cls) -> None:
+        hashing_pool.shutdown()
+        super().tearDownClass()
+
+    async def test_can_create_account_with_hashing_pool(self):
+        url = "/api/accounts/"
+        user_data = {
+            "username": "bob",
+            "password": "1234",
+            "email": "bob@kenzie.com.br",
+            "is_superuser": True,
+        }
+        response = await self.async_client.post(url, user_data, content_type="application/json")
+        expected = 201
+        message = f"\n<{url}> status code da rota {url} está diferente de {expected}."
+        self.assertEqual(expected, response.status_code, message)
+        self.assertSetEqual(
+            {"id", "username", "email", "is_superuser"}, set(response.json().keys())
+        )
+
+        account = await Account.objects.aget(username="bob")
+        message = f"\n<{url}> senha não foi salva com hash."
+        self.assertTrue(check_password("1234", account.password), message)
+        self.assertTrue(account.is_staff)
+
+    async def test_can_not_create_a_duplicate_username_and_email(self):
+        await Account.objects.acreate(username="bob", email="bob@kenzie.com.br")
+        url = "/api/accounts/"
+        user_data = {
+            "username": "bob",
+            "password": "1234",
+            "email": "bob@kenzie.com.br",
+            "is_superuser": False,
+        }
+        response = await self.async_client.post(url, user_data, content_type="application/json")
+        self.assertEqual(400, response.status_code)
+
+        expected_body = {
+            "username": ["A user with that username already exists."],
+            "email": ["user with this email already exists."],
+        }
+        self.assertDictEqual(expected_body, response.json())
+
+    async def test_login_with_correct_and_incorrect_credentials(self):
+        await Account.objects.acreate(
+            username="account_1111", password=make_password("1234")
+        )
+        url = "/api/login/"
+        response = await self.async_client.post(
+            url, {"username": "account_1111", "password": "1234"},
+            content_type="application/json",
+        )
+        self.assertEqual(200, response.status_code)
+        self.assertSetEqual({"access", "refresh"}, set(response.json().keys()))
+
+        response = await self.async_client.post(
+            url, {"username": "account_1111", "password": "errada"},
+            content_type="application/json",
+        )
+        self.assertEqual(401, response.status_code)
+        expected_body = {"detail": "No active account found with the given credentials"}
+        self.assertDictEqual(expected_body, response.json())
+
+    async def test_login_without_required_fields(self):
+        response = await self.async_client.post(
+            "/api/login/", {}, content_type="application/json"
+        )
+        self.assertEqual(400, response.status_code)
+        self.assertSetEqual({"username", "password"}, set(response.json().keys()))
+
+    async def test_accepts_form_and_multipart_bodies(self):
+        user_data = {"username": "bob", "password": "1234", "email": "bob@kenzie.com.br"}
+        response = await self.async_client.post(
+            "/api/accounts/", urlencode(user_data),
+            content_type="application/x-www-form-urlencoded",
+        )
+        message = "\n<POST /api/accounts/> corpo form-urlencoded deveria ser aceito."
+        self.assertEqual(201, response.status_code, message)
+
+        response = await self.async_client.post(
+            "/api/login/", {"username": "bob", "password": "1234"}
+        )
+        message = "\n<POST /api/login/> corpo multipart deveria ser aceito."
+        self.assertEqual(200, response.status_code, message)
+
+    async def test_malformed_and_unsupported_bodies(self):
+        response = await self.async_client.post(
+            "/api/login/", "{", content_type="application/json"
+        )
+        self.assertEqual(400, response.status_code)
+        self.assertTrue(response.json()["detail"].startswith("JSON parse error"))
+
+        response = await self.async_client.post(
+            "/api/login/", "username", content_type="text/plain"
+        )
+        self.assertEqual(415, response.status_code)
+
+    async def test_rejects_requests_when_hashing_queue_is_full(self):
+        full_pool = HashingPool(max_workers=1, max_concurrency=1, max_queue=0)
+        with mock.patch("accounts.async_views.hashing_pool", full_pool):
+            response = await self.async_client.post(
+                "/api/login/", {"username": "bob", "password": "1234"},
+                content_type="application/json",
+            )
+        self.assertEqual(503, response.status_code)
+        self.assertEqual(1, full_pool.stats()["rejected"])
+
+
+class TestHashingStatsView(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/accounts/hashing/stats/"
+        cls.superuser = baker.make("accounts.Account", is_superuser=True)
+        cls.common_user = baker.make("accounts.Account", is_superuser=False)
+
+        cls.superuser_token = str(
+            RefreshToken.for_user(cls.superuser).access_token,
+        )
+        cls.common_user_token = str(
+            RefreshToken.for_user(cls.common_user).access_token,
+        )
+
+    def test_can_not_read_hashing_stats_using_common_user_token(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.common_user_token)
+        response = self.client.get(self.BASE_URL)
+        self.assertEqual(403, response.status_code)
+
+    def test_can_read_queue_depth_using_superuser_token(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+        response = self.client.get(self.BASE_URL)
+        self.assertEqual(200, response.status_code)
+        self.assertIn("queue_depth", response.json())
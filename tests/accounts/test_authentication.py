@@ -0,0 +1,122 @@
+from unittest import mock
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from model_bakery import baker
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from accounts.authentication import StatelessJWTAuthentication, UserCache, user_cache
+from courses.views import CourseExportView
+
+
+def account_queries(context):
+    return [
+        query["sql"]
+        for query in context.captured_queries
+        if 'FROM "accounts_account"' in query["sql"]
+    ]
+
+
+class TestCachedJWTAuthentication(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/courses/"
+        cls.common_user = baker.make("accounts.Account", is_superuser=False)
+        cls.common_user_token = str(
+            RefreshToken.for_user(cls.common_user).access_token,
+        )
+
+    def setUp(self) -> None:
+        user_cache.clear()
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.common_user_token)
+
+    def test_second_request_does_not_load_the_user(self):
+        self.client.get(self.BASE_URL)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.BASE_URL)
+        self.assertEqual(200, response.status_code)
+
+        message = f"<{self.BASE_URL}> usuário autenticado foi buscado novamente no banco de dados."
+        self.assertListEqual([], account_queries(context), message)
+
+    def test_saving_the_account_invalidates_the_cache(self):
+        response = self.client.get("/api/courses/export/")
+        self.assertEqual(403, response.status_code)
+
+        self.common_user.is_superuser = True
+        self.common_user.save()
+        response = self.client.get("/api/courses/export/")
+        message = "Alteração do usuário não invalidou o cache de autenticação."
+        self.assertEqual(200, response.status_code, message)
+
+    def test_deleting_the_account_invalidates_the_cache(self):
+        self.assertEqual(200, self.client.get(self.BASE_URL).status_code)
+
+        self.common_user.delete()
+        response = self.client.get(self.BASE_URL)
+        message = "Exclusão do usuário não invalidou o cache de autenticação."
+        self.assertEqual(401, response.status_code, message)
+
+
+class TestUserCache(APITestCase):
+    def test_evicts_least_recently_used_entry(self):
+        cache = UserCache(max_size=2, ttl=60)
+        cache.set("a", "user a")
+        cache.set("b", "user b")
+        cache.get("a")
+        cache.set("c", "user c")
+
+        self.assertEqual("user a", cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual("user c", cache.get("c"))
+
+    def test_expired_entries_are_not_returned(self):
+        cache = UserCache(max_size=2, ttl=0)
+        cache.set("a", "user a")
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(0, len(cache))
+
+
+class TestStatelessJWTAuthentication(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.superuser = baker.make("accounts.Account", username="bob", is_superuser=True)
+        cls.superuser.set_password("1234")
+        cls.superuser.save()
+
+    def login(self):
+        response = self.client.post(
+            "/api/login/", {"username": "bob", "password": "1234"}, format="json"
+        )
+        self.assertEqual(200, response.status_code)
+        return response.json()["access"]
+
+    def test_login_embeds_authorization_claims(self):
+        token = AccessToken(self.login())
+        message = "Token de acesso não carrega as claims de autorização."
+        self.assertEqual("bob", token["username"], message)
+        self.assertTrue(token["is_superuser"], message)
+
+    def test_authenticates_without_loading_the_account(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.login())
+        with mock.patch.object(
+            CourseExportView, "authentication_classes", [JWTStatelessUserAuthentication]
+        ), CaptureQueriesContext(connection) as context:
+            response = self.client.get("/api/courses/export/")
+        self.assertEqual(200, response.status_code)
+
+        message = "Modo stateless buscou o usuário no banco de dados."
+        self.assertListEqual([], account_queries(context), message)
+
+    def test_demoted_account_keeps_its_claims_until_the_token_expires(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.login())
+        self.superuser.is_superuser = False
+        self.superuser.is_active = False
+        self.superuser.save()
+
+        with mock.patch.object(
+            CourseExportView, "authentication_classes", [StatelessJWTAuthentication]
+        ):
+            response = self.client.get("/api/courses/export/")
+        message = "Modo stateless deveria confiar nas claims até o token expirar."
+        self.assertEqual(200, response.status_code, message)
@@ -0,0 +1,130 @@
+import io
+import json
+from django.contrib.auth.hashers import check_password
+from rest_framework.test import APITestCase
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+from accounts.bulk_import import iter_json_array
+from accounts.hashing import hashing_pool
+from accounts.models import Account
+
+
+class TestAccountImportView(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/accounts/import/"
+        cls.superuser = baker.make("accounts.Account", username="admin", is_superuser=True)
+        cls.common_user = baker.make("accounts.Account", is_superuser=False)
+
+        cls.superuser_token = str(
+            RefreshToken.for_user(cls.superuser).access_token,
+        )
+        cls.common_user_token = str(
+            RefreshToken.for_user(cls.common_user).access_token,
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        hashing_pool.shutdown()
+        super().tearDownClass()
+
+    def test_can_import_json_array_with_per_row_report(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+        rows = [
+            {"username": "bob", "email": "bob@kenzie.com.br", "password": "1234"},
+            {"username": "admin", "email": "admin@kenzie.com.br", "password": "1234"},
+            {"username": "bobby", "email": "bob@kenzie.com.br", "password": "1234"},
+            {"username": "alice", "email": "alice@kenzie.com.br"},
+            {"username": "carol", "email": "carol@kenzie.com.br", "password": "1234",
+             "is_superuser": True},
+        ]
+        response = self.client.post(
+            self.BASE_URL, json.dumps(rows), content_type="application/json"
+        )
+        self.assertEqual(200, response.status_code)
+
+        body = response.json()
+        self.assertEqual(2, body["created"])
+        self.assertEqual(3, body["failed"])
+        self.assertListEqual(
+            ["created", "error", "error", "error", "created"],
+            [result["status"] for result in body["results"]],
+        )
+        self.assertListEqual([0, 1, 2, 3, 4], [result["row"] for result in body["results"]])
+        self.assertDictEqual(
+            {"username": ["A user with that username already exists."]},
+            body["results"][1]["errors"],
+        )
+        self.assertDictEqual(
+            {"email": ["user with this email already exists."]},
+            body["results"][2]["errors"],
+        )
+        self.assertDictEqual(
+            {"password": ["This field is required."]}, body["results"][3]["errors"]
+        )
+
+        carol = Account.objects.get(username="carol")
+        self.assertTrue(check_password("1234", carol.password))
+        self.assertTrue(carol.is_superuser and carol.is_staff)
+        self.assertEqual(str(carol.id), body["results"][4]["account"]["id"])
+
+    def test_rejected_rows_do_not_reserve_their_username(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+        rows = [
+            {"username": "dave", "email": self.superuser.email, "password": "1234"},
+            {"username": "dave", "email": "dave@kenzie.com.br", "password": "1234"},
+        ]
+        response = self.client.post(
+            self.BASE_URL, json.dumps(rows), content_type="application/json"
+        )
+        body = response.json()
+        self.assertDictEqual(
+            {"email": ["user with this email already exists."]},
+            body["results"][0]["errors"],
+        )
+        message = "Linha rejeitada reservou o username para as linhas seguintes."
+        self.assertEqual("created", body["results"][1]["status"], message)
+
+    def test_can_import_csv(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+        content = (
+            "username,email,password,is_superuser\n"
+            "bob,bob@kenzie.com.br,1234,false\n"
+            "alice,alice@kenzie.com.br,1234,true\n"
+        )
+        response = self.client.post(self.BASE_URL, content, content_type="text/csv")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(2, response.json()["created"])
+        self.assertTrue(Account.objects.get(username="alice").is_superuser)
+
+    def test_can_not_import_using_common_user_token(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.common_user_token)
+        response = self.client.post(self.BASE_URL, "[]", content_type="application/json")
+        self.assertEqual(403, response.status_code)
+
+    def test_malformed_json_returns_400(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+        response = self.client.post(
+            self.BASE_URL, '{"username": "bob"}', content_type="application/json"
+        )
+        self.assertEqual(400, response.status_code)
+
+
+class TestIterJsonArray(APITestCase):
+    def test_yields_items_across_chunk_boundaries(self):
+        rows = [{"username": f"user {i}", "tags": [i, "a,b]"]} for i in range(50)]
+        stream = io.BytesIO(json.dumps(rows).encode())
+        self.assertListEqual(rows, list(iter_json_array(stream, chunk_size=7)))
+
+    def test_does_not_split_scalars_at_chunk_boundaries(self):
+        for chunk_size in range(1, 8):
+            with self.subTest(chunk_size=chunk_size):
+                stream = io.BytesIO(b"[123456, true, 7, -1.5e3]")
+                self.assertListEqual(
+                    [123456, True, 7, -1500.0],
+                    list(iter_json_array(stream, chunk_size=chunk_size)),
+                )
+
+    def test_unterminated_array_is_an_error(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_array(io.BytesIO(b"[1, 2"), chunk_size=2))
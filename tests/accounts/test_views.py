@@ -1,5 +1,9 @@
+from types import SimpleNamespace
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APITestCase
 from accounts.models import Account
+from accounts.serializers import AccountSerializer
 from model_bakery import baker
 from django.contrib.auth.hashers import (
     make_password,
@@ -219,3 +223,82 @@ class TestLoginAccountView(APITestCase):
             f"<{URL}>: corpo de retorno deve conter somente as chaves: {expected_keys}."
         )
         self.assertSetEqual(expected_keys, result_keys, message)
+
+
+class TestCreateAccountQueries(APITestCase):
+    def test_create_account_is_a_single_insert(self):
+        url = "/api/accounts/"
+        user_data = {
+            "username": "bob",
+            "password": "1234",
+            "email": "bob@kenzie.com.br",
+            "is_superuser": False,
+        }
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(url, user_data, format="json")
+        self.assertEqual(201, response.status_code)
+
+        # the test case's savepoint around the write is not a statement of the view
+        statements = [
+            query["sql"] for query in context.captured_queries
+            if "SAVEPOINT" not in query["sql"]
+        ]
+        message = f"\n<{url}> criação de usuário não deveria consultar unicidade antes do insert."
+        self.assertEqual(1, len(statements), message)
+        self.assertTrue(statements[0].startswith("INSERT"), message)
+
+    def test_duplicate_username_only_reports_username(self):
+        baker.make("accounts.Account", username="bob", email="alice@kenzie.com.br")
+        url = "/api/accounts/"
+        user_data = {
+            "username": "bob",
+            "password": "1234",
+            "email": "bob@kenzie.com.br",
+            "is_superuser": False,
+        }
+        response = self.client.post(url, user_data, format="json")
+        self.assertEqual(400, response.status_code)
+
+        expected_body = {"username": ["A user with that username already exists."]}
+        message = f"\n<{url}> retorno diferente do esperado."
+        self.assertDictEqual(expected_body, response.json(), message)
+
+    def test_duplicate_email_only_reports_email(self):
+        baker.make("accounts.Account", username="alice", email="bob@kenzie.com.br")
+        url = "/api/accounts/"
+        user_data = {
+            "username": "bob",
+            "password": "1234",
+            "email": "bob@kenzie.com.br",
+            "is_superuser": False,
+        }
+        response = self.client.post(url, user_data, format="json")
+        self.assertEqual(400, response.status_code)
+
+        expected_body = {"email": ["user with this email already exists."]}
+        message = f"\n<{url}> retorno diferente do esperado."
+        self.assertDictEqual(expected_body, response.json(), message)
+
+    def test_body_that_is_not_an_object_is_a_400(self):
+        url = "/api/accounts/"
+        for body in ('"usernameemail"', "[1, 2]"):
+            with self.subTest(body=body):
+                response = self.client.post(url, body, content_type="application/json")
+                message = f"\n<{url}> corpo {body} deveria retornar 400."
+                self.assertEqual(400, response.status_code, message)
+                self.assertIn("non_field_errors", response.json(), message)
+
+    def test_postgresql_constraint_names_map_to_fields(self):
+        serializer = AccountSerializer()
+        for constraint, field in (
+            ("accounts_account_username_key", "username"),
+            ("accounts_account_email_0ab1c2d3_uniq", "email"),
+            ("accounts_account_pkey", None),
+        ):
+            with self.subTest(constraint=constraint):
+                # the driver error Django chains, like psycopg's UniqueViolation
+                cause = Exception("duplicate key value violates unique constraint")
+                cause.diag = SimpleNamespace(constraint_name=constraint)
+                error = IntegrityError(*cause.args)
+                error.__cause__ = cause
+                self.assertEqual(field, serializer.get_violated_field(error))
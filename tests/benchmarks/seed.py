@@ -0,0 +1,84 @@
+import os
+import uuid
+from datetime import date
+from itertools import islice
+from django.contrib.auth.hashers import make_password
+from accounts.models import Account
+from contents.models import Content
+from courses.models import Course
+from students_courses.models import StudentCourse
+
+BATCH_SIZE = 5000
+COURSES_PER_STUDENT = 20
+# one topic word per content, so a search for a topic matches 1% of them
+TOPICS = [f"topico{index}" for index in range(100)]
+
+
+def get_volumes() -> dict:
+    return {
+        "courses": int(os.getenv("BENCHMARK_COURSES", 10_000)),
+        "contents": int(os.getenv("BENCHMARK_CONTENTS", 1_000_000)),
+        "enrollments": int(os.getenv("BENCHMARK_ENROLLMENTS", 100_000)),
+    }
+
+
+def bulk_insert(model, objects) -> None:
+    while True:
+        batch = list(islice(objects, BATCH_SIZE))
+        if not batch:
+            return
+        model.objects.bulk_create(batch, batch_size=BATCH_SIZE)
+
+
+def seed(courses: int, contents: int, enrollments: int) -> dict:
+    """
+    Bulk inserts the given volumes: contents spread evenly over the courses
+    and each student enrolled in COURSES_PER_STUDENT consecutive courses.
+    Returns the ids the benchmarks request.
+    """
+    password = make_password("1234")
+    per_student = min(COURSES_PER_STUDENT, courses)
+    students = max(1, -(-enrollments // per_student))
+    student_ids = [uuid.uuid4() for _ in range(students)]
+    course_ids = [uuid.uuid4() for _ in range(courses)]
+
+    bulk_insert(Account, (
+        Account(
+            id=student_id, username=f"student{index}",
+            email=f"student{index}@mail.com", password=password,
+        )
+        for index, student_id in enumerate(student_ids)
+    ))
+    bulk_insert(Course, (
+        Course(
+            id=course_id, name=f"Curso {index}",
+            start_date=date(2023, 8, 28), end_date=date(2023, 12, 28),
+        )
+        for index, course_id in enumerate(course_ids)
+    ))
+    bulk_insert(Content, (
+        Content(
+            name=f"Aula {index}",
+            content=f"Conteúdo da aula {index} sobre {TOPICS[index % len(TOPICS)]}.",
+            video_url=f"https://videos.com/{index}", course_id=course_ids[index % courses],
+        )
+        for index in range(contents)
+    ))
+    # student i takes courses 20i to 20i + 19, wrapping around, so rosters
+    # get about enrollments / courses students each
+    bulk_insert(StudentCourse, (
+        StudentCourse(
+            student_id=student_ids[index // per_student],
+            course_id=course_ids[index % courses],
+        )
+        for index in range(enrollments)
+    ))
+
+    course_id = course_ids[0]
+    return {
+        "course_id": course_id,
+        "content_id": Content.objects.filter(course_id=course_id)
+        .values_list("id", flat=True).first(),
+        "student_id": StudentCourse.objects.filter(course_id=course_id)
+        .values_list("student_id", flat=True).first(),
+    }
@@ -0,0 +1,72 @@
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from django.test import AsyncClient, Client, TransactionTestCase, override_settings
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+
+REQUESTS = 200
+CONCURRENCY = 8
+
+
+@pytest.mark.benchmark
+class TestAsyncViewsLoad(TransactionTestCase):
+    """
+    Same reads against the WSGI handler of _core/wsgi.py, one thread per
+    worker, and against the ASGI handler of _core/asgi.py on one event loop.
+    """
+
+    def setUp(self) -> None:
+        student = baker.make("accounts.Account", is_superuser=False)
+        self.course = baker.make("courses.Course")
+        baker.make("contents.Content", course=self.course, _quantity=10)
+        self.course.students.add(student, *baker.make("accounts.Account", _quantity=50))
+        baker.make("courses.Course", _quantity=20)
+        token = str(RefreshToken.for_user(student).access_token)
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.urls = [
+            "/api/courses/",
+            f"/api/courses/{self.course.id}/",
+            f"/api/courses/{self.course.id}/contents/{self.course.contents.first().id}/",
+        ]
+
+    def run_wsgi(self):
+        def request(index):
+            started = time.perf_counter()
+            response = Client().get(self.urls[index % len(self.urls)], headers=self.headers)
+            assert response.status_code == 200, response.content
+            return time.perf_counter() - started
+
+        with ThreadPoolExecutor(CONCURRENCY) as executor:
+            return list(executor.map(request, range(REQUESTS)))
+
+    async def run_asgi(self):
+        client = AsyncClient()
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+
+        async def request(index):
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get(self.urls[index % len(self.urls)], headers=self.headers)
+                assert response.status_code == 200, response.content
+                return time.perf_counter() - started
+
+        return await asyncio.gather(*(request(index) for index in range(REQUESTS)))
+
+    def measure(self, run):
+        started = time.perf_counter()
+        latencies = run()
+        elapsed = time.perf_counter() - started
+        return REQUESTS / elapsed, statistics.median(latencies) * 1000
+
+    def test_async_reads_against_wsgi(self):
+        wsgi_rps, wsgi_p50 = self.measure(self.run_wsgi)
+        with override_settings(ROOT_URLCONF="_core.asgi_urls"):
+            asgi_rps, asgi_p50 = self.measure(lambda: asyncio.run(self.run_asgi()))
+        print(f"\n{REQUESTS} requests, concurrency {CONCURRENCY}")
+        print(f"WSGI threads: {wsgi_rps:7.1f} req/s, p50 {wsgi_p50:6.2f} ms")
+        print(f"  ASGI async: {asgi_rps:7.1f} req/s, p50 {asgi_p50:6.2f} ms")
+
+        self.assertGreater(asgi_rps, 0)
@@ -0,0 +1,52 @@
+import time
+from unittest import mock
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.authentication import (
+    JWTAuthentication,
+    JWTStatelessUserAuthentication,
+)
+from model_bakery import baker
+from accounts.authentication import CachedJWTAuthentication, user_cache
+from accounts.serializers import AccountTokenObtainPairSerializer
+from courses.views import CourseView
+
+REQUESTS = 300
+
+
+@pytest.mark.benchmark
+class TestAuthenticationModesBenchmark(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/courses/"
+        cls.common_user = baker.make("accounts.Account", is_superuser=False)
+        cls.common_user_token = str(
+            AccountTokenObtainPairSerializer.get_token(cls.common_user).access_token
+        )
+        course = baker.make("courses.Course")
+        course.students.add(cls.common_user)
+
+    def measure(self, authentication_class):
+        user_cache.clear()
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.common_user_token)
+        with mock.patch.object(CourseView, "authentication_classes", [authentication_class]):
+            self.client.get(self.BASE_URL)
+            with CaptureQueriesContext(connection) as context:
+                started = time.perf_counter()
+                for _ in range(REQUESTS):
+                    self.client.get(self.BASE_URL)
+                elapsed = time.perf_counter() - started
+        return REQUESTS / elapsed, len(context.captured_queries) / REQUESTS
+
+    def test_stateless_mode_against_db_backed_modes(self):
+        results = {
+            "db": self.measure(JWTAuthentication),
+            "cached": self.measure(CachedJWTAuthentication),
+            "stateless": self.measure(JWTStatelessUserAuthentication),
+        }
+        for mode, (rps, queries) in results.items():
+            print(f"\n{mode:>10}: {rps:8.1f} req/s, {queries:.1f} queries/request")
+
+        self.assertLess(results["stateless"][1], results["db"][1])
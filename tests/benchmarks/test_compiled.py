@@ -0,0 +1,41 @@
+import time
+import pytest
+from django.test import TestCase
+from model_bakery import baker
+from _core.serializers import compile_serializer
+from courses.models import Course
+from courses.serializers import CourseSerializer
+
+ROUNDS = 10
+
+
+@pytest.mark.benchmark
+class TestCompiledSerializerBenchmark(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        courses = baker.make("courses.Course", _quantity=1000)
+        for course in courses[:200]:
+            baker.make("contents.Content", course=course, _quantity=5)
+        students = baker.make("accounts.Account", _quantity=20)
+        for course in courses[:200]:
+            course.students.add(*students)
+
+    def measure(self, serialize):
+        started = time.perf_counter()
+        for _ in range(ROUNDS):
+            data = serialize()
+        return (time.perf_counter() - started) / ROUNDS * 1000, data
+
+    def test_compiled_read_of_1000_courses(self):
+        compiled = compile_serializer(CourseSerializer)
+        serializer_ms, expected = self.measure(lambda: CourseSerializer(
+            Course.objects.with_contents_and_students().order_by("pk"), many=True
+        ).data)
+        compiled_ms, data = self.measure(lambda: compiled.serialize(
+            compiled.values(Course.objects.order_by("pk"))
+        ))
+        print(f"\n  CourseSerializer: {serializer_ms:7.2f} ms/list")
+        print(f"CompiledSerializer: {compiled_ms:7.2f} ms/list ({serializer_ms / compiled_ms:.1f}x)")
+
+        self.assertEqual(len(expected), len(data))
+        self.assertLess(compiled_ms, serializer_ms)
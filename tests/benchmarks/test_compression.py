@@ -0,0 +1,59 @@
+import time
+import pytest
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+
+REQUESTS = 50
+
+
+@pytest.mark.benchmark
+class TestCompressionBenchmark(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.superuser = baker.make("accounts.Account", is_superuser=True)
+        cls.superuser_token = str(
+            RefreshToken.for_user(cls.superuser).access_token,
+        )
+        for course in baker.make("courses.Course", _quantity=20):
+            baker.make(
+                "contents.Content", course=course, _quantity=10,
+                content="Nesta aula vamos estudar models, views e serializers. " * 40,
+            )
+        cls.url = "/api/courses/"
+
+    def measure(self, accept_encoding, brotli_quality=4, gzip_level=5):
+        settings = {
+            "PATH_PREFIX": "/api/", "MIN_SIZE": 1024, "BROTLI_QUALITY": brotli_quality,
+            "GZIP_LEVEL": gzip_level, "STREAMING": True,
+        }
+        with override_settings(API_COMPRESSION=settings):
+            # a new client loads the middleware again with these settings
+            self.client = self.client_class()
+            self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+            started = time.process_time()
+            for _ in range(REQUESTS):
+                response = self.client.get(self.url, HTTP_ACCEPT_ENCODING=accept_encoding)
+            cpu = (time.process_time() - started) / REQUESTS * 1000
+        self.assertEqual(200, response.status_code)
+        return len(response.content), cpu
+
+    def test_bytes_and_cpu_per_request(self):
+        identity_bytes, identity_cpu = self.measure("identity")
+        print(f"\n{'encoding':>12} {'bytes':>9} {'ratio':>6} {'cpu ms':>7} {'+cpu ms':>8}")
+        print(f"{'identity':>12} {identity_bytes:9d} {1:6.1f} {identity_cpu:7.2f} {0:8.2f}")
+        for label, accept_encoding, options in [
+            ("gzip 1", "gzip", {"gzip_level": 1}),
+            ("gzip 5", "gzip", {"gzip_level": 5}),
+            ("gzip 9", "gzip", {"gzip_level": 9}),
+            ("br 1", "br", {"brotli_quality": 1}),
+            ("br 4", "br", {"brotli_quality": 4}),
+            ("br 11", "br", {"brotli_quality": 11}),
+        ]:
+            size, cpu = self.measure(accept_encoding, **options)
+            print(
+                f"{label:>12} {size:9d} {identity_bytes / size:6.1f} "
+                f"{cpu:7.2f} {cpu - identity_cpu:8.2f}"
+            )
+            self.assertLess(size, identity_bytes)
@@ -0,0 +1,134 @@
+import json
+import os
+import statistics
+import time
+import tracemalloc
+import pytest
+from django.db import connection
+from rest_framework.test import APITestCase
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+from accounts.models import Account
+from .seed import TOPICS, get_volumes, seed
+
+ROUNDS = int(os.getenv("BENCHMARK_ROUNDS", 50))
+REPORT = os.getenv("BENCHMARK_REPORT", "benchmark-report.json")
+SEARCH_TARGET_MS = float(os.getenv("BENCHMARK_SEARCH_TARGET_MS", 50))
+
+
+@pytest.mark.benchmark
+class TestEndpointBenchmark(APITestCase):
+    """
+    Latency, query count and peak memory of the main read endpoints over a
+    seeded dataset, written to REPORT as JSON so runs on two commits can be
+    diffed. Volumes come from BENCHMARK_COURSES, BENCHMARK_CONTENTS and
+    BENCHMARK_ENROLLMENTS. Search fails above BENCHMARK_SEARCH_TARGET_MS.
+    """
+    results = {}
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.volumes = get_volumes()
+        started = time.perf_counter()
+        ids = seed(**cls.volumes)
+        cls.seconds_to_seed = time.perf_counter() - started
+
+        superuser = baker.make("accounts.Account", is_superuser=True)
+        student = Account.objects.get(pk=ids["student_id"])
+        cls.superuser_token = str(RefreshToken.for_user(superuser).access_token)
+        cls.student_token = str(RefreshToken.for_user(student).access_token)
+        cls.course_id = ids["course_id"]
+        cls.content_id = ids["content_id"]
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        report = {
+            "database": connection.vendor,
+            "rounds": ROUNDS,
+            "volumes": cls.volumes,
+            "endpoints": cls.results,
+        }
+        with open(REPORT, "w") as file:
+            json.dump(report, file, indent=2, sort_keys=True)
+            file.write("\n")
+        print(f"\nseeded in {cls.seconds_to_seed:.1f}s, report written to {REPORT}")
+
+    def request(self, url):
+        response = self.client.get(url)
+        self.assertEqual(200, response.status_code, response.content[:200])
+        return response
+
+    def measure(self, name, url, token):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+        response = self.request(url)
+
+        # counted with a wrapper so it does not depend on the debug query log
+        queries = []
+        with connection.execute_wrapper(
+            lambda execute, sql, *args: queries.append(sql) or execute(sql, *args)
+        ):
+            self.request(url)
+
+        tracemalloc.start()
+        try:
+            self.request(url)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        latencies = []
+        for _ in range(ROUNDS):
+            started = time.perf_counter()
+            self.request(url)
+            latencies.append((time.perf_counter() - started) * 1000)
+        percentiles = statistics.quantiles(latencies, n=20, method="inclusive")
+
+        self.results[name] = result = {
+            "url": url.replace(str(self.course_id), "<course_id>").replace(
+                str(self.content_id), "<content_id>"
+            ),
+            "p50_ms": round(statistics.median(latencies), 2),
+            "p95_ms": round(percentiles[18], 2),
+            "queries": len(queries),
+            "peak_memory_kb": round(peak_memory / 1024, 1),
+            "response_bytes": len(response.content),
+        }
+        print(
+            f"\n{name:>22}: p50 {result['p50_ms']:7.2f} ms, p95 {result['p95_ms']:7.2f} ms, "
+            f"{result['queries']} queries, {result['peak_memory_kb']:8.1f} KiB"
+        )
+        return result
+
+    def test_course_list(self):
+        self.measure("course_list", "/api/courses/?page_size=100", self.superuser_token)
+
+    def test_course_list_of_a_student(self):
+        self.measure("course_list_student", "/api/courses/?page_size=100", self.student_token)
+
+    def test_course_detail(self):
+        self.measure("course_detail", f"/api/courses/{self.course_id}/", self.student_token)
+
+    def test_content_detail(self):
+        self.measure(
+            "content_detail",
+            f"/api/courses/{self.course_id}/contents/{self.content_id}/",
+            self.student_token,
+        )
+
+    def test_roster(self):
+        self.measure(
+            "roster", f"/api/courses/{self.course_id}/students/?page_size=100",
+            self.superuser_token,
+        )
+
+    def test_content_search(self):
+        # ranks every content of one topic, 1% of the table, to cut the first page
+        result = self.measure(
+            "content_search", f"/api/contents/search/?q={TOPICS[7]}", self.superuser_token
+        )
+        message = (
+            f"\nbusca acima de {SEARCH_TARGET_MS} ms com "
+            f"{self.volumes['contents']} conteúdos: p95 {result['p95_ms']} ms."
+        )
+        self.assertLessEqual(result["p95_ms"], SEARCH_TARGET_MS, message)
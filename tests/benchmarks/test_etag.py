@@ -0,0 +1,39 @@
+import time
+import pytest
+from rest_framework.test import APITestCase
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+
+REQUESTS = 200
+
+
+@pytest.mark.benchmark
+class TestConditionalReadBenchmark(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.superuser = baker.make("accounts.Account", is_superuser=True)
+        cls.superuser_token = str(
+            RefreshToken.for_user(cls.superuser).access_token,
+        )
+        cls.course = baker.make("courses.Course")
+        baker.make("contents.Content", course=cls.course, content="." * 2000, _quantity=100)
+        cls.course.students.add(*baker.make("accounts.Account", _quantity=100))
+        cls.url = f"/api/courses/{cls.course.id}/"
+
+    def measure(self, **headers):
+        started = time.perf_counter()
+        for _ in range(REQUESTS):
+            response = self.client.get(self.url, **headers)
+        return (time.perf_counter() - started) / REQUESTS * 1000, response.status_code
+
+    def test_version_lookup_is_cheaper_than_full_read(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+        etag = self.client.get(self.url).headers["ETag"]
+
+        full_read, full_status = self.measure()
+        not_modified, conditional_status = self.measure(HTTP_IF_NONE_MATCH=etag)
+        print(f"\n   full read ({full_status}): {full_read:6.2f} ms/request")
+        print(f"not modified ({conditional_status}): {not_modified:6.2f} ms/request")
+
+        self.assertEqual(304, conditional_status)
+        self.assertLess(not_modified, full_read)
@@ -0,0 +1,40 @@
+import statistics
+import time
+import pytest
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+from .test_endpoints import ROUNDS
+
+
+@pytest.mark.benchmark
+class TestProfilingOverhead(APITestCase):
+    """Median latency of /api/courses/ with every request profiled vs none."""
+    @classmethod
+    def setUpTestData(cls) -> None:
+        superuser = baker.make("accounts.Account", is_superuser=True)
+        cls.token = str(RefreshToken.for_user(superuser).access_token)
+        for course in baker.make("courses.Course", _quantity=50):
+            baker.make("contents.Content", course=course, _quantity=5)
+
+    def median_latency(self) -> float:
+        client = self.client_class()
+        client.credentials(HTTP_AUTHORIZATION="Bearer " + self.token)
+        client.get("/api/courses/")
+        latencies = []
+        for _ in range(ROUNDS):
+            started = time.perf_counter()
+            client.get("/api/courses/")
+            latencies.append((time.perf_counter() - started) * 1000)
+        return statistics.median(latencies)
+
+    def test_overhead_of_profiling_every_request(self):
+        baseline = self.median_latency()
+        with override_settings(API_PROFILING={"SAMPLE_RATE": 1.0, "LOG": True}):
+            with self.assertLogs("_core.profiling", "INFO"):
+                profiled = self.median_latency()
+        print(
+            f"\nprofiling off: {baseline:.2f} ms, on: {profiled:.2f} ms "
+            f"({(profiled / baseline - 1) * 100:+.1f}%)"
+        )
@@ -0,0 +1,44 @@
+import time
+import pytest
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from model_bakery import baker
+from _core.renderers import FastJSONRenderer
+from courses.models import Course
+from courses.serializers import CourseSerializer
+
+ROUNDS = 20
+
+
+@pytest.mark.benchmark
+class TestRendererBenchmark(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        courses = baker.make("courses.Course", _quantity=1000)
+        for course in courses[:200]:
+            baker.make(
+                "contents.Content", course=course,
+                content="Texto da aula. " * 50, _quantity=5,
+            )
+        students = baker.make("accounts.Account", _quantity=20)
+        for course in courses[:200]:
+            course.students.add(*students)
+
+    def measure(self, renderer, data):
+        started = time.perf_counter()
+        for _ in range(ROUNDS):
+            content = renderer.render(data)
+        return (time.perf_counter() - started) / ROUNDS * 1000, content
+
+    def test_fast_renderer_on_1000_course_list(self):
+        courses = Course.objects.with_contents_and_students().order_by("start_date", "id")
+        data = CourseSerializer(courses, many=True).data
+
+        default_ms, default_content = self.measure(JSONRenderer(), data)
+        fast_ms, fast_content = self.measure(FastJSONRenderer(), data)
+        print(f"\n{len(data)} courses, {len(default_content)} bytes")
+        print(f"   JSONRenderer: {default_ms:7.2f} ms/render")
+        print(f"FastJSONRenderer: {fast_ms:7.2f} ms/render ({default_ms / fast_ms:.1f}x)")
+
+        self.assertEqual(default_content, fast_content)
+        self.assertLess(fast_ms, default_ms)
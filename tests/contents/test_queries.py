@@ -0,0 +1,91 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework.request import Request
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+from accounts.authentication import user_cache
+from students_courses.permissions import is_enrolled
+
+
+class TestContentMembershipQuery(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/courses/{}/contents/{}/"
+        cls.common_user = baker.make("accounts.Account", is_superuser=False)
+        cls.common_user_token = str(
+            RefreshToken.for_user(cls.common_user).access_token,
+        )
+
+    def count_queries(self, content):
+        user_cache.clear()
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.common_user_token)
+        url = self.BASE_URL.format(content.course.id, content.id)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(200, response.status_code)
+        return context.captured_queries
+
+    def test_participant_read_does_not_load_the_roster(self):
+        content = baker.make("contents.Content")
+        content.course.students.add(self.common_user)
+        expected = len(self.count_queries(content))
+
+        content.course.students.add(*baker.make("accounts.Account", _quantity=20))
+        queries = self.count_queries(content)
+
+        url = self.BASE_URL.format(content.course.id, content.id)
+        message = f"<{url}> verificação de matrícula cresce com o número de alunos."
+        self.assertEqual(expected, len(queries), message)
+        roster_loads = [
+            query for query in queries
+            if 'INNER JOIN "students_courses_studentcourse"' in query["sql"]
+        ]
+        self.assertListEqual([], roster_loads, message)
+
+    def test_membership_is_memoized_per_request(self):
+        course = baker.make("courses.Course")
+        course.students.add(self.common_user)
+        request = Request(APIRequestFactory().get("/"))
+        request.user = self.common_user
+
+        with CaptureQueriesContext(connection) as context:
+            self.assertTrue(is_enrolled(request, course.id))
+            self.assertTrue(is_enrolled(request, str(course.id)))
+        self.assertEqual(1, len(context.captured_queries))
+
+
+class TestContentDetailResolution(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/courses/{}/contents/{}/"
+        cls.common_user = baker.make("accounts.Account", is_superuser=False)
+        cls.common_user_token = str(
+            RefreshToken.for_user(cls.common_user).access_token,
+        )
+        cls.content = baker.make("contents.Content")
+        cls.content.course.students.add(cls.common_user)
+
+    def setUp(self) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.common_user_token)
+
+    def test_participant_read_is_resolved_with_one_query(self):
+        url = self.BASE_URL.format(self.content.course.id, self.content.id)
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(200, response.status_code)
+
+        message = f"<{url}> leitura de conteúdo deveria usar uma única query."
+        self.assertEqual(1, len(context.captured_queries), message)
+
+    def test_can_not_retrieve_content_from_another_course(self):
+        other_course = baker.make("courses.Course")
+        other_course.students.add(self.common_user)
+        url = self.BASE_URL.format(other_course.id, self.content.id)
+        response = self.client.get(url)
+        self.assertEqual(404, response.status_code)
+
+        expected_body = {"detail": "content not found."}
+        message = f"<{url}> corpo de resposta deve ser semelhante a {expected_body}."
+        self.assertDictEqual(expected_body, response.json(), message)
@@ -0,0 +1,165 @@
+import re
+from unittest import skipUnless
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase, APITransactionTestCase
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+from contents.models import Content
+
+
+class TestContentSearchView(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/contents/search/"
+        cls.superuser = baker.make("accounts.Account", is_superuser=True)
+        cls.common_user = baker.make("accounts.Account", is_superuser=False)
+
+        cls.superuser_token = str(
+            RefreshToken.for_user(cls.superuser).access_token,
+        )
+        cls.common_user_token = str(
+            RefreshToken.for_user(cls.common_user).access_token,
+        )
+
+        cls.course = baker.make("courses.Course")
+        cls.course.students.add(cls.common_user)
+        cls.other_course = baker.make("courses.Course")
+
+        cls.in_name = baker.make(
+            "contents.Content", course=cls.course,
+            name="Django signals", content="Receivers and senders.",
+        )
+        cls.in_text = baker.make(
+            "contents.Content", course=cls.course,
+            name="Models", content="Use signals to keep a cache current.",
+        )
+        cls.hidden = baker.make(
+            "contents.Content", course=cls.other_course,
+            name="Signals in other course", content="Not visible to students.",
+        )
+        baker.make("contents.Content", course=cls.course, name="Views", content="Generic views.")
+
+    def search(self, token, query, **params):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+        return self.client.get(self.BASE_URL, {"q": query, **params})
+
+    def test_student_only_finds_contents_of_enrolled_courses(self):
+        response = self.search(self.common_user_token, "signals")
+        message = f"\n<{self.BASE_URL}> busca retornou conteúdo de curso sem matrícula."
+        self.assertEqual(200, response.status_code)
+        results = response.json()
+        self.assertListEqual(
+            [str(self.in_name.id), str(self.in_text.id)],
+            [result["id"] for result in results],
+            message,
+        )
+        self.assertSetEqual(
+            {"id", "name", "video_url", "course", "rank"}, set(results[0].keys())
+        )
+
+    def test_superuser_finds_every_course(self):
+        response = self.search(self.superuser_token, "SIGNALS")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(3, len(response.json()))
+
+    def test_every_word_must_match(self):
+        response = self.search(self.superuser_token, "signals cache")
+        self.assertListEqual([str(self.in_text.id)], [r["id"] for r in response.json()])
+
+    def test_search_operators_are_plain_words(self):
+        response = self.search(self.superuser_token, 'signals" OR NEAR(*')
+        self.assertEqual(200, response.status_code)
+        self.assertListEqual([], response.json())
+
+    def test_index_follows_updates_and_deletes(self):
+        Content.objects.filter(pk=self.in_text.pk).update(content="Nothing relevant.")
+        self.in_name.delete()
+        response = self.search(self.superuser_token, "signals")
+        self.assertListEqual([str(self.hidden.id)], [r["id"] for r in response.json()])
+
+    def test_saving_an_instance_that_was_not_read_back_keeps_its_index(self):
+        content = Content.objects.create(
+            course=self.course, name="Celery", content="Background tasks."
+        )
+        self.assertIsNone(content.search_rowid)
+        content.name = "Channels"
+        content.save()
+
+        message = "\nsalvar instância sem search_rowid deveria manter o índice de busca."
+        response = self.search(self.superuser_token, "channels")
+        self.assertListEqual([str(content.id)], [r["id"] for r in response.json()], message)
+        self.assertListEqual([], self.search(self.superuser_token, "celery").json(), message)
+
+    def test_results_are_paginated_by_rank(self):
+        response = self.search(self.superuser_token, "signals", page_size=2)
+        first_page = [result["id"] for result in response.json()]
+        self.assertEqual(2, len(first_page))
+        self.assertIn('rel="next"', response["Link"])
+
+        next_url = response["Link"].split(">")[0].lstrip("<")
+        response = self.client.get(next_url)
+        second_page = [result["id"] for result in response.json()]
+        self.assertEqual(1, len(second_page))
+        self.assertNotIn(second_page[0], first_page)
+        self.assertNotIn("Link", response)
+
+    def test_pages_through_tied_ranks_without_repeating_or_skipping(self):
+        tied = baker.make(
+            "contents.Content", course=self.course,
+            name="Tied lesson", content="Same words.", _quantity=7,
+        )
+        url = self.BASE_URL + "?q=tied&page_size=2"
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+        result_ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(200, response.status_code)
+            result_ids += [result["id"] for result in response.json()]
+            match = re.match(r"<([^>]+)>", response.get("Link", ""))
+            url = match and match.group(1)
+
+        message = f"\n<{self.BASE_URL}> paginação repetiu ou pulou resultados empatados."
+        self.assertEqual(len(tied), len(result_ids), message)
+        self.assertSetEqual({str(content.id) for content in tied}, set(result_ids), message)
+
+    @skipUnless(connection.vendor == "sqlite", "FTS5 só existe no SQLite")
+    def test_sqlite_matches_once_per_search(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.search(self.superuser_token, "signals")
+        self.assertEqual(200, response.status_code)
+        statements = " ".join(query["sql"] for query in context.captured_queries)
+        self.assertEqual(1, statements.count("MATCH"))
+
+    def test_query_is_required(self):
+        response = self.search(self.superuser_token, "  ")
+        self.assertEqual(400, response.status_code)
+
+    def test_can_not_search_without_token(self):
+        response = self.client.get(self.BASE_URL, {"q": "signals"})
+        self.assertEqual(401, response.status_code)
+
+
+@skipUnless(connection.vendor == "sqlite", "FTS5 só existe no SQLite")
+class TestSqliteSearchIndex(APITransactionTestCase):
+    # VACUUM can not run inside the transaction of a TestCase
+    def test_index_does_not_depend_on_rowid(self):
+        course = baker.make("courses.Course")
+        removed = baker.make("contents.Content", course=course, name="Removed", _quantity=5)
+        kept = baker.make("contents.Content", course=course, name="Kept lesson")
+        Content.objects.filter(pk__in=[content.pk for content in removed]).delete()
+        with connection.cursor() as cursor:
+            cursor.execute("VACUUM")
+            # what VACUUM may do to tables without an INTEGER PRIMARY KEY
+            cursor.execute('UPDATE contents_content SET rowid = rowid + 1000')
+
+        superuser = baker.make("accounts.Account", is_superuser=True)
+        token = str(RefreshToken.for_user(superuser).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+        response = self.client.get("/api/contents/search/", {"q": "kept"})
+        message = "\níndice de busca apontou para o conteúdo errado após renumerar rowids."
+        self.assertListEqual([str(kept.id)], [r["id"] for r in response.json()], message)
+
+        baker.make("contents.Content", course=course, name="Added after vacuum")
+        response = self.client.get("/api/contents/search/", {"q": "added"})
+        self.assertEqual(1, len(response.json()))
@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APITestCase
 from model_bakery import baker
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -294,3 +296,63 @@ class TestDeleteContentView(APITestCase):
         result_count = Content.objects.all().count()
         message = f"<{url}> a deleção usando token de administrador/instrutor não está apagando do banco de dados."
         self.assertEqual(expected_count, result_count, message)
+
+
+class TestBulkCreateContentView(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/courses/{}/contents/"
+        cls.superuser = baker.make("accounts.Account", is_superuser=True)
+        cls.superuser_token = str(
+            RefreshToken.for_user(cls.superuser).access_token,
+        )
+
+    def setUp(self) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+
+    def test_can_create_many_contents_in_one_insert(self):
+        course = baker.make("courses.Course")
+        content_data = [
+            {"name": f"Aula {index}", "content": "..."} for index in range(20)
+        ]
+        url = self.BASE_URL.format(course.id)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(url, content_data, format="json")
+        expected_status_code = 201
+        message = (
+            f"<{url}> status code retornado está diferente de {expected_status_code}."
+        )
+        self.assertEqual(expected_status_code, response.status_code, message)
+        self.assertEqual(20, len(response.json()))
+        self.assertSetEqual(
+            {"id", "name", "content", "video_url"}, set(response.json()[0].keys())
+        )
+        self.assertEqual(20, Content.objects.filter(course=course).count())
+
+        inserts = [
+            query for query in context.captured_queries
+            if query["sql"].startswith('INSERT INTO "contents_content"')
+        ]
+        message = f"<{url}> conteúdos deveriam ser inseridos com um único insert."
+        self.assertEqual(1, len(inserts), message)
+
+    def test_can_not_create_any_content_when_an_item_is_invalid(self):
+        course = baker.make("courses.Course")
+        content_data = [
+            {"name": "Aula 1", "content": "..."},
+            {"name": "Aula 2"},
+        ]
+        url = self.BASE_URL.format(course.id)
+        response = self.client.post(url, content_data, format="json")
+        self.assertEqual(400, response.status_code)
+
+        expected_body = [{}, {"content": ["This field is required."]}]
+        message = f"<{url}> erros devem ser reportados pelo índice do item."
+        self.assertEqual(expected_body, response.json(), message)
+        self.assertFalse(Content.objects.filter(course=course).exists())
+
+    def test_can_not_create_contents_for_missing_course(self):
+        url = self.BASE_URL.format(v4())
+        response = self.client.post(url, [{"name": "Aula", "content": "..."}], format="json")
+        self.assertEqual(404, response.status_code)
+        self.assertDictEqual({"detail": "course not found."}, response.json())
@@ -0,0 +1,161 @@
+import gc
+import sqlite3
+import threading
+import time
+import weakref
+from unittest import TestCase, mock
+from rest_framework.test import APITestCase
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+from _core.db.pool import ConnectionPool, PoolTimeout
+from _core.db.postgresql import base
+from _core.settings import get_database_engine
+
+
+def check(connection):
+    connection.execute("SELECT 1")
+
+
+def reset(connection):
+    if connection.in_transaction:
+        connection.rollback()
+
+
+class TestConnectionPool(TestCase):
+    def make_pool(self, **kwargs):
+        options = {"min_size": 1, "max_size": 2, "max_age": 60, "timeout": 0.2}
+        options.update(kwargs)
+        self.opened = []
+
+        def connect():
+            connection = sqlite3.connect(":memory:", check_same_thread=False)
+            self.opened.append(connection)
+            return connection
+
+        return ConnectionPool(connect, check=check, reset=reset, **options)
+
+    def test_reuses_connections_opened_up_front(self):
+        pool = self.make_pool(min_size=2)
+        first = pool.getconn()
+        self.assertEqual(2, len(self.opened))
+        pool.putconn(first)
+        self.assertIs(first, pool.getconn())
+        self.assertEqual(
+            {"size": 2, "idle": 1, "in_use": 1, "checkouts": 2},
+            {key: pool.stats()[key] for key in ("size", "idle", "in_use", "checkouts")},
+        )
+
+    def test_times_out_when_every_connection_is_in_use(self):
+        pool = self.make_pool()
+        pool.getconn(), pool.getconn()
+        with self.assertRaises(PoolTimeout):
+            pool.getconn()
+        stats = pool.stats()
+        self.assertEqual(1, stats["timeouts"])
+        self.assertGreaterEqual(stats["wait_time"], 0.2)
+        self.assertEqual(0, stats["waiting"])
+
+    def test_waiting_caller_gets_the_returned_connection(self):
+        pool = self.make_pool(max_size=1, timeout=5)
+        connection = pool.getconn()
+        timer = threading.Timer(0.05, pool.putconn, [connection])
+        timer.start()
+        self.assertIs(connection, pool.getconn())
+        timer.join()
+
+    def test_replaces_connections_that_fail_the_health_check(self):
+        pool = self.make_pool()
+        connection = pool.getconn()
+        pool.putconn(connection)
+        connection.close()
+        replacement = pool.getconn()
+        self.assertIsNot(connection, replacement)
+        self.assertEqual(1, pool.stats()["discarded"])
+        self.assertEqual(1, pool.stats()["size"])
+
+    def test_rolls_back_open_transactions_on_return(self):
+        pool = self.make_pool()
+        connection = pool.getconn()
+        connection.execute("CREATE TABLE t (id integer)")
+        connection.execute("INSERT INTO t VALUES (1)")
+        self.assertTrue(connection.in_transaction)
+        pool.putconn(connection)
+        self.assertFalse(connection.in_transaction)
+
+    def test_closes_connections_older_than_max_age(self):
+        pool = self.make_pool(max_age=0.05)
+        connection = pool.getconn()
+        time.sleep(0.06)
+        pool.putconn(connection)
+        self.assertIsNot(connection, pool.getconn())
+        self.assertEqual(0, pool.stats()["idle"])
+
+
+class TestDatabasePoolStatsView(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/database/pool/stats/"
+        cls.superuser = baker.make("accounts.Account", is_superuser=True)
+        cls.common_user = baker.make("accounts.Account", is_superuser=False)
+
+        cls.superuser_token = str(
+            RefreshToken.for_user(cls.superuser).access_token,
+        )
+        cls.common_user_token = str(
+            RefreshToken.for_user(cls.common_user).access_token,
+        )
+
+    def test_can_not_read_pool_stats_using_common_user_token(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.common_user_token)
+        response = self.client.get(self.BASE_URL)
+        self.assertEqual(403, response.status_code)
+
+    def test_can_read_pool_usage_using_superuser_token(self):
+        pool = ConnectionPool(
+            lambda: sqlite3.connect(":memory:", check_same_thread=False),
+            min_size=1, max_size=2, max_age=60, timeout=0.2,
+        )
+        pool.getconn()
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+        with mock.patch.dict(
+            "_core.db.postgresql.base._pools", {("default", "kanvas", ""): pool}
+        ):
+            response = self.client.get(self.BASE_URL)
+        pool.close()
+
+        self.assertEqual(200, response.status_code)
+        stats = response.json()["default:kanvas"]
+        self.assertEqual(1, stats["in_use"])
+        self.assertEqual(0, stats["waiting"])
+        self.assertIn("wait_time", stats)
+
+
+class TestPooledBackend(TestCase):
+    def test_pool_does_not_keep_the_wrapper_that_created_it(self):
+        settings_dict = {
+            "NAME": "kanvas", "OPTIONS": {}, "POOL": {"MAX_SIZE": 2},
+            "TIME_ZONE": None, "CONN_MAX_AGE": 0, "CONN_HEALTH_CHECKS": False,
+            "AUTOCOMMIT": True, "ATOMIC_REQUESTS": False,
+        }
+        with mock.patch.dict(base._pools, clear=True):
+            wrapper = base.DatabaseWrapper(settings_dict, alias="pooled")
+            pool = wrapper.get_pool({"dbname": "kanvas"})
+            self.assertIs(pool, base.DatabaseWrapper(settings_dict, alias="pooled").get_pool(
+                {"dbname": "kanvas"}
+            ))
+            self.assertEqual(["pooled:kanvas"], list(base.pool_stats()))
+
+            reference = weakref.ref(wrapper)
+            del wrapper
+            gc.collect()
+            message = "\nPool não deveria manter vivo o DatabaseWrapper que o criou."
+            self.assertIsNone(reference(), message)
+            self.assertIs(base.connect, pool.connect.func)
+
+
+class TestDatabaseEngine(TestCase):
+    def test_only_postgresql_urls_use_the_pooled_backend(self):
+        self.assertEqual("_core.db.postgresql", get_database_engine("postgres://u:p@host/db"))
+        self.assertEqual("_core.db.postgresql", get_database_engine("postgresql://host/db"))
+        self.assertIsNone(get_database_engine("sqlite:///db.sqlite3"))
+        self.assertIsNone(get_database_engine("mysql://host/db"))
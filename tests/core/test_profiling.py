@@ -0,0 +1,98 @@
+import json
+import re
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+from accounts.authentication import user_cache
+
+PROFILED = {"SAMPLE_RATE": 1.0, "LOG": True}
+
+
+def parse_server_timing(header: str) -> dict:
+    metrics = {}
+    for metric in header.split(", "):
+        name, *params = metric.split(";")
+        metrics[name] = dict(param.split("=", 1) for param in params)
+    return metrics
+
+
+class TestProfilingMiddleware(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.superuser = baker.make("accounts.Account", is_superuser=True)
+        cls.superuser_token = str(
+            RefreshToken.for_user(cls.superuser).access_token,
+        )
+        course = baker.make("courses.Course")
+        baker.make("contents.Content", course=course, _quantity=3)
+        course.students.add(*baker.make("accounts.Account", _quantity=3))
+
+    def setUp(self) -> None:
+        user_cache.clear()
+
+    def get(self, url, client=None):
+        client = client or self.client_class()
+        client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+        return client.get(url)
+
+    def test_is_off_by_default(self):
+        response = self.get("/api/courses/")
+        self.assertEqual(200, response.status_code)
+        self.assertNotIn("Server-Timing", response)
+
+    @override_settings(API_PROFILING=PROFILED)
+    def test_reports_every_phase_in_server_timing(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.get("/api/courses/")
+        self.assertEqual(200, response.status_code)
+
+        metrics = parse_server_timing(response["Server-Timing"])
+        self.assertListEqual(
+            ["db", "auth", "serializer", "render", "total"], list(metrics)
+        )
+        self.assertEqual(
+            f'"{len(context.captured_queries)} queries"', metrics["db"]["desc"]
+        )
+        for name in ("auth", "serializer", "render"):
+            message = f"\nfase {name} não foi medida: {response['Server-Timing']}"
+            self.assertGreater(float(metrics[name]["dur"]), 0, message)
+        self.assertGreaterEqual(
+            float(metrics["total"]["dur"]), float(metrics["render"]["dur"])
+        )
+
+    @override_settings(API_PROFILING=PROFILED)
+    def test_logs_one_json_line_per_profiled_request(self):
+        with self.assertLogs("_core.profiling", "INFO") as logs:
+            response = self.get("/api/courses/")
+
+        self.assertEqual(1, len(logs.records))
+        entry = json.loads(logs.records[0].getMessage())
+        self.assertEqual("GET", entry["method"])
+        self.assertEqual("/api/courses/", entry["path"])
+        self.assertEqual(200, entry["status"])
+        header_queries = re.search(r'(\d+) queries', response["Server-Timing"]).group(1)
+        self.assertEqual(int(header_queries), entry["queries"])
+
+    @override_settings(API_PROFILING={"SAMPLE_RATE": 1.0, "LOG": False})
+    async def test_profiles_async_views(self):
+        with override_settings(ROOT_URLCONF="_core.asgi_urls"):
+            response = await self.async_client_class().get(
+                "/api/courses/",
+                headers={"Authorization": "Bearer " + self.superuser_token},
+            )
+        self.assertEqual(200, response.status_code)
+        metrics = parse_server_timing(response["Server-Timing"])
+        self.assertNotEqual('"0 queries"', metrics["db"]["desc"])
+        for name in ("auth", "serializer", "render"):
+            message = f"\nfase {name} não foi medida: {response['Server-Timing']}"
+            self.assertGreater(float(metrics[name]["dur"]), 0, message)
+
+    @override_settings(API_PROFILING=PROFILED, API_COMPILED_READS=False)
+    def test_times_model_serializers_through_the_view(self):
+        with self.assertLogs("_core.profiling", "INFO"):
+            response = self.get("/api/courses/")
+        metrics = parse_server_timing(response["Server-Timing"])
+        self.assertGreater(float(metrics["serializer"]["dur"]), 0, response["Server-Timing"])
@@ -0,0 +1,323 @@
+import json
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver
+from rest_framework.test import APITestCase
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.views import TokenObtainPairView
+from accounts.authentication import user_cache
+from accounts.hashing import hashing_pool
+from _core.async_views import AsyncAPIView
+from _core.views import DatabasePoolStatsView
+from accounts.async_views import login, signup
+from accounts.views import AccountImportView, AccountView, HashingStatsView
+from contents.async_views import AsyncContentDetail
+from contents.views import ContentCreate, ContentDetail, ContentSearch
+from courses.async_views import AsyncCourseDetailView, AsyncCourseView
+from courses.views import CourseDetailView, CourseExportView, CourseView
+from students_courses.async_views import AsyncStudentsCoursesView
+from students_courses.views import StudentsCoursesView
+
+ASGI_URLCONF = "_core.asgi_urls"
+# routes outside the API: the admin and the schema documentation
+NOT_API = ("admin/", "api/schema/", "api/docs/")
+SIZES = (2, 12)
+
+# (view, method) -> (queries allowed per request whatever N, scenario)
+BUDGETS = {}
+
+
+def budget(view, method: str, queries: int, urlconf: str = None):
+    """
+    Declares that `method` on `view` runs at most `queries` SQL queries,
+    including authentication, for every dataset size. The decorated
+    scenario seeds a dataset of size N and returns the request to make,
+    served by `urlconf`, ROOT_URLCONF by default.
+    """
+    def register(scenario):
+        BUDGETS[(view, method)] = (queries, scenario, urlconf or settings.ROOT_URLCONF)
+        return scenario
+    return register
+
+
+def make_course(size: int, **kwargs):
+    course = baker.make("courses.Course", **kwargs)
+    baker.make("contents.Content", course=course, content="aula", _quantity=size)
+    course.students.add(*baker.make("accounts.Account", _quantity=size))
+    return course
+
+
+def make_content(size: int):
+    return make_course(size).contents.first()
+
+
+def api_views(patterns, prefix=""):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from api_views(pattern.url_patterns, prefix + str(pattern.pattern))
+        elif isinstance(pattern, URLPattern):
+            yield prefix + str(pattern.pattern), getattr(pattern.callback, "cls", pattern.callback)
+
+
+def view_methods(view) -> list:
+    if not isinstance(view, type):
+        # the async sign-up and login functions
+        return ["POST"]
+    if issubclass(view, AsyncAPIView):
+        # other methods are served by its sync_view
+        return ["GET"]
+    return [method for method in view().allowed_methods if method not in ("HEAD", "OPTIONS")]
+
+
+@budget(AccountView, "POST", queries=3)
+def create_account(test, size, prefix="budget"):
+    baker.make("accounts.Account", _quantity=size)
+    data = {
+        "username": f"{prefix}{size}", "email": f"{prefix}{size}@mail.com",
+        "password": "1234", "is_superuser": False,
+    }
+    return "post", "/api/accounts/", {"data": data, "format": "json"}, None
+
+
+@budget(signup, "POST", queries=3, urlconf=ASGI_URLCONF)
+def async_create_account(test, size):
+    return create_account(test, size, prefix="async")
+
+
+@budget(TokenObtainPairView, "POST", queries=1)
+def obtain_token(test, size, prefix="login"):
+    baker.make("accounts.Account", _quantity=size)
+    account = baker.make("accounts.Account", username=f"{prefix}{size}")
+    account.set_password("1234")
+    account.save()
+    data = {"username": account.username, "password": "1234"}
+    return "post", "/api/login/", {"data": data, "format": "json"}, None
+
+
+@budget(login, "POST", queries=1, urlconf=ASGI_URLCONF)
+def async_obtain_token(test, size):
+    return obtain_token(test, size, prefix="asynclogin")
+
+
+@budget(AccountImportView, "POST", queries=5)
+def import_accounts(test, size):
+    # one batch of AccountImporter.batch_size rows at most
+    rows = [
+        {"username": f"user{index}", "email": f"user{index}@mail.com", "password": "1234"}
+        for index in range(size)
+    ]
+    return "post", "/api/accounts/import/", {
+        "data": json.dumps(rows), "content_type": "application/json",
+    }, test.superuser
+
+
+@budget(HashingStatsView, "GET", queries=1)
+def hashing_stats(test, size):
+    return "get", "/api/accounts/hashing/stats/", {}, test.superuser
+
+
+@budget(DatabasePoolStatsView, "GET", queries=1)
+def database_pool_stats(test, size):
+    return "get", "/api/database/pool/stats/", {}, test.superuser
+
+
+@budget(CourseView, "GET", queries=4)
+def list_courses(test, size):
+    for _ in range(size):
+        make_course(size)
+    return "get", "/api/courses/", {}, test.superuser
+
+
+@budget(AsyncCourseView, "GET", queries=4, urlconf=ASGI_URLCONF)
+def async_list_courses(test, size):
+    return list_courses(test, size)
+
+
+@budget(CourseView, "POST", queries=6)
+def create_course(test, size):
+    for _ in range(size):
+        make_course(size)
+    data = {"name": f"Created {size}", "start_date": "2023-08-28", "end_date": "2023-10-28"}
+    return "post", "/api/courses/", {"data": data, "format": "json"}, test.superuser
+
+
+@budget(CourseExportView, "GET", queries=4)
+def export_courses(test, size):
+    # one chunk of CourseExportView.chunk_size courses at most
+    for _ in range(size):
+        make_course(size)
+    return "get", "/api/courses/export/", {}, test.superuser
+
+
+@budget(CourseDetailView, "GET", queries=4)
+def retrieve_course(test, size):
+    course = make_course(size)
+    return "get", f"/api/courses/{course.id}/", {}, test.superuser
+
+
+@budget(AsyncCourseDetailView, "GET", queries=4, urlconf=ASGI_URLCONF)
+def async_retrieve_course(test, size):
+    return retrieve_course(test, size)
+
+
+@budget(CourseDetailView, "PUT", queries=10)
+def update_course(test, size):
+    # authentication, the course with its contents and students, the UPDATE
+    # and the version bump inside a savepoint (the test case's transaction)
+    # and, for the response, the contents and students again
+    course = make_course(size)
+    data = {"name": f"Updated {size}", "start_date": "2023-08-28", "end_date": "2023-10-28"}
+    return "put", f"/api/courses/{course.id}/", {"data": data, "format": "json"}, test.superuser
+
+
+@budget(CourseDetailView, "PATCH", queries=10)
+def partial_update_course(test, size):
+    # the same queries as PUT
+    course = make_course(size)
+    return "patch", f"/api/courses/{course.id}/", {
+        "data": {"name": f"Renamed {size}"}, "format": "json",
+    }, test.superuser
+
+
+@budget(CourseDetailView, "DELETE", queries=9)
+def destroy_course(test, size):
+    # authentication, the course with its contents and students, the
+    # collector reading the contents and enrollments, and one DELETE per table
+    course = make_course(size)
+    return "delete", f"/api/courses/{course.id}/", {}, test.superuser
+
+
+@budget(ContentCreate, "POST", queries=4)
+def create_content(test, size):
+    course = make_course(size)
+    data = {"name": "Budget", "content": "aula", "video_url": "https://videos.com/1"}
+    return "post", f"/api/courses/{course.id}/contents/", {
+        "data": data, "format": "json",
+    }, test.superuser
+
+
+@budget(ContentDetail, "GET", queries=2)
+def retrieve_content(test, size):
+    content = make_content(size)
+    student = content.course.students.first()
+    return "get", f"/api/courses/{content.course_id}/contents/{content.id}/", {}, student
+
+
+@budget(AsyncContentDetail, "GET", queries=2, urlconf=ASGI_URLCONF)
+def async_retrieve_content(test, size):
+    return retrieve_content(test, size)
+
+
+@budget(ContentDetail, "PUT", queries=4)
+def update_content(test, size):
+    content = make_content(size)
+    data = {"name": "Budget", "content": "aula", "video_url": "https://videos.com/1"}
+    return "put", f"/api/courses/{content.course_id}/contents/{content.id}/", {
+        "data": data, "format": "json",
+    }, test.superuser
+
+
+@budget(ContentDetail, "PATCH", queries=4)
+def partial_update_content(test, size):
+    content = make_content(size)
+    return "patch", f"/api/courses/{content.course_id}/contents/{content.id}/", {
+        "data": {"name": "Budget"}, "format": "json",
+    }, test.superuser
+
+
+@budget(ContentDetail, "DELETE", queries=4)
+def destroy_content(test, size):
+    content = make_content(size)
+    return "delete", f"/api/courses/{content.course_id}/contents/{content.id}/", {}, test.superuser
+
+
+@budget(ContentSearch, "GET", queries=2)
+def search_contents(test, size):
+    for _ in range(size):
+        make_course(size)
+    return "get", "/api/contents/search/", {"data": {"q": "aula"}}, test.superuser
+
+
+@budget(StudentsCoursesView, "GET", queries=3)
+def retrieve_roster(test, size):
+    course = make_course(size)
+    return "get", f"/api/courses/{course.id}/students/", {}, test.superuser
+
+
+@budget(AsyncStudentsCoursesView, "GET", queries=3, urlconf=ASGI_URLCONF)
+def async_retrieve_roster(test, size):
+    return retrieve_roster(test, size)
+
+
+@budget(StudentsCoursesView, "PUT", queries=7)
+def enroll_students(test, size):
+    course = make_course(size)
+    students = baker.make("accounts.Account", _quantity=size)
+    data = {"students_courses": [{"student_email": student.email} for student in students]}
+    return "put", f"/api/courses/{course.id}/students/", {
+        "data": data, "format": "json",
+    }, test.superuser
+
+
+@budget(StudentsCoursesView, "PATCH", queries=7)
+def partial_enroll_students(test, size):
+    course = make_course(size)
+    students = baker.make("accounts.Account", _quantity=size)
+    data = {"students_courses": [{"student_email": student.email} for student in students]}
+    return "patch", f"/api/courses/{course.id}/students/", {
+        "data": data, "format": "json",
+    }, test.superuser
+
+
+class TestQueryBudgets(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.superuser = baker.make("accounts.Account", is_superuser=True)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        hashing_pool.shutdown()
+        super().tearDownClass()
+
+    def count_queries(self, scenario, urlconf, size) -> int:
+        method, url, kwargs, user = scenario(self, size)
+        self.client.credentials()
+        if user is not None:
+            token = str(RefreshToken.for_user(user).access_token)
+            self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+        user_cache.clear()
+
+        with self.settings(ROOT_URLCONF=urlconf), CaptureQueriesContext(connection) as context:
+            response = getattr(self.client, method)(url, **kwargs)
+            if response.streaming:
+                b"".join(response.streaming_content)
+        self.assertLess(response.status_code, 300, f"\n<{method.upper()} {url}> {response!r}")
+        return len(context.captured_queries)
+
+    def test_every_view_declares_a_budget(self):
+        for urlconf in (settings.ROOT_URLCONF, ASGI_URLCONF):
+            for route, view in api_views(get_resolver(urlconf).url_patterns):
+                if route.startswith(NOT_API):
+                    continue
+                for method in view_methods(view):
+                    with self.subTest(urlconf=urlconf, route=route, method=method):
+                        message = (
+                            f"\n<{method} {route}> {view.__name__} não declara orçamento de queries."
+                        )
+                        self.assertIn((view, method), BUDGETS, message)
+
+    def test_query_count_stays_within_budget_at_every_size(self):
+        for (view, method), (queries, scenario, urlconf) in BUDGETS.items():
+            with self.subTest(view=view.__name__, method=method):
+                counts = [self.count_queries(scenario, urlconf, size) for size in SIZES]
+                name = f"{method} {view.__name__}"
+                self.assertEqual(
+                    counts[0], counts[-1],
+                    f"\n<{name}> número de queries cresce com N: {dict(zip(SIZES, counts))}.",
+                )
+                self.assertLessEqual(
+                    counts[-1], queries,
+                    f"\n<{name}> {counts[-1]} queries excedem o orçamento de {queries}.",
+                )
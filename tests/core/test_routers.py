@@ -0,0 +1,108 @@
+from django.db import router as db_router, transaction
+from django.test import override_settings
+from rest_framework.test import APITransactionTestCase
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+from _core.db.routers import ReplicaRouter, RoutingState, routing_state
+from accounts.authentication import user_cache
+from courses.models import Course
+
+REPLICA = "sqlite3_replica"
+
+
+@override_settings(DATABASE_REPLICA_STICKY_SECONDS=60)
+class TestReplicaRouting(APITransactionTestCase):
+    # TestCase would wrap every query in a transaction, which pins reads
+    # to the primary
+    databases = {"default", REPLICA}
+
+    def setUp(self) -> None:
+        # undone before the flush between tests, which skips the tables of
+        # databases the router does not migrate
+        self.enterContext(self.settings(DATABASE_REPLICAS=[REPLICA]))
+        superuser = baker.make("accounts.Account", is_superuser=True)
+        superuser.save(using=REPLICA)
+        baker.make("courses.Course", name="Primary")
+        baker.make("courses.Course", name="Replica", _using=REPLICA)
+        user_cache.clear()
+        token = str(RefreshToken.for_user(superuser).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+
+    def course_names(self) -> list:
+        response = self.client.get("/api/courses/")
+        self.assertEqual(200, response.status_code)
+        return sorted(course["name"] for course in response.json())
+
+    def test_safe_methods_read_from_the_replica(self):
+        self.assertEqual(["Replica"], self.course_names())
+        with override_settings(DATABASE_REPLICAS=[]):
+            self.assertEqual(["Primary"], self.course_names())
+
+    def test_writes_go_to_the_primary_and_stick_to_it(self):
+        course_data = {"name": "New", "start_date": "2023-08-28", "end_date": "2023-10-28"}
+        response = self.client.post("/api/courses/", course_data, format="json")
+        self.assertEqual(201, response.status_code)
+        self.assertTrue(Course.objects.using("default").filter(name="New").exists())
+        self.assertFalse(Course.objects.using(REPLICA).filter(name="New").exists())
+
+        message = "\nleitura logo após escrita deveria usar o banco primário."
+        self.assertEqual(["New", "Primary"], self.course_names(), message)
+
+        self.client.cookies["primary_until"] = "0"
+        self.assertEqual(["Replica"], self.course_names())
+
+    def test_failed_writes_do_not_stick_to_the_primary(self):
+        response = self.client.post("/api/courses/", {}, format="json")
+        self.assertEqual(400, response.status_code)
+        self.assertNotIn("primary_until", response.cookies)
+
+    def test_writes_that_raise_do_not_stick_to_the_primary(self):
+        # the name is taken, which only the INSERT finds out
+        course_data = {"name": "Primary", "start_date": "2023-08-28", "end_date": "2023-10-28"}
+        response = self.client.post("/api/courses/", course_data, format="json")
+        self.assertEqual(400, response.status_code)
+        message = "\nescrita que falhou não deveria fixar o cliente no primário."
+        self.assertNotIn("primary_until", response.cookies, message)
+
+    def test_rolled_back_writes_do_not_count(self):
+        state = RoutingState(use_replica=True)
+        token = routing_state.set(state)
+        try:
+            with self.assertRaises(ZeroDivisionError), transaction.atomic():
+                baker.make("courses.Course")
+                1 / 0
+            self.assertFalse(state.wrote)
+            with transaction.atomic():
+                baker.make("courses.Course")
+                self.assertFalse(state.wrote)
+            self.assertTrue(state.wrote)
+        finally:
+            routing_state.reset(token)
+
+    def test_migrations_skip_the_replicas(self):
+        self.assertFalse(db_router.allow_migrate(REPLICA, "courses"))
+        self.assertTrue(db_router.allow_migrate("default", "courses"))
+
+    def test_transactions_and_requests_that_wrote_read_from_the_primary(self):
+        router = ReplicaRouter()
+        token = routing_state.set(RoutingState(use_replica=True))
+        try:
+            self.assertEqual(REPLICA, router.db_for_read(Course))
+            with transaction.atomic():
+                self.assertEqual("default", router.db_for_read(Course))
+            router.db_for_write(Course)
+            self.assertEqual("default", router.db_for_read(Course))
+        finally:
+            routing_state.reset(token)
+
+    def test_authentication_loads_the_account_from_the_primary(self):
+        # the replica has not caught up with the promotion yet
+        common_user = baker.make("accounts.Account", is_superuser=True)
+        common_user.is_superuser = False
+        common_user.save(using=REPLICA)
+        token = str(RefreshToken.for_user(common_user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+
+        message = "\nconta autenticada foi lida de uma réplica atrasada."
+        self.assertEqual(200, self.client.get("/api/courses/export/").status_code, message)
+        self.assertTrue(user_cache.get(str(common_user.id)).is_superuser, message)
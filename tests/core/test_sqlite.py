@@ -0,0 +1,26 @@
+import os
+import tempfile
+from unittest import TestCase
+from _core.db.sqlite3.base import DEFAULT_MMAP_SIZE, DatabaseWrapper
+
+SETTINGS = {
+    "OPTIONS": {}, "TIME_ZONE": None, "CONN_MAX_AGE": 0, "CONN_HEALTH_CHECKS": False,
+    "AUTOCOMMIT": True, "ATOMIC_REQUESTS": False,
+}
+
+
+class TestSqliteBackend(TestCase):
+    def mmap_size(self, **settings) -> int:
+        with tempfile.TemporaryDirectory() as directory:
+            wrapper = DatabaseWrapper(
+                {**SETTINGS, "NAME": os.path.join(directory, "db.sqlite3"), **settings}
+            )
+            connection = wrapper.get_new_connection(wrapper.get_connection_params())
+            try:
+                return connection.execute("PRAGMA mmap_size").fetchone()[0]
+            finally:
+                connection.close()
+
+    def test_database_file_is_memory_mapped(self):
+        self.assertEqual(DEFAULT_MMAP_SIZE, self.mmap_size(), "Arquivo deveria ser mapeado em memória")
+        self.assertEqual(0, self.mmap_size(MMAP_SIZE=0), "MMAP_SIZE=0 deveria desligar o mmap")
@@ -0,0 +1,141 @@
+from unittest import mock
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from model_bakery import baker
+from rest_framework.throttling import UserRateThrottle
+from rest_framework_simplejwt.tokens import RefreshToken
+from accounts.authentication import user_cache
+
+
+class TestAsyncReadViews(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.superuser = baker.make("accounts.Account", is_superuser=True)
+        cls.student = baker.make("accounts.Account", is_superuser=False)
+        cls.outsider = baker.make("accounts.Account", is_superuser=False)
+        cls.course = baker.make("courses.Course")
+        cls.other_course = baker.make("courses.Course")
+        cls.content = baker.make("contents.Content", course=cls.course)
+        baker.make("contents.Content", course=cls.course)
+        cls.course.students.add(cls.student, *baker.make("accounts.Account", _quantity=2))
+
+    def setUp(self) -> None:
+        user_cache.clear()
+
+    def auth(self, user) -> dict:
+        token = str(RefreshToken.for_user(user).access_token)
+        return {"Authorization": f"Bearer {token}"}
+
+    async def assertSameAsSync(self, url, user=None, data=None, **headers):
+        if user is not None:
+            headers.update(self.auth(user))
+        expected = await self.async_client.get(url, data, headers=headers)
+        with override_settings(ROOT_URLCONF="_core.asgi_urls"):
+            response = await self.async_client.get(url, data, headers=headers)
+
+        message = f"\n<{url}> view assíncrona difere da view síncrona."
+        self.assertEqual(expected.status_code, response.status_code, message)
+        self.assertEqual(expected.content, response.content, message)
+        for header in ("Link", "ETag", "WWW-Authenticate", "Allow", "Vary", "Content-Type"):
+            self.assertEqual(expected.get(header), response.get(header), message)
+        return response
+
+    async def test_course_list(self):
+        await self.assertSameAsSync("/api/courses/", self.superuser)
+        await self.assertSameAsSync("/api/courses/", self.superuser, {"page_size": 1})
+        response = await self.assertSameAsSync("/api/courses/", self.student)
+        self.assertEqual(1, len(response.json()))
+        await self.assertSameAsSync("/api/courses/", self.student, {"fields": "id,name"})
+
+    async def test_course_detail_and_not_modified(self):
+        url = f"/api/courses/{self.course.id}/"
+        response = await self.assertSameAsSync(url, self.student)
+        response = await self.assertSameAsSync(
+            url, self.student, **{"If-None-Match": response["ETag"]}
+        )
+        self.assertEqual(304, response.status_code)
+        await self.assertSameAsSync(f"/api/courses/{self.student.id}/", self.student)
+
+    async def test_content_detail(self):
+        url = f"/api/courses/{self.course.id}/contents/{self.content.id}/"
+        response = await self.assertSameAsSync(url, self.student)
+        self.assertEqual(200, response.status_code)
+        response = await self.assertSameAsSync(url, self.outsider)
+        self.assertEqual(403, response.status_code)
+        await self.assertSameAsSync(url, self.superuser)
+        await self.assertSameAsSync(
+            f"/api/courses/{self.other_course.id}/contents/{self.content.id}/",
+            self.superuser,
+        )
+
+    async def test_roster(self):
+        url = f"/api/courses/{self.course.id}/students/"
+        await self.assertSameAsSync(url, self.superuser)
+        await self.assertSameAsSync(url, self.superuser, {"page_size": 2})
+        response = await self.assertSameAsSync(url, self.student)
+        self.assertEqual(403, response.status_code)
+
+    @override_settings(API_COMPILED_READS=False)
+    async def test_reads_without_compiled_serializers(self):
+        with mock.patch(
+            "_core.serializers.CompiledSerializer.aserialize",
+            side_effect=AssertionError("CompiledSerializer usado com API_COMPILED_READS=False"),
+        ):
+            await self.assertSameAsSync("/api/courses/", self.superuser, {"page_size": 1})
+            await self.assertSameAsSync("/api/courses/", self.student, {"fields": "id,name"})
+            url = f"/api/courses/{self.course.id}/"
+            await self.assertSameAsSync(url, self.student)
+            await self.assertSameAsSync(url, self.student, {"omit": "contents"})
+            await self.assertSameAsSync(
+                f"/api/courses/{self.course.id}/students/", self.superuser, {"page_size": 2}
+            )
+
+    async def test_authentication_errors(self):
+        await self.assertSameAsSync("/api/courses/")
+        response = await self.assertSameAsSync(
+            "/api/courses/", Authorization="Bearer invalid"
+        )
+        self.assertEqual(401, response.status_code)
+
+    async def test_content_negotiation(self):
+        url = f"/api/courses/{self.course.id}/"
+        response = await self.assertSameAsSync(url, self.student, Accept="application/xml")
+        self.assertEqual(406, response.status_code)
+        await self.assertSameAsSync(url, self.student, {"format": "json"})
+
+        with override_settings(ROOT_URLCONF="_core.asgi_urls"):
+            response = await self.async_client.get(
+                url, headers={**self.auth(self.student), "Accept": "text/html"}
+            )
+        message = f"\n<{url}> view assíncrona deveria servir a API navegável."
+        self.assertEqual(200, response.status_code, message)
+        self.assertTrue(response["Content-Type"].startswith("text/html"), message)
+        self.assertIn(self.course.name.encode(), response.content, message)
+
+    async def test_throttles_apply(self):
+        url = f"/api/courses/{self.course.id}/"
+        cache.clear()
+        with (
+            override_settings(ROOT_URLCONF="_core.asgi_urls"),
+            mock.patch(
+                "courses.async_views.AsyncCourseDetailView.throttle_classes",
+                [UserRateThrottle],
+            ),
+            mock.patch.dict(UserRateThrottle.THROTTLE_RATES, {"user": "1/min"}),
+        ):
+            first = await self.async_client.get(url, headers=self.auth(self.student))
+            second = await self.async_client.get(url, headers=self.auth(self.student))
+        message = f"\n<{url}> view assíncrona deveria aplicar os throttles."
+        self.assertEqual(200, first.status_code, message)
+        self.assertEqual(429, second.status_code, message)
+        self.assertIn("Retry-After", second, message)
+
+    async def test_writes_are_served_by_the_sync_views(self):
+        url = f"/api/courses/{self.course.id}/"
+        with override_settings(ROOT_URLCONF="_core.asgi_urls"):
+            response = await self.async_client.patch(
+                url, {"name": "Async"}, content_type="application/json",
+                headers=self.auth(self.superuser),
+            )
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("Async", response.json()["name"])
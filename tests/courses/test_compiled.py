@@ -0,0 +1,113 @@
+import json
+from django.test import TestCase, override_settings
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+from _core.serializers import CompiledSerializer, compile_serializer
+from courses.models import Course
+from courses.serializers import CourseSerializer
+from students_courses.models import StudentCourse
+from students_courses.serializers import StudentsCoursesSerializer
+
+
+class TestCompiledSerializer(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        instructor = baker.make("accounts.Account")
+        cls.courses = [
+            baker.make("courses.Course", instructor=instructor),
+            baker.make("courses.Course"),
+            baker.make("courses.Course"),
+        ]
+        baker.make("contents.Content", course=cls.courses[0], _quantity=3)
+        baker.make("contents.Content", course=cls.courses[1], video_url=None)
+        for course in cls.courses[:2]:
+            course.students.add(*baker.make("accounts.Account", _quantity=3))
+
+    def assertSamePayload(self, serializer_class, queryset, fieldset="", **kwargs):
+        instances = queryset.order_by("pk")
+        expected = serializer_class(instances, many=True, **kwargs).data
+        compiled = compile_serializer(serializer_class, fieldset)
+        data = compiled.serialize(compiled.values(queryset).order_by("pk"))
+        message = f"\n{serializer_class.__name__} compilado gerou payload diferente."
+        renderer = JSONRenderer()
+        self.assertEqual(renderer.render(expected), renderer.render(data), message)
+
+    def test_course_payload_matches_serializer(self):
+        self.assertSamePayload(CourseSerializer, Course.objects.with_contents_and_students())
+
+    def test_course_payload_with_fieldset_matches_serializer(self):
+        fields = {"id": {}, "instructor": {}, "contents": {"name": {}, "video_url": {}}}
+        self.assertSamePayload(
+            CourseSerializer, Course.objects.with_contents_and_students(),
+            json.dumps({"fields": fields, "omit": {}}, sort_keys=True), fields=fields,
+        )
+
+    def test_roster_payload_matches_serializer(self):
+        self.assertSamePayload(
+            StudentsCoursesSerializer, StudentCourse.objects.select_related("student")
+        )
+
+    def test_compiles_once_per_serializer_and_fieldset(self):
+        self.assertIs(compile_serializer(CourseSerializer), compile_serializer(CourseSerializer))
+
+    def test_serializes_with_one_query_per_relation(self):
+        compiled = compile_serializer(CourseSerializer)
+        with self.assertNumQueries(3):
+            compiled.serialize(compiled.values(Course.objects.all()))
+
+    def test_refuses_fields_it_can_not_compile(self):
+        class MethodSerializer(serializers.ModelSerializer):
+            upper_name = serializers.SerializerMethodField()
+
+            class Meta:
+                model = Course
+                fields = ["id", "upper_name"]
+
+        with self.assertRaises(TypeError):
+            CompiledSerializer(MethodSerializer())
+
+
+class TestCompiledReadViews(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.superuser = baker.make("accounts.Account", is_superuser=True)
+        cls.superuser_token = str(
+            RefreshToken.for_user(cls.superuser).access_token,
+        )
+        cls.course = baker.make("courses.Course")
+        baker.make("contents.Content", course=cls.course, _quantity=2)
+        cls.course.students.add(*baker.make("accounts.Account", _quantity=3))
+        baker.make("courses.Course", _quantity=2)
+
+    def setUp(self) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+
+    def assertSameResponse(self, url, **params):
+        compiled = self.client.get(url, params)
+        with override_settings(API_COMPILED_READS=False):
+            expected = self.client.get(url, params)
+        self.assertEqual(200, compiled.status_code)
+        message = f"\n<{url}> leitura compilada difere da leitura com serializer."
+        self.assertEqual(expected.content, compiled.content, message)
+        self.assertEqual(expected.get("Link"), compiled.get("Link"), message)
+        self.assertEqual(expected.get("ETag"), compiled.get("ETag"), message)
+
+    def test_course_list(self):
+        self.assertSameResponse("/api/courses/")
+        self.assertSameResponse("/api/courses/", page_size=2)
+        self.assertSameResponse("/api/courses/", omit="contents.content")
+
+    def test_course_detail(self):
+        self.assertSameResponse(f"/api/courses/{self.course.id}/")
+        self.assertSameResponse(f"/api/courses/{self.course.id}/", fields="name,contents.id")
+
+    def test_roster(self):
+        self.assertSameResponse(f"/api/courses/{self.course.id}/students/")
+        self.assertSameResponse(f"/api/courses/{self.course.id}/students/", page_size=1)
+
+    def test_course_detail_not_found(self):
+        response = self.client.get(f"/api/courses/{self.superuser.id}/")
+        self.assertEqual(404, response.status_code)
@@ -0,0 +1,115 @@
+import gzip
+import json
+import zlib
+import brotli
+from django.contrib.auth.hashers import make_password
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+from _core.middleware import parse_accept_encoding
+
+
+class TestApiCompression(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/courses/"
+        cls.superuser = baker.make("accounts.Account", is_superuser=True)
+        cls.superuser_token = str(
+            RefreshToken.for_user(cls.superuser).access_token,
+        )
+        cls.course = baker.make("courses.Course")
+        baker.make(
+            "contents.Content", course=cls.course,
+            content="Lesson text repeated. " * 200, _quantity=5,
+        )
+
+    def setUp(self) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+
+    def test_prefers_brotli(self):
+        plain = self.client.get(self.BASE_URL)
+        response = self.client.get(self.BASE_URL, HTTP_ACCEPT_ENCODING="gzip, deflate, br")
+        message = f"\n<{self.BASE_URL}> resposta deveria ser comprimida com brotli."
+        self.assertEqual("br", response["Content-Encoding"], message)
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(plain.content, brotli.decompress(response.content))
+        self.assertLess(len(response.content) * 5, len(plain.content))
+
+    def test_gzip_when_brotli_is_not_accepted(self):
+        plain = self.client.get(self.BASE_URL)
+        response = self.client.get(self.BASE_URL, HTTP_ACCEPT_ENCODING="gzip, br;q=0")
+        self.assertEqual("gzip", response["Content-Encoding"])
+        self.assertEqual(str(len(response.content)), response["Content-Length"])
+        self.assertEqual(plain.content, gzip.decompress(response.content))
+
+    def test_without_accept_encoding_is_not_compressed(self):
+        response = self.client.get(self.BASE_URL)
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(1, len(response.json()))
+
+    def test_small_responses_are_not_compressed(self):
+        response = self.client.get(
+            self.BASE_URL, {"fields": "name"}, HTTP_ACCEPT_ENCODING="br"
+        )
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_etag_is_weakened_and_still_matches(self):
+        url = f"{self.BASE_URL}{self.course.id}/"
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="br")
+        etag = response["ETag"]
+        self.assertTrue(etag.startswith('W/"'))
+
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="br", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(304, response.status_code)
+
+    def test_streams_export_chunk_by_chunk(self):
+        baker.make("courses.Course", _quantity=3)
+        url = f"{self.BASE_URL}export/"
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual("gzip", response["Content-Encoding"])
+
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        chunks = [decompressor.decompress(chunk) for chunk in response.streaming_content]
+        message = f"\n<{url}> cada linha deveria poder ser lida assim que chega."
+        self.assertTrue(all(chunk.endswith(b"\n") for chunk in chunks[:4]), message)
+        lines = b"".join(chunks).splitlines()
+        self.assertEqual(4, len(lines))
+        self.assertIn(str(self.course.id), [json.loads(line)["id"] for line in lines])
+
+    @override_settings(API_COMPRESSION={
+        "PATH_PREFIX": "/api/", "MIN_SIZE": 1024,
+        "BROTLI_QUALITY": 4, "GZIP_LEVEL": 5, "STREAMING": False,
+    })
+    def test_streaming_can_be_disabled(self):
+        response = self.client.get(f"{self.BASE_URL}export/", HTTP_ACCEPT_ENCODING="br")
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_parse_accept_encoding(self):
+        self.assertDictEqual(
+            {"br": 1.0, "gzip": 0.5, "*": 0.0},
+            parse_accept_encoding("br, gzip;q=0.5, *;q=0"),
+        )
+
+    def test_varies_on_the_credentials_of_the_request(self):
+        response = self.client.get(self.BASE_URL, HTTP_ACCEPT_ENCODING="br")
+        message = f"\n<{self.BASE_URL}> cache não deveria compartilhar respostas entre usuários."
+        self.assertIn("Authorization", response["Vary"], message)
+
+    @override_settings(API_COMPRESSION={
+        "PATH_PREFIX": "/api/", "MIN_SIZE": 0,
+        "BROTLI_QUALITY": 4, "GZIP_LEVEL": 5, "STREAMING": True,
+    })
+    def test_login_tokens_are_not_compressed(self):
+        self.client.credentials()
+        baker.make("accounts.Account", username="breach", password=make_password("1234"))
+        message = "\n<{}> tokens não deveriam ser comprimidos (BREACH)."
+        for urlconf in ("_core.urls", "_core.asgi_urls"):
+            with self.subTest(urlconf=urlconf), override_settings(ROOT_URLCONF=urlconf):
+                response = self.client.post(
+                    "/api/login/", {"username": "breach", "password": "1234"},
+                    format="json", HTTP_ACCEPT_ENCODING="br, gzip",
+                )
+                self.assertEqual(200, response.status_code)
+                self.assertIn("access", response.json(), message.format(urlconf))
+                self.assertFalse(response.has_header("Content-Encoding"), message.format(urlconf))
@@ -0,0 +1,133 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class TestCourseETag(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/courses/"
+        cls.superuser = baker.make("accounts.Account", is_superuser=True)
+        cls.superuser_token = str(
+            RefreshToken.for_user(cls.superuser).access_token,
+        )
+
+    def setUp(self) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+        self.course = baker.make("courses.Course")
+        baker.make("contents.Content", course=self.course, _quantity=3)
+        self.url = f"{self.BASE_URL}{self.course.id}/"
+
+    def get_etag(self):
+        response = self.client.get(self.url)
+        self.assertEqual(200, response.status_code)
+        self.assertIn("ETag", response.headers)
+        return response.headers["ETag"]
+
+    def test_can_answer_not_modified_without_serializing(self):
+        etag = self.get_etag()
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        message = f"<{self.url}> requisição condicional deveria retornar 304."
+        self.assertEqual(304, response.status_code, message)
+        self.assertEqual(etag, response.headers["ETag"])
+        self.assertEqual(b"", response.content)
+        message = f"<{self.url}> requisição condicional deveria usar uma única query."
+        self.assertEqual(1, len(context.captured_queries), message)
+
+    def test_etag_changes_when_course_is_updated(self):
+        etag = self.get_etag()
+        response = self.client.patch(self.url, {"name": "React"}, format="json")
+        self.assertEqual(200, response.status_code)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("React", response.json()["name"])
+        self.assertNotEqual(etag, response.headers["ETag"])
+
+    def test_etag_differs_per_fieldset(self):
+        etag = self.get_etag()
+        response = self.client.get(self.url, {"fields": "name"}, HTTP_IF_NONE_MATCH=etag)
+        message = f"<{self.url}> ETag da representação completa não vale para ?fields=."
+        self.assertEqual(200, response.status_code, message)
+        self.assertNotEqual(etag, response.headers["ETag"])
+
+        sparse_etag = response.headers["ETag"]
+        response = self.client.get(
+            self.url, {"fields": "name,name"}, HTTP_IF_NONE_MATCH=sparse_etag
+        )
+        self.assertEqual(304, response.status_code)
+        response = self.client.get(self.url, {"omit": "name"}, HTTP_IF_NONE_MATCH=sparse_etag)
+        self.assertEqual(200, response.status_code)
+
+    def test_saving_bumps_the_version_without_reading_it_back(self):
+        self.course.refresh_from_db()
+        version = self.course.version
+        with CaptureQueriesContext(connection) as context:
+            self.course.name = "Vue"
+            self.course.save()
+        message = "Salvar o curso não deveria reler a versão."
+        self.assertFalse(
+            any(query["sql"].startswith("SELECT") for query in context.captured_queries), message
+        )
+        self.assertEqual(version, self.course.version)
+        self.course.refresh_from_db(fields=["version"])
+        self.assertEqual(version + 1, self.course.version)
+
+    def test_etag_changes_when_contents_change(self):
+        etag = self.get_etag()
+        baker.make("contents.Content", course=self.course)
+        self.assertNotEqual(etag, self.get_etag())
+
+        etag = self.get_etag()
+        self.course.contents.first().delete()
+        self.assertNotEqual(etag, self.get_etag())
+
+    def test_etag_changes_when_students_are_enrolled(self):
+        etag = self.get_etag()
+        student = baker.make("accounts.Account")
+        response = self.client.put(
+            f"{self.url}students/",
+            {"students_courses": [{"student_email": student.email}]},
+            format="json",
+        )
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(etag, self.get_etag())
+
+        etag = self.get_etag()
+        self.course.students.remove(student)
+        self.assertNotEqual(etag, self.get_etag())
+
+
+class TestContentETag(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.common_user = baker.make("accounts.Account", is_superuser=False)
+        cls.common_user_token = str(
+            RefreshToken.for_user(cls.common_user).access_token,
+        )
+        cls.content = baker.make("contents.Content")
+        cls.url = f"/api/courses/{cls.content.course.id}/contents/{cls.content.id}/"
+
+    def setUp(self) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.common_user_token)
+
+    def test_can_answer_not_modified_to_participant(self):
+        self.content.course.students.add(self.common_user)
+        etag = self.client.get(self.url).headers["ETag"]
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        message = f"<{self.url}> requisição condicional deveria retornar 304."
+        self.assertEqual(304, response.status_code, message)
+
+    def test_can_not_answer_not_modified_to_non_participant(self):
+        self.content.course.students.add(self.common_user)
+        etag = self.client.get(self.url).headers["ETag"]
+        self.content.course.students.remove(self.common_user)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        message = f"<{self.url}> usuário sem matrícula não deveria receber 304."
+        self.assertEqual(403, response.status_code, message)
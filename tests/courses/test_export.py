@@ -0,0 +1,51 @@
+import json
+from rest_framework.test import APITestCase
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class TestCourseExportView(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/courses/export/"
+        cls.superuser = baker.make("accounts.Account", is_superuser=True)
+        cls.common_user = baker.make("accounts.Account", is_superuser=False)
+
+        cls.superuser_token = str(
+            RefreshToken.for_user(cls.superuser).access_token,
+        )
+        cls.common_user_token = str(
+            RefreshToken.for_user(cls.common_user).access_token,
+        )
+        cls.courses = baker.make("courses.Course", _quantity=3)
+        for course in cls.courses:
+            baker.make("contents.Content", course=course, _quantity=2)
+        cls.courses[0].students.add(cls.common_user)
+
+    def test_can_export_courses_as_ndjson_using_superuser_token(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+        response = self.client.get(self.BASE_URL)
+        expected_status_code = 200
+        message = f"<{self.BASE_URL}> status code retornado diferente de {expected_status_code}."
+        self.assertEqual(expected_status_code, response.status_code, message)
+        self.assertTrue(response.streaming)
+        self.assertEqual("application/x-ndjson", response["Content-Type"])
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        message = f"<{self.BASE_URL}> exportação não está retornando todos os cursos."
+        self.assertEqual(len(self.courses), len(lines), message)
+
+        for line in lines:
+            exported = json.loads(line)
+            detail = self.client.get(f"/api/courses/{exported['id']}/").json()
+            message = f"<{self.BASE_URL}> linha exportada difere do retorno da API."
+            self.assertEqual(detail, exported, message)
+
+    def test_can_not_export_courses_using_common_user_token(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.common_user_token)
+        response = self.client.get(self.BASE_URL)
+        self.assertEqual(403, response.status_code)
+
+    def test_can_not_export_courses_without_token(self):
+        response = self.client.get(self.BASE_URL)
+        self.assertEqual(401, response.status_code)
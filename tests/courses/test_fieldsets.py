@@ -0,0 +1,71 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class TestCourseFieldsets(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/courses/"
+        cls.superuser = baker.make("accounts.Account", is_superuser=True)
+        cls.superuser_token = str(
+            RefreshToken.for_user(cls.superuser).access_token,
+        )
+        cls.course = baker.make("courses.Course")
+        baker.make("contents.Content", course=cls.course, _quantity=3)
+        cls.course.students.add(baker.make("accounts.Account"))
+
+    def setUp(self) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+
+    def get(self, url, **params):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+        self.assertEqual(200, response.status_code)
+        return response, [query["sql"] for query in context.captured_queries]
+
+    def test_fields_trims_list_and_skips_relations(self):
+        response, queries = self.get(self.BASE_URL, fields="name,start_date")
+        message = f"\n<{self.BASE_URL}> ?fields= não limitou os campos retornados."
+        self.assertSetEqual({"name", "start_date"}, set(response.json()[0].keys()), message)
+
+        message = f"\n<{self.BASE_URL}> ?fields= não deveria ler conteúdos ou alunos."
+        self.assertFalse(
+            [sql for sql in queries if "contents_content" in sql or "studentcourse" in sql],
+            message,
+        )
+        course_query = next(sql for sql in queries if 'FROM "courses_course"' in sql)
+        self.assertNotIn('"courses_course"."status"', course_query)
+
+    def test_omit_nested_field_is_not_read_from_database(self):
+        url = f"{self.BASE_URL}{self.course.id}/"
+        response, queries = self.get(url, omit="contents.content,students_courses")
+        body = response.json()
+        self.assertNotIn("students_courses", body)
+        self.assertEqual(3, len(body["contents"]))
+        self.assertSetEqual({"id", "name", "video_url"}, set(body["contents"][0].keys()))
+        self.assertIn("ETag", response.headers)
+
+        message = f"\n<{url}> ?omit=contents.content não deveria ler o texto das aulas."
+        contents_query = next(sql for sql in queries if 'FROM "contents_content"' in sql)
+        self.assertNotIn('"contents_content"."content"', contents_query, message)
+
+    def test_nested_fields_selection(self):
+        url = f"{self.BASE_URL}{self.course.id}/"
+        response, _ = self.get(url, fields="id,contents.name")
+        body = response.json()
+        self.assertSetEqual({"id", "contents"}, set(body.keys()))
+        self.assertSetEqual({"name"}, set(body["contents"][0].keys()))
+
+    def test_unknown_field_returns_400(self):
+        response = self.client.get(self.BASE_URL, {"fields": "name,secret"})
+        self.assertEqual(400, response.status_code)
+        self.assertDictEqual({"fields": ["Unknown field: secret."]}, response.json())
+
+    def test_pagination_still_works_with_fields(self):
+        baker.make("courses.Course", _quantity=2)
+        response = self.client.get(self.BASE_URL, {"fields": "name", "page_size": 2})
+        self.assertEqual(200, response.status_code)
+        self.assertIn('rel="next"', response["Link"])
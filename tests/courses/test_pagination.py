@@ -0,0 +1,119 @@
+import re
+from datetime import date
+from unittest.mock import patch
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+from _core.pagination import KeysetPagination
+
+
+def next_link(response):
+    match = re.match(r'<(?P<url>[^>]+)>; rel="next"', response.headers.get("Link", ""))
+    return match and match.group("url")
+
+
+class TestCoursePagination(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/courses/"
+        cls.superuser = baker.make("accounts.Account", is_superuser=True)
+        cls.superuser_token = str(
+            RefreshToken.for_user(cls.superuser).access_token,
+        )
+        cls.courses = baker.make(
+            "courses.Course", start_date=date(2023, 8, 28), _quantity=4
+        ) + baker.make("courses.Course", start_date=date(2023, 1, 2), _quantity=3)
+
+    def setUp(self) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+
+    def test_can_walk_all_pages_ordered_by_start_date_and_id(self):
+        url = self.BASE_URL + "?page_size=2"
+        result_ids = []
+        pages = 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(200, response.status_code)
+            self.assertLessEqual(len(response.json()), 2)
+            result_ids += [course["id"] for course in response.json()]
+            url = next_link(response)
+            pages += 1
+
+        expected_ids = [
+            str(course.id)
+            for course in sorted(self.courses, key=lambda c: (c.start_date, c.id))
+        ]
+        message = f"<{self.BASE_URL}> paginação não retornou todos os cursos na ordem esperada."
+        self.assertListEqual(expected_ids, result_ids, message)
+        self.assertEqual(4, pages)
+
+    def test_last_page_has_no_next_link(self):
+        response = self.client.get(self.BASE_URL)
+        self.assertEqual(len(self.courses), len(response.json()))
+        self.assertIsNone(next_link(response))
+
+    @patch.object(KeysetPagination, "page_size", 2)
+    def test_default_page_size_applies_without_page_size(self):
+        response = self.client.get(self.BASE_URL)
+        message = f"<{self.BASE_URL}> sem page_size a lista deve ser paginada."
+        self.assertEqual(2, len(response.json()), message)
+        self.assertIsNotNone(next_link(response), message)
+
+    def test_page_size_is_capped(self):
+        with patch.object(KeysetPagination, "max_page_size", 2):
+            response = self.client.get(self.BASE_URL + "?page_size=1000")
+        self.assertEqual(2, len(response.json()))
+        self.assertIsNotNone(next_link(response))
+
+    @patch.object(KeysetPagination, "page_size", 2)
+    def test_cursor_alone_uses_the_default_page_size(self):
+        first_page = self.client.get(self.BASE_URL + "?page_size=2")
+        cursor = re.search(r"cursor=([^&>]+)", next_link(first_page)).group(1)
+        response = self.client.get(self.BASE_URL, {"cursor": cursor})
+        self.assertEqual(2, len(response.json()))
+        self.assertIsNotNone(next_link(response))
+
+    def test_pages_do_not_use_count_or_offset(self):
+        first_page = self.client.get(self.BASE_URL + "?page_size=2")
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(next_link(first_page))
+        self.assertEqual(200, response.status_code)
+
+        statements = " ".join(query["sql"].upper() for query in context.captured_queries)
+        self.assertNotIn("COUNT(", statements)
+        self.assertNotIn("OFFSET", statements)
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get(self.BASE_URL + "?cursor=not-a-cursor")
+        self.assertEqual(404, response.status_code)
+
+
+class TestRosterPagination(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.superuser = baker.make("accounts.Account", is_superuser=True)
+        cls.superuser_token = str(
+            RefreshToken.for_user(cls.superuser).access_token,
+        )
+        cls.course = baker.make("courses.Course")
+        cls.students = baker.make("accounts.Account", _quantity=5)
+        cls.course.students.add(*cls.students)
+        cls.BASE_URL = f"/api/courses/{cls.course.id}/students/"
+
+    def test_can_walk_roster_pages(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+        url = self.BASE_URL + "?page_size=2"
+        result_emails = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(200, response.status_code)
+            body = response.json()
+            self.assertSetEqual({"id", "name", "students_courses"}, set(body.keys()))
+            result_emails += [item["student_email"] for item in body["students_courses"]]
+            url = next_link(response)
+
+        expected_emails = sorted(student.email for student in self.students)
+        message = f"<{self.BASE_URL}> paginação não retornou todos os alunos na ordem esperada."
+        self.assertListEqual(expected_emails, result_emails, message)
@@ -0,0 +1,117 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from model_bakery import baker
+from accounts.authentication import user_cache
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class TestCourseQueryCount(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/courses/"
+        cls.superuser = baker.make("accounts.Account", is_superuser=True)
+        cls.common_user = baker.make("accounts.Account", is_superuser=False)
+
+        cls.superuser_token = str(
+            RefreshToken.for_user(cls.superuser).access_token,
+        )
+        cls.common_user_token = str(
+            RefreshToken.for_user(cls.common_user).access_token,
+        )
+
+    def make_courses(self, quantity):
+        courses = baker.make("courses.Course", _quantity=quantity)
+        for course in courses:
+            baker.make("contents.Content", course=course, _quantity=2)
+            course.students.add(self.common_user, baker.make("accounts.Account"))
+        return courses
+
+    def count_queries(self, url):
+        user_cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(200, response.status_code)
+        return len(context.captured_queries)
+
+    def test_course_list_query_count_does_not_grow_with_courses(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+        self.make_courses(2)
+        expected = self.count_queries(self.BASE_URL)
+
+        self.make_courses(8)
+        result = self.count_queries(self.BASE_URL)
+        message = f"<{self.BASE_URL}> quantidade de queries cresce com o número de cursos."
+        self.assertEqual(expected, result, message)
+
+    def test_own_course_list_query_count_does_not_grow_with_courses(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.common_user_token)
+        self.make_courses(2)
+        expected = self.count_queries(self.BASE_URL)
+
+        self.make_courses(8)
+        result = self.count_queries(self.BASE_URL)
+        message = f"<{self.BASE_URL}> quantidade de queries cresce com o número de cursos."
+        self.assertEqual(expected, result, message)
+
+    def test_course_detail_query_count_does_not_grow_with_contents(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+        course = self.make_courses(1)[0]
+        url = f"{self.BASE_URL}{course.id}/"
+        expected = self.count_queries(url)
+
+        baker.make("contents.Content", course=course, _quantity=10)
+        course.students.add(*baker.make("accounts.Account", _quantity=10))
+        result = self.count_queries(url)
+        message = f"<{url}> quantidade de queries cresce com o número de conteúdos."
+        self.assertEqual(expected, result, message)
+
+
+class TestCourseUniqueName(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/courses/"
+        cls.superuser = baker.make("accounts.Account", is_superuser=True)
+        cls.superuser_token = str(
+            RefreshToken.for_user(cls.superuser).access_token,
+        )
+
+    def setUp(self) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+
+    def test_create_course_does_not_check_name_before_insert(self):
+        course_data = {
+            "name": "Python",
+            "start_date": "2023-08-28",
+            "end_date": "2023-10-28",
+        }
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(self.BASE_URL, course_data, format="json")
+        self.assertEqual(201, response.status_code)
+
+        name_lookups = [
+            query["sql"] for query in context.captured_queries
+            if '"courses_course"."name" =' in query["sql"]
+        ]
+        message = f"<{self.BASE_URL}> criação de curso não deveria consultar o nome antes do insert."
+        self.assertListEqual([], name_lookups, message)
+
+    def test_body_that_is_not_an_object_is_a_400(self):
+        for body in ('"Python"', '["Python"]'):
+            with self.subTest(body=body):
+                response = self.client.post(
+                    self.BASE_URL, body, content_type="application/json"
+                )
+                message = f"<{self.BASE_URL}> corpo {body} deveria retornar 400."
+                self.assertEqual(400, response.status_code, message)
+
+    def test_can_not_rename_course_to_existing_name(self):
+        baker.make("courses.Course", name="Python")
+        course = baker.make("courses.Course", name="React")
+        url = f"{self.BASE_URL}{course.id}/"
+        response = self.client.patch(url, {"name": "Python"}, format="json")
+        self.assertEqual(400, response.status_code)
+
+        expected = {"name": ["course with this name already exists."]}
+        message = f"<{url}> corpo de retorno da rota está diferente de {expected}."
+        self.assertDictEqual(expected, response.json(), message)
@@ -0,0 +1,66 @@
+import datetime
+import decimal
+import uuid
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+from _core.renderers import FastJSONRenderer
+from courses.models import Course
+from courses.serializers import CourseSerializer
+
+
+class TestFastJSONRenderer(TestCase):
+    def assertSameBytes(self, data, accepted_media_type=None, renderer_context=None):
+        expected = JSONRenderer().render(data, accepted_media_type, renderer_context)
+        rendered = FastJSONRenderer().render(data, accepted_media_type, renderer_context)
+        message = "\nFastJSONRenderer gerou bytes diferentes do JSONRenderer."
+        self.assertEqual(expected, rendered, message)
+
+    def test_native_types_match_json_renderer(self):
+        self.assertSameBytes({
+            "id": uuid.uuid4(),
+            "date": datetime.date(2023, 11, 2),
+            "utc": datetime.datetime(2023, 11, 2, 0, 52, tzinfo=datetime.timezone.utc),
+            "offset": datetime.datetime(
+                2023, 11, 2, 0, 52, 0, 1234,
+                tzinfo=datetime.timezone(datetime.timedelta(hours=-3)),
+            ),
+            "naive": datetime.datetime(2023, 11, 2, 0, 52, 30),
+            "time": datetime.time(10, 30, 0, 500),
+            "decimal": decimal.Decimal("10.50"),
+            "duration": datetime.timedelta(minutes=90),
+            "float": 0.1,
+            "nested": [None, True, False, 1, -1, {"a": []}],
+        })
+
+    def test_text_escaping_matches_json_renderer(self):
+        self.assertSameBytes(["a\x00\x1f\b\f\n\r\t\"\\ é \u2028 \u2029 😀 </script>"])
+
+    def test_falls_back_to_json_renderer(self):
+        self.assertSameBytes({"big": 2 ** 70, "keys": {1: "a"}})
+        self.assertSameBytes({"a": [1]}, "application/json; indent=4")
+        self.assertSameBytes({"a": [1]}, None, {"indent": 2})
+        self.assertEqual(b"", FastJSONRenderer().render(None))
+
+
+class TestCourseListRendering(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.superuser = baker.make("accounts.Account", is_superuser=True)
+        cls.superuser_token = str(
+            RefreshToken.for_user(cls.superuser).access_token,
+        )
+        for course in baker.make("courses.Course", _quantity=5):
+            baker.make("contents.Content", course=course, name="Aula ç", _quantity=2)
+            course.students.add(*baker.make("accounts.Account", _quantity=2))
+
+    def test_course_list_is_byte_for_byte_identical(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+        response = self.client.get("/api/courses/")
+        self.assertEqual(200, response.status_code)
+
+        courses = Course.objects.with_contents_and_students().order_by("start_date", "id")
+        data = CourseSerializer(courses, many=True).data
+        self.assertEqual(JSONRenderer().render(data), response.content)
@@ -0,0 +1,78 @@
+from django.db import IntegrityError, connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+from model_bakery import baker
+from courses.models import Course
+from students_courses.models import StudentCourse
+
+# SQLite backs the inline UNIQUE constraint with an automatic index
+UNIQUE_INDEX = {
+    "sqlite": "sqlite_autoindex_students_courses_studentcourse",
+    "postgresql": "unique_student_course",
+}
+
+
+class TestStudentCourseIndexes(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.student = baker.make("accounts.Account")
+        cls.course = baker.make("courses.Course")
+        cls.course.students.add(cls.student)
+
+    def explain(self, queryset) -> str:
+        if connection.vendor == "postgresql":
+            # with a handful of rows a sequential scan is always cheaper
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        return queryset.explain()
+
+    def assertUsesIndex(self, queryset, index):
+        plan = self.explain(queryset)
+        message = f"\nplano de execução não usa o índice {index}:\n{plan}"
+        self.assertIn(index, plan, message)
+
+    def test_can_not_enroll_a_student_twice(self):
+        with self.assertRaises(IntegrityError):
+            StudentCourse.objects.create(student=self.student, course=self.course)
+
+    def test_membership_check_uses_the_unique_index(self):
+        self.assertUsesIndex(
+            StudentCourse.objects.filter(student_id=self.student.pk, course_id=self.course.pk),
+            UNIQUE_INDEX[connection.vendor],
+        )
+
+    def test_my_courses_lookup_uses_the_unique_index(self):
+        self.assertUsesIndex(
+            Course.objects.visible_to(self.student), UNIQUE_INDEX[connection.vendor]
+        )
+
+    def test_roster_by_status_uses_the_course_status_index(self):
+        self.assertUsesIndex(
+            StudentCourse.objects.filter(course_id=self.course.pk, status="accepted"),
+            "enrollment_course_status_idx",
+        )
+
+
+class TestRemoveDuplicateEnrollments(TransactionTestCase):
+    migrate_from = [("students_courses", "0003_alter_studentcourse_status")]
+    migrate_to = [("students_courses", "0004_enrollment_constraints")]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def test_keeps_one_enrollment_per_student_and_course(self):
+        student = baker.make("accounts.Account")
+        course = baker.make("courses.Course")
+        apps = self.migrate(self.migrate_from)
+        HistoricalStudentCourse = apps.get_model("students_courses", "StudentCourse")
+        enrollment = {"student_id": student.pk, "course_id": course.pk}
+        HistoricalStudentCourse.objects.create(**enrollment)
+        accepted = HistoricalStudentCourse.objects.create(**enrollment, status="accepted")
+        HistoricalStudentCourse.objects.create(**enrollment)
+
+        self.migrate(self.migrate_to)
+        enrollments = StudentCourse.objects.filter(student_id=student.pk, course_id=course.pk)
+        self.assertEqual([accepted.pk], [enrollment.pk for enrollment in enrollments])
@@ -0,0 +1,81 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from model_bakery import baker
+from rest_framework_simplejwt.tokens import RefreshToken
+from students_courses.models import StudentCourse
+
+
+class TestBulkEnrollmentView(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.BASE_URL = "/api/courses/{}/students/"
+        cls.superuser = baker.make("accounts.Account", is_superuser=True)
+        cls.superuser_token = str(
+            RefreshToken.for_user(cls.superuser).access_token,
+        )
+
+    def setUp(self) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.superuser_token)
+
+    def enroll(self, course, students):
+        course_data = {
+            "students_courses": [{"student_email": student.email} for student in students]
+        }
+        return self.client.put(self.BASE_URL.format(course.id), course_data, format="json")
+
+    def test_enrollment_query_count_does_not_grow_with_roster(self):
+        course = baker.make("courses.Course")
+        students = baker.make("accounts.Account", _quantity=2)
+        with CaptureQueriesContext(connection) as context:
+            response = self.enroll(course, students)
+        self.assertEqual(200, response.status_code)
+        expected = len(context.captured_queries)
+
+        other_course = baker.make("courses.Course")
+        students = baker.make("accounts.Account", _quantity=20)
+        with CaptureQueriesContext(connection) as context:
+            response = self.enroll(other_course, students)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(20, len(response.json()["students_courses"]))
+
+        url = self.BASE_URL.format(other_course.id)
+        message = f"<{url}> quantidade de queries cresce com o número de alunos."
+        self.assertEqual(expected, len(context.captured_queries), message)
+
+    def test_can_enroll_already_enrolled_students_without_duplicates(self):
+        course = baker.make("courses.Course")
+        students = baker.make("accounts.Account", _quantity=3)
+        course.students.add(students[0])
+
+        response = self.enroll(course, students + [students[1]])
+        self.assertEqual(200, response.status_code)
+
+        url = self.BASE_URL.format(course.id)
+        message = f"<{url}> matrícula duplicada foi criada no banco de dados."
+        self.assertEqual(3, StudentCourse.objects.filter(course=course).count(), message)
+        self.assertEqual(3, len(response.json()["students_courses"]), message)
+
+    def test_can_not_enroll_and_reports_every_missing_email(self):
+        course = baker.make("courses.Course")
+        student = baker.make("accounts.Account")
+        course_data = {
+            "students_courses": [
+                {"student_email": "primeiro@quenaoexiste.com.br"},
+                {"student_email": student.email},
+                {"student_email": "segundo@quenaoexiste.com.br"},
+            ]
+        }
+        url = self.BASE_URL.format(course.id)
+        response = self.client.put(url, course_data, format="json")
+        self.assertEqual(400, response.status_code)
+
+        expected_body = {
+            "detail": (
+                "No active accounts was found: "
+                "primeiro@quenaoexiste.com.br, segundo@quenaoexiste.com.br."
+            )
+        }
+        message = f"<{url}> corpo de resposta deve ser semelhante a {expected_body}."
+        self.assertDictEqual(expected_body, response.json(), message)
+        self.assertFalse(StudentCourse.objects.filter(course=course).exists())